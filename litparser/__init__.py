@@ -41,7 +41,42 @@ from .core.struct_tree import (
     StructTreeParser, StructElement, StructTable, StructType,
     extract_tables_from_struct_tree, is_tagged_pdf
 )
+import io
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# 3.10+에서는 __dict__ 없는 인스턴스로 레코드당 메모리 절감 및 속성
+# 접근 가속 (3.8 호환 유지 - xlsx/hwpx 파서와 같은 패턴)
+if sys.version_info >= (3, 10):
+    _record = dataclass(slots=True)
+else:
+    _record = dataclass
+
+# orjson이 있으면 to_json에서 네이티브 인코더 사용 (대형 페이지 배열에서
+# 3~10배 빠름) - 없으면 표준 json으로 동작 (추가 의존성 없음)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 이미지 base64 인코딩: pybase64가 있으면 SIMD 커널 사용 (수 MB PNG
+# 데이터 URI 기준 메모리 대역폭 수준 속도) - 없으면 표준 base64
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+# base64 → str: pybase64의 b64encode_as_string은 중간 bytes 버퍼 없이
+# 바로 str을 만들어 인코딩 결과를 한 번만 할당함 (인코딩된 이미지
+# 크기만큼의 임시 버퍼 한 개 절약). 없으면 b64encode + ASCII 디코드.
+# 입력은 버퍼 프로토콜이면 되므로 memoryview 데이터도 복사 없이 들어감
+try:
+    from pybase64 import b64encode_as_string as _b64str
+except ImportError:
+    def _b64str(data) -> str:
+        return _b64encode(data).decode('ascii')
 
 __version__ = '0.7.0'
 __all__ = [
@@ -67,26 +102,131 @@ __all__ = [
 # 통합 ParseResult 클래스
 # =============================================================================
 
-@dataclass
+# ImageStore가 열로 관리하는 키 (이 외의 키는 _extras로 보존)
+_IMAGE_KEYS = frozenset((
+    'page', 'filename', 'width', 'height', 'format', 'base64', 'mime', '_raw',
+))
+
+
+class ImageStore:
+    """parse()가 모은 이미지 레코드의 병렬 리스트(SoA) 저장소
+
+    이미지 한 장당 5~7키 dict(레코드당 ~200B+ 오버헤드)를 만들어 두는
+    대신 필드별 리스트에 값만 담고 조회할 때 dict를 조립함 - 이미지가
+    수백 장인 문서에서 상주 메모리가 크게 줄어듦. len/iter/인덱싱/
+    append/extend를 지원하므로 기존 코드는 리스트처럼 소비하면 됨.
+
+    주의: __getitem__/__iter__가 돌려주는 dict는 조회 시점에 조립된
+    사본이라 그 dict를 고쳐도 저장소에는 반영되지 않음
+    """
+
+    __slots__ = ('_pages', '_filenames', '_widths', '_heights',
+                 '_formats', '_base64s', '_mimes', '_raws', '_extras')
+
+    def __init__(self):
+        self._pages = []
+        self._filenames = []
+        self._widths = []
+        self._heights = []
+        self._formats = []
+        self._base64s = []
+        self._mimes = []
+        self._raws = []
+        self._extras = []
+
+    def __len__(self):
+        return len(self._formats)
+
+    def append(self, img: dict) -> None:
+        """이미지 dict를 열 단위로 분해해 저장"""
+        self._pages.append(img.get('page'))
+        self._filenames.append(img.get('filename'))
+        self._widths.append(img.get('width'))
+        self._heights.append(img.get('height'))
+        self._formats.append(img.get('format'))
+        self._base64s.append(img.get('base64'))
+        self._mimes.append(img.get('mime'))
+        self._raws.append(img.get('_raw'))
+        extra = {k: v for k, v in img.items() if k not in _IMAGE_KEYS}
+        self._extras.append(extra or None)
+
+    def extend(self, imgs) -> None:
+        for img in imgs:
+            self.append(img)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        out = {}
+        # 키 순서는 parse()가 dict를 만들던 순서와 맞춤
+        if self._pages[idx] is not None:
+            out['page'] = self._pages[idx]
+        if self._filenames[idx] is not None:
+            out['filename'] = self._filenames[idx]
+        if self._widths[idx] is not None:
+            out['width'] = self._widths[idx]
+            out['height'] = self._heights[idx]
+        if self._formats[idx] is not None:
+            out['format'] = self._formats[idx]
+        if self._base64s[idx] is not None:
+            out['base64'] = self._base64s[idx]
+        if self._mimes[idx] is not None:
+            out['mime'] = self._mimes[idx]
+        if self._extras[idx] is not None:
+            out.update(self._extras[idx])
+        if self._raws[idx] is not None:
+            out['_raw'] = self._raws[idx]
+        return out
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f'ImageStore({len(self)} images)'
+
+
+@_record
 class ParseResult:
-    """통합 파싱 결과"""
+    """통합 파싱 결과
+
+    text는 property - 페이지별 문서(PDF/PPTX)는 전체 텍스트를 미리
+    이어 붙이지 않고 처음 읽을 때 pages의 텍스트에서 조합해 캐싱함
+    (페이지 dict와 조합 문자열로 본문을 이중으로 들고 있지 않음)
+    """
     # 메타데이터
     filename: str = ""
     format: str = ""  # pdf, docx, pptx, hwpx, txt, md
     page_count: int = 0
     title: str = ""
     author: str = ""
-    
+
     # 콘텐츠
-    text: str = ""
+    _text: str = field(default="", repr=False)
     pages: list = field(default_factory=list)
     tables: list = field(default_factory=list)
-    images: list = field(default_factory=list)
+    images: 'ImageStore' = field(default_factory=ImageStore)
     headings: list = field(default_factory=list)
-    
+
     # 원본 문서 객체 (고급 사용)
     _doc: object = field(default=None, repr=False)
 
+    @property
+    def text(self) -> str:
+        """전체 텍스트 (페이지별 문서는 첫 접근 시 지연 조합)
+
+        streaming 파싱에서는 pages가 일회성 제너레이터이므로 여기서
+        소비하지 않고 빈 문자열을 돌려줌 (pages를 직접 순회할 것)
+        """
+        if self._text or not isinstance(self.pages, list) or not self.pages:
+            return self._text
+        self._text = "\n\n".join(p.get('text', '') for p in self.pages)
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+
 
 # =============================================================================
 # 통합 parse() 함수
@@ -96,6 +236,7 @@ def parse(
     filepath_or_bytes: Union[str, bytes],
     filename: str = None,
     include_images: bool = False,
+    streaming: bool = False,
 ) -> ParseResult:
     """
     문서 파싱 (자동 포맷 감지)
@@ -103,7 +244,14 @@ def parse(
     Args:
         filepath_or_bytes: 파일 경로 또는 바이트 데이터
         filename: 바이트 입력 시 파일명 (포맷 감지용)
-        include_images: 이미지 데이터 포함 여부
+        include_images: 이미지 데이터 포함 여부. 원본 바이트는 각
+            이미지 dict의 '_raw' 키에 담기고, base64 인코딩은
+            to_json/to_markdown 등 실제 출력 시점에 수행됨
+        streaming: True면 (PDF 한정) pages를 소비 시점에 페이지를
+            생성하는 일회성 제너레이터로 만듦 - 피크 메모리가 페이지
+            하나 분량으로 고정됨. 이 모드에서는 text/tables/images
+            최상위 집계가 비어 있고, to_json/to_markdown이 pages를
+            한 번 순회하며 스트리밍 소비함. 다른 포맷에서는 무시
     
     Returns:
         ParseResult: 파싱 결과
@@ -120,8 +268,6 @@ def parse(
     Supported formats:
         .pdf, .docx, .pptx, .hwpx, .txt, .md
     """
-    import base64
-    
     # 확장자 감지
     if isinstance(filepath_or_bytes, str):
         ext = Path(filepath_or_bytes).suffix.lower()
@@ -138,52 +284,38 @@ def parse(
         result._doc = doc
         result.page_count = get_page_count(doc)
         
-        all_text = []
-        for page_num in range(result.page_count):
-            page_text = extract_text(doc, page_num)
-            all_text.append(page_text)
-            
-            page_data = {
-                'page': page_num + 1,
-                'text': page_text,
-                'tables': [],
-                'images': [],
-            }
-            
-            # 테이블
-            tables = extract_tables(doc, page_num)
-            for t in tables:
-                table_data = {
-                    'page': page_num + 1,
-                    'rows': t.rows,
-                    'cols': t.cols,
-                    'data': t.to_list(),
-                    'markdown': t.to_markdown(),
-                }
-                page_data['tables'].append(table_data)
-                result.tables.append(table_data)
-            
-            # 이미지 (페이지별)
-            if include_images:
-                try:
-                    page_images = extract_images(doc, page_num)
-                    for img in page_images:
-                        img_data = {
-                            'page': page_num + 1,
-                            'width': img.width,
-                            'height': img.height,
-                            'format': img.color_space,
-                        }
-                        if img.data:
-                            img_data['base64'] = base64.b64encode(img.data).decode('ascii')
-                        page_data['images'].append(img_data)
-                        result.images.append(img_data)
-                except:
-                    pass
-            
+        # 페이지별 추출은 서로 독립 - content stream inflate(zlib)가
+        # GIL을 풀어주는 구간을 스레드로 겹침 (pptx/xlsx 파서와 같은
+        # 패턴, 순서는 map이 보존). 페이지가 적으면 풀 기동 비용이
+        # 더 크므로 순차 처리. LITPARSER_SEQUENTIAL=1로 강제 순차 가능
+        def _do_page(page_num):
+            return _parse_pdf_page(doc, page_num, include_images)
+
+        if streaming:
+            # 소비 시점에 페이지 생성 - 집계(text/tables/images) 없이
+            # pages 제너레이터만 노출 (O(1) 피크 메모리)
+            result.pages = (_do_page(n) for n in range(result.page_count))
+            try:
+                outline = get_document_outline(doc)
+                result.headings = [{'level': lv, 'text': txt}
+                                   for lv, txt in outline]
+            except:
+                pass
+            return result
+
+        if (result.page_count >= 4
+                and not os.environ.get('LITPARSER_SEQUENTIAL')):
+            workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                pages = list(pool.map(_do_page, range(result.page_count)))
+        else:
+            pages = [_do_page(n) for n in range(result.page_count)]
+
+        for page_data in pages:
+            result.tables.extend(page_data['tables'])
+            result.images.extend(page_data['images'])
             result.pages.append(page_data)
-        
-        result.text = "\n\n".join(all_text)
+        # result.text는 pages의 텍스트에서 지연 조합 (property)
         
         # 개요
         try:
@@ -218,7 +350,7 @@ def parse(
                     'format': img.content_type,
                 }
                 if img.data:
-                    img_data['base64'] = base64.b64encode(img.data).decode('ascii')
+                    img_data['_raw'] = img.data
                 result.images.append(img_data)
     
     # PPTX
@@ -230,7 +362,6 @@ def parse(
         result.author = doc.author
         result.page_count = doc.slide_count
         
-        all_text = []
         for slide in doc.slides:
             page_data = {
                 'page': slide.number,
@@ -238,7 +369,6 @@ def parse(
                 'text': slide.get_text(),
                 'tables': [],
             }
-            all_text.append(slide.get_text())
             
             for t in slide.tables:
                 table_data = {
@@ -254,9 +384,8 @@ def parse(
             
             if slide.title:
                 result.headings.append({'level': 1, 'text': slide.title})
-        
-        result.text = "\n\n".join(all_text)
-        
+        # result.text는 pages의 텍스트에서 지연 조합 (property)
+
         if include_images:
             for img in doc.images:
                 img_data = {
@@ -264,7 +393,7 @@ def parse(
                     'format': img.content_type,
                 }
                 if img.data:
-                    img_data['base64'] = base64.b64encode(img.data).decode('ascii')
+                    img_data['_raw'] = img.data
                 result.images.append(img_data)
     
     # HWPX
@@ -293,7 +422,7 @@ def parse(
                     'format': img.content_type,
                 }
                 if img.data:
-                    img_data['base64'] = base64.b64encode(img.data).decode('ascii')
+                    img_data['_raw'] = img.data
                 result.images.append(img_data)
     
     # HWP (바이너리)
@@ -411,7 +540,7 @@ def parse(
                     'format': img.content_type,
                 }
                 if img.data:
-                    img_data['base64'] = base64.b64encode(img.data).decode('ascii')
+                    img_data['_raw'] = img.data
                 result.images.append(img_data)
     
     # XLS (Excel 97-2003)
@@ -467,10 +596,53 @@ def parse(
     
     else:
         raise ValueError(f"지원하지 않는 포맷: {ext}")
-    
+
     return result
 
 
+def _parse_pdf_page(doc: PDFDocument, page_num: int, include_images: bool) -> dict:
+    """PDF 한 페이지를 parse() 출력용 dict로 조립
+
+    페이지 번호만 받는 독립 함수라 순차 루프 외에 병렬/지연 생성에도
+    그대로 쓸 수 있음. 반환 dict의 tables/images 항목은 호출자가
+    최상위 result.tables/result.images에 같은 객체로 이어 붙임
+    """
+    page_data = {
+        'page': page_num + 1,
+        'text': extract_text(doc, page_num),
+        'tables': [],
+        'images': [],
+    }
+
+    # 테이블
+    for t in extract_tables(doc, page_num):
+        page_data['tables'].append({
+            'page': page_num + 1,
+            'rows': t.rows,
+            'cols': t.cols,
+            'data': t.to_list(),
+            'markdown': t.to_markdown(),
+        })
+
+    # 이미지 (페이지별)
+    if include_images:
+        try:
+            for img in extract_images(doc, page_num):
+                img_data = {
+                    'page': page_num + 1,
+                    'width': img.width,
+                    'height': img.height,
+                    'format': img.color_space,
+                }
+                if img.data:
+                    img_data['_raw'] = img.data
+                page_data['images'].append(img_data)
+        except:
+            pass
+
+    return page_data
+
+
 def _detect_format(data: bytes) -> str:
     """바이트 데이터에서 포맷 감지"""
     # PDF
@@ -525,6 +697,43 @@ def _detect_format(data: bytes) -> str:
 # 출력 변환 함수
 # =============================================================================
 
+# 목차 들여쓰기 사전 계산 (hwpx_parser의 _HEADING_PREFIX와 같은 패턴) -
+# 헤딩마다 "  " * (level-1) 문자열을 새로 만들지 않음
+_INDENTS = tuple("  " * i for i in range(64))
+
+# 데이터 URI MIME 판별: 첫 2바이트 → MIME 디스패치 테이블
+_MIME_BY_PREFIX2 = {b'\xff\xd8': 'image/jpeg', b'\x89P': 'image/png'}
+_PNG_SIG = b'\x89PNG\r\n\x1a\n'
+_JP2_SIG = b'\x00\x00\x00\x0cjP  \r\n\x87\n'
+
+
+def _guess_mime(img: dict) -> str:
+    """이미지 dict의 데이터 URI용 MIME 추정
+
+    docx/pptx 계열은 'format'에 content_type을 이미 들고 있으므로 그대로
+    사용. PDF 이미지는 원본 바이트의 매직 넘버로 판별 - DCTDecode
+    패스스루(JPEG)나 JPXDecode(JP2)도 올바른 MIME이 나옴. 프리픽스
+    12바이트만 복사하므로 데이터 크기와 무관한 비용
+    """
+    fmt = img.get('format', '')
+    if isinstance(fmt, str) and fmt.startswith('image/'):
+        return fmt
+
+    raw = img.get('_raw')
+    if not raw:
+        return 'image/png'
+
+    head = bytes(raw[:12])  # memoryview여도 12바이트만 복사
+    mime = _MIME_BY_PREFIX2.get(head[:2])
+    if mime is not None:
+        # PNG는 8바이트 시그니처 전체 확인 (0x89 'P'로 시작하는 다른 포맷 방지)
+        if mime != 'image/png' or head[:8] == _PNG_SIG:
+            return mime
+    if head == _JP2_SIG:
+        return 'image/jp2'
+    return 'image/png'
+
+
 def to_markdown(result: ParseResult, include_images: bool = False) -> str:
     """
     ParseResult를 마크다운으로 변환
@@ -536,89 +745,189 @@ def to_markdown(result: ParseResult, include_images: bool = False) -> str:
     Returns:
         str: 마크다운 문자열
     """
-    lines = []
-    
+    # 리스트에 짧은 조각을 수백 개 append 후 join하는 대신 StringIO에
+    # 논리 블록 단위로 기록 - 조각 PyObject 생성과 리스트 재할당이 없음.
+    # 모든 write는 '\n'으로 끝나고, 마지막에 한 글자만 잘라내면
+    # 기존 "\n".join(lines)와 바이트 단위로 동일한 결과가 됨
+    buf = io.StringIO()
+    write = buf.write
+
     # 제목
     title = result.title or Path(result.filename).stem if result.filename else "Document"
-    lines.append(f"# {title}")
-    lines.append("")
-    
+    write(f"# {title}\n\n")
+
     # 메타데이터
     if result.author or result.page_count > 1:
-        lines.append("> **문서 정보**")
+        write("> **문서 정보**\n")
         if result.author:
-            lines.append(f"> - 작성자: {result.author}")
+            write(f"> - 작성자: {result.author}\n")
         if result.format:
-            lines.append(f"> - 포맷: {result.format.upper()}")
+            write(f"> - 포맷: {result.format.upper()}\n")
         if result.page_count > 1:
-            lines.append(f"> - 페이지: {result.page_count}")
-        lines.append("")
-    
+            write(f"> - 페이지: {result.page_count}\n")
+        write("\n")
+
     # 목차
     if result.headings:
-        lines.append("## 목차")
-        lines.append("")
+        write("## 목차\n\n")
         for h in result.headings:
-            indent = "  " * (h['level'] - 1)
-            lines.append(f"{indent}- {h['text']}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-    
-    # 페이지별 내용
+            level = h['level']
+            indent = (_INDENTS[level - 1] if 0 < level <= 64
+                      else "  " * (level - 1))
+            write(f"{indent}- {h['text']}\n")
+        write("\n---\n\n")
+
+    # 페이지별 내용 - page_count는 루프 내내 불변이므로 페이지 헤더
+    # 유무를 여기서 한 번만 결정 (페이지마다 분기하지 않음)
     if result.pages:
-        for page in result.pages:
-            if result.page_count > 1:
-                lines.append(f"## 페이지 {page['page']}")
-                lines.append("")
-            
-            if page.get('text'):
-                lines.append(page['text'])
-                lines.append("")
-            
-            for i, table in enumerate(page.get('tables', []), 1):
-                lines.append(f"### 테이블 {i}")
-                lines.append("")
-                lines.append(table['markdown'])
-                lines.append("")
+        if result.page_count > 1:
+            _write_md_pages_paged(write, result.pages)
+        else:
+            _write_md_pages_single(write, result.pages)
     elif result.text:
-        lines.append(result.text)
-        lines.append("")
-        
+        write(result.text)
+        write("\n\n")
+
         for i, table in enumerate(result.tables, 1):
-            lines.append(f"### 테이블 {i}")
-            lines.append("")
-            lines.append(table['markdown'])
-            lines.append("")
-    
+            write(f"### 테이블 {i}\n\n")
+            write(table['markdown'])
+            write("\n\n")
+
     # 이미지
     if include_images and result.images:
-        lines.append("## 이미지")
-        lines.append("")
+        write("## 이미지\n\n")
         for i, img in enumerate(result.images, 1):
-            if img.get('base64'):
-                mime = img.get('mime', 'image/png')
-                lines.append(f"![이미지 {i}](data:{mime};base64,{img['base64']})")
-                lines.append("")
-    
-    return "\n".join(lines)
-
-
-def to_json(result: ParseResult, include_images: bool = False, indent: int = 2) -> str:
+            b64 = img.get('base64')
+            if b64 is None and img.get('_raw') is not None:
+                # parse()가 인코딩을 미뤄둔 경우 여기서 인코딩
+                b64 = _b64str(img['_raw'])
+            if b64:
+                mime = img.get('mime') or _guess_mime(img)
+                # b64는 수 MB가 될 수 있음 - f-string에 끼워 넣어 통째로
+                # 복사하지 말고 짧은 고정부와 분리해 그대로 기록
+                write(f"![이미지 {i}](data:{mime};base64,")
+                write(b64)
+                write(")\n\n")
+
+    # 마지막 줄바꿈 제거 ("\n".join과 동일한 끝맺음)
+    return buf.getvalue()[:-1]
+
+
+def _write_md_page_body(write, page: dict) -> None:
+    """페이지 하나의 본문/테이블을 마크다운으로 기록"""
+    text = page.get('text')
+    if text:
+        write(text)
+        write("\n\n")
+
+    for i, table in enumerate(page.get('tables', ()), 1):
+        write(f"### 테이블 {i}\n\n")
+        write(table['markdown'])
+        write("\n\n")
+
+
+def _write_md_pages_paged(write, pages) -> None:
+    """다중 페이지 문서: 페이지 헤더를 붙여 기록 (page_count > 1)"""
+    for page in pages:
+        write(f"## 페이지 {page['page']}\n\n")
+        _write_md_page_body(write, page)
+
+
+def _write_md_pages_single(write, pages) -> None:
+    """단일 페이지 문서: 헤더 없이 기록"""
+    for page in pages:
+        _write_md_page_body(write, page)
+
+
+def to_json(result: ParseResult, include_images: bool = False, indent: int = 2,
+            fp=None) -> Optional[str]:
     """
     ParseResult를 JSON으로 변환
-    
+
     Args:
         result: parse() 결과
         include_images: 이미지 base64 포함
-        indent: JSON 들여쓰기
-    
+        indent: JSON 들여쓰기 (fp 모드에서는 무시)
+        fp: 쓰기 가능한 텍스트 파일 객체. 주어지면 전체 JSON 문자열을
+            메모리에 만들지 않고 페이지 단위로 직렬화해 fp에 바로 씀
+
     Returns:
-        str: JSON 문자열
+        str: JSON 문자열 (fp가 주어지면 None)
+
+    Note:
+        fp 스트리밍 모드는 compact 출력이며, pages 내용과 중복되는
+        최상위 tables 배열 대신 {page, index} 목록인 tables_index를
+        기록함 (테이블 본문은 pages[*].tables에서 참조). pages가 없는
+        포맷(docx 등)은 tables를 그대로 기록함
     """
     import json
-    
-    data = {
+
+    if fp is not None:
+        _write_json_stream(result, fp, include_images)
+        return None
+
+    # streaming parse()의 pages는 일회성 제너레이터 - 전체 dict를
+    # 만들지 않고 스트리밍 직렬화 경로로 우회 (compact 출력)
+    if not isinstance(result.pages, list):
+        buf = io.StringIO()
+        _write_json_stream(result, buf, include_images)
+        return buf.getvalue()
+
+    # orjson은 들여쓰기가 2로 고정 - 기본값일 때만 사용
+    if _orjson is not None and indent == 2:
+        return _orjson.dumps(_build_data(result, include_images),
+                             option=_orjson.OPT_INDENT_2).decode('utf-8')
+
+    return json.dumps(_build_data(result, include_images),
+                      ensure_ascii=False, indent=indent)
+
+
+def _image_payload(img: dict) -> dict:
+    """이미지 dict를 직렬화 가능한 형태로 변환
+
+    parse()는 base64 인코딩을 하지 않고 원본 바이트를 '_raw' 키에
+    들고만 있음 - 실제로 이미지를 출력할 때 여기서 한 번만 인코딩.
+    path 모드처럼 base64가 필요 없는 소비자는 인코딩 비용(+4/3배
+    메모리)을 아예 내지 않음
+    """
+    raw = img.get('_raw')
+    if raw is None:
+        return img
+    out = {k: v for k, v in img.items() if k != '_raw'}
+    out['base64'] = _b64str(raw)
+    return out
+
+
+def _image_meta(img: dict) -> dict:
+    """데이터 없이 메타데이터만 남긴 이미지 dict"""
+    return {k: v for k, v in img.items() if k != 'base64' and k != '_raw'}
+
+
+def _serializable_pages(pages: list, include_images: bool) -> list:
+    """페이지 목록에서 '_raw' 이미지 바이트를 직렬화 가능하게 치환
+
+    이미지가 없는 페이지는 그대로 참조 (대부분의 문서에서 복사 없음)
+    """
+    out = []
+    dirty = False
+    for page in pages:
+        imgs = page.get('images')
+        if imgs:
+            convert = _image_payload if include_images else _image_meta
+            page = {**page, 'images': [convert(i) for i in imgs]}
+            dirty = True
+        out.append(page)
+    return out if dirty else pages
+
+
+def _build_data(result: ParseResult, include_images: bool = False) -> dict:
+    """ParseResult → JSON 직렬화 가능한 dict (to_json/to_dict 공용)"""
+    convert = _image_payload if include_images else _image_meta
+    pages = result.pages
+    if not isinstance(pages, list):
+        # streaming parse()의 제너레이터 - dict로 만들려면 실체화 필요
+        pages = list(pages)
+    return {
         'metadata': {
             'filename': result.filename,
             'format': result.format,
@@ -630,21 +939,86 @@ def to_json(result: ParseResult, include_images: bool = False, indent: int = 2)
             'text': result.text,
             'headings': result.headings,
         },
-        'pages': result.pages,
+        'pages': _serializable_pages(pages, include_images),
         'tables': result.tables,
-        'images': result.images if include_images else [
-            {k: v for k, v in img.items() if k != 'base64'}
-            for img in result.images
-        ],
+        'images': [convert(img) for img in result.images],
     }
-    
-    return json.dumps(data, ensure_ascii=False, indent=indent)
 
 
-def to_dict(result: ParseResult, include_images: bool = False) -> dict:
-    """ParseResult를 딕셔너리로 변환"""
+def _write_json_stream(result: ParseResult, fp, include_images: bool = False) -> None:
+    """페이지 단위 스트리밍 JSON 직렬화
+
+    전체 data 딕셔너리(500페이지 PDF면 수백 MB)를 만들어 한 번에
+    덤프하는 대신 페이지마다 json.dump를 호출해 fp에 이어 씀 -
+    피크 메모리가 페이지 하나 분량으로 고정되고 gzip/네트워크로
+    바로 파이프할 수 있음
+    """
     import json
-    return json.loads(to_json(result, include_images))
+
+    fp.write('{"metadata":')
+    json.dump({
+        'filename': result.filename,
+        'format': result.format,
+        'page_count': result.page_count,
+        'title': result.title,
+        'author': result.author,
+    }, fp, ensure_ascii=False)
+
+    fp.write(',"content":')
+    json.dump({
+        'text': result.text,
+        'headings': result.headings,
+    }, fp, ensure_ascii=False)
+
+    fp.write(',"pages":[')
+    tables_index = []
+    first = True
+    for page in result.pages:
+        if first:
+            first = False
+        else:
+            fp.write(',')
+        imgs = page.get('images')
+        if imgs:
+            convert = _image_payload if include_images else _image_meta
+            page = {**page, 'images': [convert(i) for i in imgs]}
+        json.dump(page, fp, ensure_ascii=False)
+        pg = page.get('page', 1)
+        for idx in range(len(page.get('tables', ()))):
+            tables_index.append({'page': pg, 'index': idx})
+    fp.write(']')
+
+    # pages가 있으면 테이블 본문은 이미 pages[*].tables에 들어 있음 -
+    # 최상위에는 위치 인덱스만 기록해 중복 직렬화를 제거.
+    # pages가 없는 포맷(docx/hwpx/doc)은 tables를 그대로 기록
+    if result.pages:
+        fp.write(',"tables_index":')
+        json.dump(tables_index, fp, ensure_ascii=False)
+    else:
+        fp.write(',"tables":')
+        json.dump(result.tables, fp, ensure_ascii=False)
+
+    fp.write(',"images":[')
+    convert = _image_payload if include_images else _image_meta
+    first = True
+    for img in result.images:
+        if first:
+            first = False
+        else:
+            fp.write(',')
+        json.dump(convert(img), fp, ensure_ascii=False)
+    fp.write(']}')
+
+
+def to_dict(result: ParseResult, include_images: bool = False) -> dict:
+    """ParseResult를 딕셔너리로 변환
+
+    Note:
+        반환되는 dict의 pages/tables 항목은 복사본이 아니라 result가
+        들고 있는 객체를 그대로 참조함 (이전의 JSON 직렬화→파싱
+        왕복으로 깊은 복사를 만들던 것과 달리 O(1))
+    """
+    return _build_data(result, include_images)
 
 
 def parse_pdf(filepath_or_bytes):
@@ -10,11 +10,20 @@ PDF에서 이미지 추출 기능
 - CCITTFaxDecode (Fax/TIFF)
 """
 
+import io
+import struct
 import zlib
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Any, Dict
+from typing import List, Optional, Tuple, Any, Dict, Union
 from .stream_decoder import StreamDecoder
 
+# Pillow가 있으면 PNG 인코딩을 위임 - libpng 계열 C 인코더가 수제
+# 인코더보다 몇 배 빠름. 없으면 아래 순수 Python 경로로 폴백 (무의존성 유지)
+try:
+    from PIL import Image as _PILImage
+except ImportError:
+    _PILImage = None
+
 
 @dataclass
 class PDFImage:
@@ -25,7 +34,9 @@ class PDFImage:
     color_space: str
     bits_per_component: int
     filter: str  # 원본 필터 (DCTDecode, FlateDecode 등)
-    data: bytes  # 이미지 데이터
+    # 이미지 데이터 - DCT/JPX처럼 무변환으로 통과하는 스트림은 원본
+    # 버퍼를 가리키는 memoryview여도 됨 (f.write/재압축 모두 수용)
+    data: Union[bytes, memoryview]
     
     @property
     def format(self) -> str:
@@ -41,6 +52,36 @@ class PDFImage:
         return 'unknown'
 
 
+def _inflate_bounded(raw_data: bytes, expected: int) -> bytes:
+    """FlateDecode 해제 - 기대 크기만큼 먼저 받고, 상한까지만 이어서 해제
+
+    expected가 정확하면 출력 버퍼가 한 번에 그 크기로 잡히고,
+    채널 수 추정이 빗나간 경우를 대비해 4×expected + 64KB까지는 마저
+    해제함 (raw_to_png의 데이터 크기 기반 채널 추론 유지).
+    그 이상을 만들어내는 스트림은 손상으로 보고 잘라냄.
+    """
+    if expected <= 0:
+        return zlib.decompress(raw_data)
+
+    d = zlib.decompressobj()
+    out = d.decompress(raw_data, expected)
+    if not d.unconsumed_tail:
+        return out
+
+    limit = expected * 4 + 65536
+    parts = [out]
+    total = len(out)
+    tail = d.unconsumed_tail
+    while tail and total < limit:
+        chunk = d.decompress(tail, limit - total)
+        if not chunk:
+            break
+        parts.append(chunk)
+        total += len(chunk)
+        tail = d.unconsumed_tail
+    return b''.join(parts)
+
+
 def _collect_image_refs_recursive(doc, container, image_refs: set, PDFRef, visited=None):
     """
     페이지/Form XObject에서 이미지 참조를 재귀적으로 수집.
@@ -109,16 +150,25 @@ def extract_images(doc, page_num: int = None) -> List[PDFImage]:
             page_image_refs = None
     
     images = []
-    
-    # 이미지 XObject 찾기
-    for (obj_num, gen_num), obj in doc.objects.items():
-        if not isinstance(obj, dict):
-            continue
-        
-        subtype = obj.get('Subtype')
-        if subtype != 'Image':
-            continue
-        
+
+    # 이미지 XObject 인덱스 - 파서가 파싱 중에 모아둔 키 목록이 있으면
+    # 그것으로 바로 구성하고, 없으면(직접 조립한 문서 등) 첫 호출에
+    # 한 번만 전체 객체를 훑어 doc에 캐시. 페이지별 반복 호출이
+    # O(전체 객체)에서 O(이미지 수)로 줄어듦
+    image_xobjects = getattr(doc, '_image_xobjects', None)
+    if image_xobjects is None:
+        keys = getattr(doc, 'image_xobject_keys', None)
+        if keys:
+            image_xobjects = [(key, doc.objects[key])
+                              for key in keys if key in doc.objects]
+        else:
+            image_xobjects = [
+                (key, obj) for key, obj in doc.objects.items()
+                if isinstance(obj, dict) and obj.get('Subtype') == 'Image'
+            ]
+        doc._image_xobjects = image_xobjects
+
+    for (obj_num, gen_num), obj in image_xobjects:
         # 페이지별 필터링
         if page_image_refs is not None:
             if (obj_num, gen_num) not in page_image_refs:
@@ -185,9 +235,12 @@ def extract_images(doc, page_num: int = None) -> List[PDFImage]:
         elif filter_name == 'JPXDecode':
             image_data = raw_data
         elif filter_name == 'FlateDecode':
-            # zlib 압축 해제
+            # zlib 압축 해제 - 기대 픽셀 크기를 알고 있으므로 max_length로
+            # 출력 버퍼를 한 번에 잡고, 잘못된 스트림이 기대치를 한참 넘어
+            # 폭주하는 것도 상한으로 차단
             try:
-                image_data = zlib.decompress(raw_data)
+                expected = (width * height * channels * bpc + 7) // 8
+                image_data = _inflate_bounded(raw_data, expected)
             except (zlib.error, ValueError):
                 image_data = raw_data
         else:
@@ -255,9 +308,8 @@ def save_image(image: PDFImage, filepath: str) -> bool:
         if not filepath.lower().endswith('.png'):
             filepath += '.png'
         
-        png_data = raw_to_png(image)
         with open(filepath, 'wb') as f:
-            f.write(png_data)
+            raw_to_png_stream(image, f)
         return True
         
     except Exception as e:
@@ -296,72 +348,101 @@ def _save_as_ppm(image: PDFImage, filepath: str) -> bool:
         return False
 
 
-def raw_to_png(image: PDFImage) -> bytes:
-    """
-    Raw 이미지 데이터를 PNG로 변환
-    
-    Note: 이 함수는 외부 라이브러리 없이 PNG를 생성합니다.
-    복잡한 이미지의 경우 Pillow 사용을 권장합니다.
+def _resolve_raw_format(image: PDFImage):
+    """PNG 변환용 color_type/채널 수 결정 (CMYK는 RGB로 변환)
+
+    데이터 크기로 먼저 추론하고, 애매하면 색상 공간 문자열로 판단.
+    Returns: (color_type, channels, data)
     """
-    import struct
-    
     width = image.width
     height = image.height
     data = image.data
-    
-    # 색상 타입 및 채널 수 결정
     color_space = image.color_space
-    
-    # 데이터 크기로 채널 수 추론
+
     expected_pixels = width * height
     actual_size = len(data)
-    
+
     if actual_size == expected_pixels * 3:
-        color_type = 2  # RGB
-        channels = 3
+        return 2, 3, data       # RGB
     elif actual_size == expected_pixels * 4:
-        color_type = 6  # RGBA
-        channels = 4
+        return 6, 4, data       # RGBA
     elif actual_size == expected_pixels:
-        color_type = 0  # Grayscale
-        channels = 1
+        return 0, 1, data       # Grayscale
     elif 'RGB' in color_space or '3ch' in color_space:
-        color_type = 2  # RGB
-        channels = 3
+        return 2, 3, data
     elif 'CMYK' in color_space or '4ch' in color_space:
         # CMYK -> RGB 변환 필요
-        data = _cmyk_to_rgb(data, width, height)
-        color_type = 2
-        channels = 3
-    else:
-        color_type = 0  # Grayscale
-        channels = 1
-    
+        return 2, 3, _cmyk_to_rgb(data, width, height)
+    return 0, 1, data           # Grayscale
+
+
+def _try_pil_png(image: PDFImage, color_type: int, channels: int,
+                 data, fp) -> bool:
+    """Pillow가 있고 데이터가 정확히 맞으면 fp에 PNG를 쓰고 True"""
+    width = image.width
+    height = image.height
+    if (_PILImage is None or width <= 0 or height <= 0
+            or len(data) < width * height * channels):
+        return False
+    mode = {0: 'L', 2: 'RGB', 6: 'RGBA'}[color_type]
+    img = _PILImage.frombuffer(
+        mode, (width, height), bytes(data[:width * height * channels]),
+        'raw', mode, 0, 1)
+    img.save(fp, 'PNG', compress_level=6)
+    return True
+
+
+def raw_to_png(image: PDFImage) -> bytes:
+    """
+    Raw 이미지 데이터를 PNG로 변환
+
+    Note: 이 함수는 외부 라이브러리 없이 PNG를 생성합니다.
+    복잡한 이미지의 경우 Pillow 사용을 권장합니다.
+    """
+    width = image.width
+    height = image.height
+
+    # 색상 타입 및 채널 수 결정
+    color_type, channels, data = _resolve_raw_format(image)
+
+    # Pillow 경로 - 데이터가 정확히 맞을 때만 (부족분 패딩은 수제 경로가 처리)
+    if _PILImage is not None:
+        buf = io.BytesIO()
+        if _try_pil_png(image, color_type, channels, data, buf):
+            return buf.getvalue()
+
     # PNG 헤더
     png_signature = b'\x89PNG\r\n\x1a\n'
     
     # IHDR chunk
     ihdr_data = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
-    ihdr_crc = zlib.crc32(b'IHDR' + ihdr_data) & 0xffffffff
+    # CRC는 스트리밍 형태로 - 태그에 데이터를 이어붙인 임시 bytes를 안 만듦
+    ihdr_crc = zlib.crc32(ihdr_data, zlib.crc32(b'IHDR')) & 0xffffffff
     ihdr_chunk = struct.pack('>I', 13) + b'IHDR' + ihdr_data + struct.pack('>I', ihdr_crc)
     
     # IDAT chunk (이미지 데이터)
     # 각 행 앞에 필터 바이트 추가 (0 = None)
+    # 전체 크기를 미리 할당해 두고 행 데이터만 슬라이스 대입 - 행마다
+    # bytes 연결(+=)을 반복하면 높이에 비례해 재할당/복사가 일어남.
+    # 0으로 초기화되므로 필터 바이트와 부족분 패딩은 그대로 두면 됨
     row_size = width * channels
-    filtered_data = b''
+    stride = row_size + 1
+    filtered_data = bytearray(stride * height)
+    src = memoryview(data)
     for y in range(height):
-        filtered_data += b'\x00'  # 필터 타입: None
         row_start = y * row_size
-        row_end = row_start + row_size
-        if row_end <= len(data):
-            filtered_data += data[row_start:row_end]
-        else:
-            # 데이터가 부족하면 0으로 채움
-            available = data[row_start:] if row_start < len(data) else b''
-            filtered_data += available + b'\x00' * (row_size - len(available))
+        row_end = min(row_start + row_size, len(data))
+        if row_start >= row_end:
+            break
+        dst = y * stride + 1
+        filtered_data[dst:dst + (row_end - row_start)] = src[row_start:row_end]
     
-    compressed_data = zlib.compress(filtered_data, 9)
-    idat_crc = zlib.crc32(b'IDAT' + compressed_data) & 0xffffffff
+    # 레벨 9는 이미지 데이터에서 레벨 6 대비 크기 이득이 거의 없으면서
+    # CPU는 몇 배 더 씀. Z_FILTERED는 필터링된 스캔라인에 맞는 전략
+    co = zlib.compressobj(6, zlib.DEFLATED, 15, 8, zlib.Z_FILTERED)
+    compressed_data = co.compress(filtered_data) + co.flush()
+    # 수 MB가 될 수 있는 compressed_data를 태그와 이어붙이지 않음
+    idat_crc = zlib.crc32(compressed_data, zlib.crc32(b'IDAT')) & 0xffffffff
     idat_chunk = struct.pack('>I', len(compressed_data)) + b'IDAT' + compressed_data + struct.pack('>I', idat_crc)
     
     # IEND chunk
@@ -371,22 +452,96 @@ def raw_to_png(image: PDFImage) -> bytes:
     return png_signature + ihdr_chunk + idat_chunk + iend_chunk
 
 
+def _write_chunk(fp, tag: bytes, payload) -> None:
+    """PNG 청크 하나를 fp에 기록 (길이 + 태그 + 데이터 + CRC)"""
+    fp.write(struct.pack('>I', len(payload)))
+    fp.write(tag)
+    fp.write(payload)
+    fp.write(struct.pack(
+        '>I', zlib.crc32(payload, zlib.crc32(tag)) & 0xffffffff))
+
+
+def raw_to_png_stream(image: PDFImage, fp) -> None:
+    """
+    Raw 이미지 데이터를 PNG로 변환해 파일류 객체에 바로 기록
+
+    raw_to_png와 달리 완성된 PNG를 메모리에 통째로 만들지 않음 -
+    압축 출력이 나오는 대로 개별 IDAT 청크로 흘려보내므로 (PNG는
+    IDAT 분할을 허용) 피크 메모리가 압축 블록 하나 수준이고
+    deflate와 디스크 쓰기가 겹침
+    """
+    width = image.width
+    height = image.height
+    color_type, channels, data = _resolve_raw_format(image)
+
+    # Pillow가 있으면 바로 fp로 저장
+    if _try_pil_png(image, color_type, channels, data, fp):
+        return
+
+    fp.write(b'\x89PNG\r\n\x1a\n')
+    _write_chunk(fp, b'IHDR',
+                 struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+
+    row_size = width * channels
+    stride = row_size + 1
+    co = zlib.compressobj(6, zlib.DEFLATED, 15, 8, zlib.Z_FILTERED)
+    src = memoryview(data)
+
+    # 필터링된 행을 ~1MB 블록 단위로 조립해 압축기에 공급
+    block_rows = max(1, (1 << 20) // stride)
+    for y0 in range(0, height, block_rows):
+        rows = min(block_rows, height - y0)
+        block = bytearray(stride * rows)
+        for i in range(rows):
+            row_start = (y0 + i) * row_size
+            row_end = min(row_start + row_size, len(data))
+            if row_start >= row_end:
+                break
+            dst = i * stride + 1
+            block[dst:dst + (row_end - row_start)] = src[row_start:row_end]
+        out = co.compress(bytes(block))
+        if out:
+            _write_chunk(fp, b'IDAT', out)
+
+    _write_chunk(fp, b'IDAT', co.flush())
+    _write_chunk(fp, b'IEND', b'')
+
+
+# CMYK→RGB 변환 테이블 - (K, 채널값) 256×256 조합을 미리 계산해 두면
+# 픽셀마다 부동소수점 곱셈 3회 대신 테이블 조회 3회로 끝남.
+# CMYK 이미지를 처음 만날 때 한 번만 생성 (64KB)
+_CMYK_LUT = None
+
+
+def _build_cmyk_lut() -> bytes:
+    table = bytearray(65536)
+    for k in range(256):
+        base = k << 8
+        ik = 1 - k / 255
+        for v in range(256):
+            # 기존 공식 int(255 * (1 - v/255) * (1 - k/255))과 동일
+            table[base + v] = int(255 * (1 - v / 255) * ik)
+    return bytes(table)
+
+
 def _cmyk_to_rgb(data: bytes, width: int, height: int) -> bytes:
     """CMYK 데이터를 RGB로 변환"""
-    rgb_data = bytearray()
-    
-    for i in range(0, len(data), 4):
-        if i + 4 > len(data):
-            break
-        c, m, y, k = data[i], data[i+1], data[i+2], data[i+3]
-        
-        # CMYK to RGB 변환 공식
-        r = int(255 * (1 - c/255) * (1 - k/255))
-        g = int(255 * (1 - m/255) * (1 - k/255))
-        b = int(255 * (1 - y/255) * (1 - k/255))
-        
-        rgb_data.extend([r, g, b])
-    
+    global _CMYK_LUT
+    if _CMYK_LUT is None:
+        _CMYK_LUT = _build_cmyk_lut()
+    lut = _CMYK_LUT
+
+    # 출력을 미리 할당하고 인덱스로 채움 - extend 호출/리스트 생성 제거
+    n = len(data) - (len(data) % 4)
+    rgb_data = bytearray((n // 4) * 3)
+    j = 0
+    for i in range(0, n, 4):
+        base = data[i + 3] << 8
+        rgb_data[j] = lut[base + data[i]]
+        rgb_data[j + 1] = lut[base + data[i + 1]]
+        rgb_data[j + 2] = lut[base + data[i + 2]]
+        j += 3
+
     return bytes(rgb_data)
 
 
@@ -11,7 +11,9 @@ DOC, PPT, XLS, HWP(5.0 Binary) 파일의 기반이 되는 컨테이너 포맷 
 - MiniFAT: 작은 스트림(4KB 미만) 관리용 FAT
 """
 
+import mmap
 import struct
+from array import array
 from dataclasses import dataclass
 from typing import List, Optional, Union
 
@@ -25,6 +27,10 @@ FAT_SECT_END = 0xFFFFFFFE
 FAT_SECT_FAT = 0xFFFFFFFD
 FAT_SECT_DIFAT = 0xFFFFFFFC
 
+# 디렉토리 엔트리(128B) 레이아웃 - 이름(64) 이름길이(2) 타입(1) 색(1)
+# 형제/자식(12) CLSID(16)+상태(4)+타임스탬프(16)는 건너뜀, 시작섹터(4) 크기(8)
+_ST_DIRENTRY = struct.Struct('<64sHBBIII36xIQ')
+
 
 @dataclass
 class DirectoryEntry:
@@ -41,11 +47,35 @@ class DirectoryEntry:
 
 class OLE2Reader:
     """OLE2 컨테이너 파일 리더"""
-    
+
+    # 인스턴스 딕셔너리 제거 - 체인 워크/섹터 읽기의 속성 접근이
+    # 해시 조회 없이 고정 슬롯 오프셋으로 떨어짐
+    __slots__ = (
+        'data', '_fp',
+        'sector_shift', 'sector_size', 'mini_sector_shift', 'mini_sector_size',
+        'num_fat_sectors', 'first_dir_sector', 'mini_cutoff_size',
+        'first_minifat_sector', 'num_minifat_sectors',
+        'first_difat_sector', 'num_difat_sectors',
+        'difat', 'fat', 'minifat', 'mini_stream_data',
+        'entries', 'root_entry', '_entry_map',
+        '_epoch', '_chain_epoch', '_mini_epoch',
+    )
+
     def __init__(self, filepath_or_bytes: Union[str, bytes]):
+        self._fp = None
         if isinstance(filepath_or_bytes, str):
-            with open(filepath_or_bytes, 'rb') as f:
-                self.data = f.read()
+            # 파일 전체를 힙으로 읽는 대신 mmap - 접근한 섹터만 OS가
+            # 페이지인하므로 큰 파일에서 피크 메모리가 파일 크기만큼 줄고
+            # 커널이 다 읽기 전에 파싱을 시작할 수 있음
+            self._fp = open(filepath_or_bytes, 'rb')
+            try:
+                self.data = mmap.mmap(
+                    self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # 빈 파일 등 mmap 불가 - 기존 방식으로 폴백
+                self.data = self._fp.read()
+                self._fp.close()
+                self._fp = None
         else:
             self.data = filepath_or_bytes
 
@@ -54,6 +84,20 @@ class OLE2Reader:
         self._read_directory()
         self._build_minifat()
 
+    def close(self):
+        """mmap/파일 핸들 해제 (bytes 입력이면 no-op)"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _parse_header(self):
         """헤더 파싱 (512 bytes)"""
         if len(self.data) < 512:
@@ -96,85 +140,98 @@ class OLE2Reader:
 
     def _build_fat(self):
         """FAT (File Allocation Table) 구축"""
+        # 섹터 하나를 u32 배열로 한 번에 언팩 - int 하나마다 슬라이스와
+        # 1-튜플을 만드는 대신 C 호출 한 번 (512B 섹터면 128개씩)
+        ints_per_sector = self.sector_size // 4
+        unpack_sector = struct.Struct('<%dI' % ints_per_sector).unpack_from
+
         # DIFAT 확장 (Header 109개 초과 시)
         current_difat_sector = self.first_difat_sector
         while current_difat_sector != FAT_SECT_END and current_difat_sector != FAT_SECT_FREE:
             offset = self._get_sector_offset(current_difat_sector)
-            sector_data = self.data[offset:offset + self.sector_size]
-            
+            values = unpack_sector(self.data, offset)
+
             # 마지막 4바이트는 다음 DIFAT 섹터 포인터
-            ints_per_sector = self.sector_size // 4
-            for i in range(ints_per_sector - 1):
-                sector = struct.unpack('<I', sector_data[i*4:(i+1)*4])[0]
-                if sector != FAT_SECT_FREE:
-                    self.difat.append(sector)
-            
-            current_difat_sector = struct.unpack('<I', sector_data[-4:])[0]
+            self.difat.extend(
+                sector for sector in values[:-1] if sector != FAT_SECT_FREE)
+            current_difat_sector = values[-1]
 
         # FAT 로드
         self.fat = []
         for sector in self.difat:
             offset = self._get_sector_offset(sector)
-            sector_data = self.data[offset:offset + self.sector_size]
-            
-            ints_per_sector = self.sector_size // 4
-            for i in range(ints_per_sector):
-                val = struct.unpack('<I', sector_data[i*4:(i+1)*4])[0]
-                self.fat.append(val)
+            self.fat.extend(unpack_sector(self.data, offset))
+
+        # 체인 워크용 재사용 방문 버퍼 - 호출마다 FAT 크기의 버퍼를 새로
+        # 만들지 않고, 에포크 값 비교로 O(1) 리셋
+        self._epoch = 0
+        self._chain_epoch = array('I', bytes(4 * len(self.fat)))
+        self._mini_epoch = array('I')
+
+    def _next_epoch(self) -> int:
+        """방문 버퍼용 에포크 증가 (u32 한계 도달 시 버퍼 재생성)"""
+        self._epoch += 1
+        if self._epoch > 0xFFFFFFFE:
+            self._epoch = 1
+            self._chain_epoch = array('I', bytes(4 * len(self.fat)))
+            self._mini_epoch = array('I', bytes(4 * len(self.minifat)))
+        return self._epoch
 
     def _get_chain(self, start_sector: int) -> List[int]:
         """FAT 체인을 따라가며 섹터 목록 반환"""
+        # 방문 체크는 재사용 에포크 배열 - 호출마다 버퍼 할당 없이
+        # 에포크 증가가 곧 리셋이고, 순환은 FAT 크기 안에서 반드시 잡힘
+        fat = self.fat
+        fat_len = len(fat)
+        epoch = self._next_epoch()
+        visited = self._chain_epoch
         chain = []
+        append = chain.append
         current = start_sector
-        visited = set()
-        
+
         while current != FAT_SECT_END and current != FAT_SECT_FREE:
-            if current >= len(self.fat) or current in visited:
+            if current >= fat_len or visited[current] == epoch:
                 break  # 깨진 체인
-            visited.add(current)
-            chain.append(current)
-            current = self.fat[current]
-        
+            visited[current] = epoch
+            append(current)
+            current = fat[current]
+
         return chain
 
     def _read_directory(self):
         """디렉토리 엔트리 파싱"""
+        # 섹터 조각을 모아 한 번에 join - bytearray를 키워가며 복사하는
+        # 것보다 재할당이 없고 피크 메모리도 낮음
         chain = self._get_chain(self.first_dir_sector)
-        dir_data = bytearray()
-        
-        for sector in chain:
-            offset = self._get_sector_offset(sector)
-            dir_data.extend(self.data[offset:offset + self.sector_size])
+        mv = memoryview(self.data)
+        sector_size = self.sector_size
+        dir_data = b''.join(
+            mv[self._get_sector_offset(s):
+               self._get_sector_offset(s) + sector_size] for s in chain)
 
         self.entries = []
         self.root_entry = None
         self._entry_map = {}  # 이름 -> 엔트리 매핑
         
-        # 각 엔트리는 128 바이트
+        # 각 엔트리는 128 바이트 - 복합 Struct 하나로 한 번에 언팩
+        # (엔트리마다 6번의 개별 unpack + 슬라이스 대신 C 호출 1회)
         num_entries = len(dir_data) // 128
         for i in range(num_entries):
-            entry_bytes = dir_data[i*128:(i+1)*128]
-            
+            (name_raw, name_len, entry_type, color,
+             left, right, child,
+             start_sector, size) = _ST_DIRENTRY.unpack_from(dir_data, i * 128)
+
+            # entry_type 0:Empty, 1:Storage, 2:Stream, 5:Root
+            if entry_type == 0:
+                continue  # 빈 엔트리 스킵
+
             # 이름 길이 (바이트 단위, null 포함)
-            name_len = struct.unpack('<H', entry_bytes[64:66])[0]
             if name_len > 0 and name_len <= 64:
                 # UTF-16LE 디코딩 (마지막 null 문자 제외)
-                name = entry_bytes[:name_len-2].decode('utf-16le', errors='ignore')
+                name = name_raw[:name_len-2].decode('utf-16le', errors='ignore')
             else:
                 name = ""
 
-            entry_type = entry_bytes[66]  # 0:Empty, 1:Storage, 2:Stream, 5:Root
-            
-            if entry_type == 0:
-                continue  # 빈 엔트리 스킵
-                
-            color = entry_bytes[67]
-            left = struct.unpack('<I', entry_bytes[68:72])[0]
-            right = struct.unpack('<I', entry_bytes[72:76])[0]
-            child = struct.unpack('<I', entry_bytes[76:80])[0]
-            start_sector = struct.unpack('<I', entry_bytes[116:120])[0]
-            size = struct.unpack('<Q', entry_bytes[120:128])[0]
-
             entry = DirectoryEntry(
                 name=name,
                 entry_type=entry_type,
@@ -194,31 +251,32 @@ class OLE2Reader:
     def _build_minifat(self):
         """MiniFAT 구축"""
         self.minifat = []
-        self.mini_stream_data = bytearray()
-        
+        self.mini_stream_data = b''
+
         if not self.root_entry:
             return
 
+        mv = memoryview(self.data)
+        sector_size = self.sector_size
+        get_offset = self._get_sector_offset
+
         # MiniFAT 데이터 읽기
         if self.first_minifat_sector != FAT_SECT_END:
             chain = self._get_chain(self.first_minifat_sector)
-            minifat_data = bytearray()
-            
-            for sector in chain:
-                offset = self._get_sector_offset(sector)
-                minifat_data.extend(self.data[offset:offset + self.sector_size])
+            minifat_data = b''.join(
+                mv[get_offset(s):get_offset(s) + sector_size] for s in chain)
 
             num_ints = len(minifat_data) // 4
-            for i in range(num_ints):
-                val = struct.unpack('<I', minifat_data[i*4:(i+1)*4])[0]
-                self.minifat.append(val)
+            self.minifat = list(
+                struct.unpack_from('<%dI' % num_ints, minifat_data))
+            self._mini_epoch = array('I', bytes(4 * num_ints))
 
         # MiniStream 데이터 읽기 (Root Entry가 가리키는 스트림)
         if self.root_entry.start_sector != FAT_SECT_END:
             root_chain = self._get_chain(self.root_entry.start_sector)
-            for sector in root_chain:
-                offset = self._get_sector_offset(sector)
-                self.mini_stream_data.extend(self.data[offset:offset + self.sector_size])
+            self.mini_stream_data = b''.join(
+                mv[get_offset(s):get_offset(s) + sector_size]
+                for s in root_chain)
 
     def get_stream(self, stream_name: str) -> Optional[bytes]:
         """
@@ -237,36 +295,51 @@ class OLE2Reader:
 
     def _read_stream_data(self, entry: DirectoryEntry) -> bytes:
         """엔트리의 데이터 읽기"""
-        data = bytearray()
-        
         if entry.size == 0:
             return bytes()
-        
+
+        parts = []
+
         if entry.size < self.mini_cutoff_size and self.minifat:
             # MiniStream 사용
+            minifat = self.minifat
+            minifat_len = len(minifat)
+            mini_size = self.mini_sector_size
+            mini_mv = memoryview(self.mini_stream_data)
             current = entry.start_sector
-            visited = set()
-            
+            epoch = self._next_epoch()
+            visited = self._mini_epoch
+
             while current != FAT_SECT_END and current != FAT_SECT_FREE:
-                if current >= len(self.minifat) or current in visited:
+                if current >= minifat_len or visited[current] == epoch:
                     break
-                visited.add(current)
-                
-                offset = current * self.mini_sector_size
-                if offset + self.mini_sector_size <= len(self.mini_stream_data):
-                    chunk = self.mini_stream_data[offset:offset + self.mini_sector_size]
-                    data.extend(chunk)
-                
-                current = self.minifat[current]
+                visited[current] = epoch
+
+                offset = current * mini_size
+                if offset + mini_size <= len(mini_mv):
+                    parts.append(mini_mv[offset:offset + mini_size])
+
+                current = minifat[current]
         else:
             # 일반 FAT 사용
-            chain = self._get_chain(entry.start_sector)
-            for sector in chain:
-                offset = self._get_sector_offset(sector)
-                data.extend(self.data[offset:offset + self.sector_size])
-        
-        # 크기에 맞게 자르기
-        return bytes(data[:entry.size])
+            mv = memoryview(self.data)
+            sector_size = self.sector_size
+            get_offset = self._get_sector_offset
+            parts = [mv[get_offset(s):get_offset(s) + sector_size]
+                     for s in self._get_chain(entry.start_sector)]
+
+        # 크기에 맞게 자르기 - join 후 다시 슬라이스 복사하지 않도록
+        # 마지막 조각에서 섹터 패딩만큼 미리 잘라냄
+        excess = sum(len(p) for p in parts) - entry.size
+        while excess > 0 and parts:
+            last = parts[-1]
+            if len(last) <= excess:
+                excess -= len(last)
+                parts.pop()
+            else:
+                parts[-1] = last[:len(last) - excess]
+                excess = 0
+        return b''.join(parts)
 
     def list_streams(self) -> List[str]:
         """모든 스트림 이름 나열"""
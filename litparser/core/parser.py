@@ -66,6 +66,9 @@ class PDFDocument:
     xref: Dict[int, XRefEntry] = field(default_factory=dict)
     trailer: Dict[str, Any] = field(default_factory=dict)
     objects: Dict[Tuple[int, int], Any] = field(default_factory=dict)  # (obj_num, gen_num) -> value
+    # 이미지 XObject 키 목록 - 파싱 중에 채워져서 extract_images가
+    # 전체 객체를 다시 훑지 않아도 됨
+    image_xobject_keys: List[Tuple[int, int]] = field(default_factory=list)
 
 
 class PDFLexer:
@@ -575,6 +578,8 @@ class PDFParser:
             try:
                 obj_value = self._parse_object_at(entry.offset, obj_num, entry.gen_num)
                 self.document.objects[(obj_num, entry.gen_num)] = obj_value
+                if isinstance(obj_value, dict) and obj_value.get('Subtype') == 'Image':
+                    self.document.image_xobject_keys.append((obj_num, entry.gen_num))
             except Exception as e:
                 # 조용히 실패 (디버그 시 출력 가능)
                 pass
@@ -604,6 +609,8 @@ class PDFParser:
                     if stream_idx < len(stream_objects):
                         obj_num_in_stream, obj_value = stream_objects[stream_idx]
                         self.document.objects[(obj_num, 0)] = obj_value
+                        if isinstance(obj_value, dict) and obj_value.get('Subtype') == 'Image':
+                            self.document.image_xobject_keys.append((obj_num, 0))
             except Exception as e:
                 pass
     
@@ -10,12 +10,19 @@ PDF Table Detector - Stage 5 (Visual Projection 방식)
 Based on Gemini's Visual-Stitch approach with improvements.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, Set
-from collections import defaultdict
 import re as regex
 
 
+# 핫 루프에서 쓰는 정규식은 모듈 로드 시 한 번만 컴파일
+_WS_RE = regex.compile(r'\s+')
+_BULLET_RE = regex.compile(r'^[◦○●◆■□➀➁➂➃\-·•※▶►▷△▲]')
+_SENTENCE_START_RE = regex.compile(r'^[A-Z가-힣]')
+_CSV_QUOTE_RE = regex.compile(r'[,"\n]')
+
+
 @dataclass
 class TableCell:
     """테이블 셀"""
@@ -44,24 +51,42 @@ class Table:
     
     def to_list(self) -> List[List[str]]:
         """2D 리스트로 변환"""
-        if not self.cells:
+        cells = self.cells
+        if not cells:
             return []
-        
-        max_row = max((c.row for c in self.cells), default=0)
-        max_col = max((c.col for c in self.cells), default=0)
-        
-        grid = [['' for _ in range(max_col + 1)] for _ in range(max_row + 1)]
-        
-        for cell in sorted(self.cells, key=lambda c: (c.row, c.col)):
+
+        # 최대 행/열과 정렬 여부를 한 번의 순회로 확인
+        max_row = 0
+        max_col = 0
+        is_sorted = True
+        prev_row = prev_col = -1
+        for c in cells:
+            if c.row > max_row:
+                max_row = c.row
+            if c.col > max_col:
+                max_col = c.col
+            if c.row < prev_row or (c.row == prev_row and c.col < prev_col):
+                is_sorted = False
+            prev_row, prev_col = c.row, c.col
+
+        # 이미 (row, col) 순이면 정렬 생략 (일반적인 생성 직후 경로)
+        if not is_sorted:
+            cells = sorted(cells, key=lambda c: (c.row, c.col))
+
+        # 같은 셀에 여러 텍스트가 모이면 문자열 이어붙이기 대신
+        # 조각 리스트에 모았다가 마지막에 한 번만 join
+        grid = [[None] * (max_col + 1) for _ in range(max_row + 1)]
+        for cell in cells:
             r = min(cell.row, max_row)
             c = min(cell.col, max_col)
-            text = regex.sub(r'\s+', ' ', cell.text.strip())
-            if grid[r][c]:
-                grid[r][c] += ' ' + text
+            text = _WS_RE.sub(' ', cell.text.strip())
+            bucket = grid[r][c]
+            if bucket is None:
+                grid[r][c] = [text]
             else:
-                grid[r][c] = text
-        
-        return grid
+                bucket.append(text)
+
+        return [[' '.join(b) if b is not None else '' for b in row] for row in grid]
     
     def to_markdown(self) -> str:
         """마크다운 테이블로 변환"""
@@ -86,14 +111,13 @@ class Table:
     def to_csv(self) -> str:
         """CSV 형식으로 변환"""
         grid = self.to_list()
+        needs_quote = _CSV_QUOTE_RE.search  # 특수문자 검사를 한 번의 스캔으로
         lines = []
         for row in grid:
-            escaped = []
-            for cell in row:
-                if ',' in cell or '"' in cell or '\n' in cell:
-                    escaped.append('"' + cell.replace('"', '""') + '"')
-                else:
-                    escaped.append(cell)
+            escaped = [
+                '"' + cell.replace('"', '""') + '"' if needs_quote(cell) else cell
+                for cell in row
+            ]
             lines.append(','.join(escaped))
         return '\n'.join(lines)
 
@@ -117,22 +141,38 @@ def detect_tables(text_items: list,
     """
     if not text_items:
         return []
-    
+
     # 1. 텍스트를 블록으로 그룹화
-    blocks = _group_text_into_blocks(text_items)
-    
+    # Y 오름차순 정렬 후 페이지 단위 SoA 구성 - 블록 분석마다 TextItem
+    # 속성을 다시 읽지 않고 구간 슬라이스만 넘김
+    sorted_items = sorted(text_items, key=lambda t: t.y)
+    xs = [t.x for t in sorted_items]
+    ys = [t.y for t in sorted_items]
+    fss = [t.font_size for t in sorted_items]
+    lens = [len(t.text) for t in sorted_items]
+
+    ranges = _block_ranges(ys)
+
     if debug:
-        print(f"[Debug] 텍스트 블록: {len(blocks)}개")
-    
+        print(f"[Debug] 텍스트 블록: {len(ranges)}개")
+
     # 2. 각 블록에서 테이블 구조 분석
     raw_tables = []
-    for block in blocks:
-        table = _analyze_block_for_table(block, min_cols)
+    for start, end in ranges:
+        if end - start < 3:  # 최소 3개 텍스트 필요 - 슬라이스 비용도 건너뜀
+            continue
+        table = _analyze_block_for_table(
+            sorted_items[start:end], min_cols,
+            arrays=(xs[start:end], ys[start:end], fss[start:end], lens[start:end]))
         if table:
             raw_tables.append(table)
-    
+
     if debug:
         print(f"[Debug] 초기 테이블 후보: {len(raw_tables)}개")
+
+    # 후보가 없으면 병합/검증 단계 생략
+    if not raw_tables:
+        return []
     
     # 3. 쪼개진 테이블 병합
     merged_tables = _stitch_tables(raw_tables, debug)
@@ -150,85 +190,164 @@ def detect_tables(text_items: list,
     return final_tables
 
 
+def _block_ranges(sorted_ys: List[float], gap_threshold: float = 25) -> List[Tuple[int, int]]:
+    """
+    Y 오름차순 좌표 배열을 수직 간격 기준의 연속 구간 [start, end)로 분리
+
+    큰 Y 간격이 있으면 별도 블록으로 분리
+    """
+    if not sorted_ys:
+        return []
+
+    ranges = []
+    start = 0
+    last_y = sorted_ys[0]
+
+    for i in range(1, len(sorted_ys)):
+        y = sorted_ys[i]
+        # 수직 간격이 크면 새 블록
+        if y - last_y > gap_threshold:
+            ranges.append((start, i))
+            start = i
+        last_y = y
+
+    ranges.append((start, len(sorted_ys)))
+    return ranges
+
+
 def _group_text_into_blocks(text_items: list, gap_threshold: float = 25) -> List[List]:
     """
     텍스트를 수직 간격 기준으로 블록 분리
-    
+
     큰 Y 간격이 있으면 별도 블록으로 분리
     """
     if not text_items:
         return []
-    
+
     # Y 오름차순 정렬 (작은 Y = 위쪽, PDF 표준 좌표계)
     sorted_items = sorted(text_items, key=lambda t: t.y)
-    
-    blocks = []
-    current_block = [sorted_items[0]]
-    last_y = sorted_items[0].y
-    
-    for item in sorted_items[1:]:
-        # 수직 간격이 크면 새 블록
-        if item.y - last_y > gap_threshold:
-            if current_block:
-                blocks.append(current_block)
-            current_block = []
-        
-        current_block.append(item)
-        last_y = item.y
-    
-    if current_block:
-        blocks.append(current_block)
-    
-    return blocks
+    ys = [t.y for t in sorted_items]
+
+    return [sorted_items[s:e] for s, e in _block_ranges(ys, gap_threshold)]
+
+
+def _merge_segments(segments: List[Tuple[float, float]], gap: float = 20) -> List[Tuple[float, float]]:
+    """
+    정렬된 (start, end) 세그먼트에서 겹치거나 gap 이내로 가까운 것을 병합
+
+    순수 숫자 스윕만 하는 핫 루프라서 모듈 레벨로 분리 (Python 객체 생성 없음)
+    """
+    if not segments:
+        return []
+
+    columns = []
+    curr_start, curr_end = segments[0]
+    for seg_start, seg_end in segments[1:]:
+        if seg_start < curr_end + gap:
+            if seg_end > curr_end:
+                curr_end = seg_end
+        else:
+            columns.append((curr_start, curr_end))
+            curr_start, curr_end = seg_start, seg_end
+    columns.append((curr_start, curr_end))
+    return columns
 
 
-def _analyze_block_for_table(block: list, min_cols: int = 2) -> Optional[Table]:
+def _assign_columns(item_xs: List[float], columns: List[Tuple[float, float]],
+                    tol: float = 25) -> List[int]:
+    """
+    각 X좌표에 가장 가까운 열 인덱스 할당 (범위 밖이면 -1)
+
+    columns가 X 오름차순 정렬·비중첩이므로 전체 열을 훑지 않고
+    이분 탐색으로 좌우 후보 두 개만 검사 - O(N log C)
+    """
+    col_starts = [c[0] for c in columns]
+    n_cols = len(columns)
+    best_cols = []
+    append = best_cols.append
+    inf = float('inf')
+    for x in item_xs:
+        idx = bisect_right(col_starts, x) - 1
+        best_col = -1
+        best_dist = inf
+        # x를 포함할 수 있는 열은 idx와 idx+1 뿐
+        for j in (idx, idx + 1):
+            if 0 <= j < n_cols:
+                col_start, col_end = columns[j]
+                # 열 범위 내에 있는지
+                if col_start - tol <= x <= col_end + tol:
+                    dist = abs(x - col_start)
+                    if dist < best_dist:
+                        best_dist = dist
+                        best_col = j
+        append(best_col)
+    return best_cols
+
+
+def _analyze_block_for_table(block: list, min_cols: int = 2,
+                             arrays: Optional[Tuple[list, list, list, list]] = None) -> Optional[Table]:
     """
     블록 내 텍스트 배치를 분석하여 테이블 구조 추출
-    
+
     Visual Projection 방식:
     - Y좌표로 행 구분
     - X좌표 세그먼트로 열 구분
+
+    arrays: 호출자가 페이지 단위로 이미 만든 (xs, ys, fss, lens) SoA 슬라이스
     """
     if len(block) < 3:  # 최소 3개 텍스트 필요
         return None
-    
+
+    # 좌표/폭을 블록당 한 번만 계산 (루프마다 속성 접근·float 연산 반복 방지)
+    if arrays is not None:
+        xs, ys, fss, lens = arrays
+    else:
+        xs = [t.x for t in block]
+        ys = [t.y for t in block]
+        fss = [t.font_size for t in block]
+        lens = [len(t.text) for t in block]
+
     # 1. 행(Row) 구분: Y좌표 그룹화 (5pt 단위)
-    rows = defaultdict(list)
-    for t in block:
-        row_key = int(t.y / 5)
-        rows[row_key].append(t)
-    
-    # Y좌표 방향 자동 감지: 
+    # Y좌표 방향 자동 감지:
     # - 일반 PDF: Y가 작을수록 위쪽 (오름차순 정렬)
     # - 일부 PDF: Y가 클수록 위쪽 (내림차순 정렬)
     # 여기서는 항상 오름차순(작은 Y가 첫 행)으로 정렬
-    sorted_row_keys = sorted(rows.keys())  # 오름차순 (작은 Y = 위쪽)
-    
+    # 키로 한 번 정렬한 뒤 단일 스윕으로 그룹화 (아이템별 dict 해싱 제거)
+    row_keys = [int(y / 5) for y in ys]
+    order = sorted(range(len(block)), key=row_keys.__getitem__)
+    sorted_row_keys = []   # 오름차순 (작은 Y = 위쪽)
+    row_groups = []        # sorted_row_keys와 같은 순서의 인덱스 묶음
+    prev_key = None
+    for i in order:
+        k = row_keys[i]
+        if k != prev_key:
+            sorted_row_keys.append(k)
+            row_groups.append([])
+            prev_key = k
+        row_groups[-1].append(i)
+
     if len(sorted_row_keys) < 2:
         return None
     
     # 연속 문장/불릿 문단 사전 필터링
     if len(sorted_row_keys) <= 4:
         # 각 행의 텍스트 합치기
-        row_texts = {}
-        row_starts = {}
-        for rk in sorted_row_keys:
-            items = sorted(rows[rk], key=lambda t: t.x)
-            non_space = [t for t in items if t.text.strip()]
+        all_texts = []
+        row_starts = []
+        for group in row_groups:
+            items = sorted(group, key=lambda i: xs[i])
+            non_space = [i for i in items if block[i].text.strip()]
             if non_space:
-                row_starts[rk] = min(t.x for t in non_space)
-                row_texts[rk] = ' '.join(t.text for t in non_space).strip()
+                row_starts.append(min(xs[i] for i in non_space))
+                all_texts.append(' '.join(block[i].text for i in non_space).strip())
             else:
-                row_texts[rk] = ''
-        
-        if row_texts:
-            all_texts = list(row_texts.values())
+                all_texts.append('')
+
+        if all_texts:
             
             # 패턴 1: 불릿/넘버링 문단 (◦, ➀, ➁, □, -, · 등으로 시작)
-            bullet_pattern = regex.compile(r'^[◦○●◆■□➀➁➂➃\-·•※▶►▷△▲]')
             first_text = all_texts[0] if all_texts else ''
-            if bullet_pattern.match(first_text):
+            if _BULLET_RE.match(first_text):
                 # 첫 행이 불릿으로 시작하면 문단일 가능성 높음
                 # 나머지 행도 같은 불릿이거나 이어지는 텍스트인지 확인
                 is_paragraph = True
@@ -236,10 +355,10 @@ def _analyze_block_for_table(block: list, min_cols: int = 2) -> Optional[Table]:
                     if not txt:
                         continue
                     # 다음 행이 불릿으로 시작하거나, 이어지는 텍스트
-                    if bullet_pattern.match(txt):
+                    if _BULLET_RE.match(txt):
                         continue  # 같은 수준의 불릿
                     # 조사/접속사/일반 단어로 시작하면 이어지는 문장
-                    if not regex.match(r'^[A-Z가-힣]', txt):
+                    if not _SENTENCE_START_RE.match(txt):
                         is_paragraph = False
                         break
                 if is_paragraph:
@@ -247,8 +366,7 @@ def _analyze_block_for_table(block: list, min_cols: int = 2) -> Optional[Table]:
             
             # 패턴 2: 같은 X 시작점에서 시작하는 연속 문장
             if row_starts:
-                starts = list(row_starts.values())
-                if max(starts) - min(starts) < 15:
+                if max(row_starts) - min(row_starts) < 15:
                     all_sentence = True
                     for txt in all_texts:
                         if not txt or len(txt) < 3:
@@ -263,87 +381,67 @@ def _analyze_block_for_table(block: list, min_cols: int = 2) -> Optional[Table]:
                         return None
     
     # 2. 열(Column) 감지: X좌표 세그먼트 병합
-    x_segments = []
-    for t in block:
-        # 텍스트 너비 추정
-        char_width = t.font_size * 0.6
-        width = max(10, len(t.text) * char_width)
-        x_segments.append((t.x, t.x + width))
-    
-    x_segments.sort()
-    
-    # 겹치거나 가까운 세그먼트 병합
-    columns = []
-    if x_segments:
-        curr_start, curr_end = x_segments[0]
-        for seg_start, seg_end in x_segments[1:]:
-            if seg_start < curr_end + 20:  # 20pt 이내면 병합
-                curr_end = max(curr_end, seg_end)
-            else:
-                columns.append((curr_start, curr_end))
-                curr_start, curr_end = seg_start, seg_end
-        columns.append((curr_start, curr_end))
-    
+    # 텍스트 너비 추정을 일괄 계산 후 한 번만 정렬
+    widths = [max(10.0, l * f * 0.6) for l, f in zip(lens, fss)]
+    x_segments = sorted(zip(xs, (x + w for x, w in zip(xs, widths))))
+
+    # 겹치거나 가까운 세그먼트 병합 (20pt 이내면 병합)
+    columns = _merge_segments(x_segments, gap=20)
+
     if len(columns) < min_cols:
         return None
+
+    # 아이템별 최근접 열 일괄 할당
+    best_cols = _assign_columns(xs, columns, tol=25)
     
     # 3. 셀 생성
     cells = []
-    for row_idx, row_key in enumerate(sorted_row_keys):
-        row_items = rows[row_key]
-        
-        for t in row_items:
-            # 텍스트 중심 X 좌표
-            t_center = t.x + len(t.text) * t.font_size * 0.3
-            
-            # 가장 가까운 열 찾기
-            best_col = -1
-            best_dist = float('inf')
-            for col_idx, (col_start, col_end) in enumerate(columns):
-                # 열 범위 내에 있는지
-                if col_start - 25 <= t.x <= col_end + 25:
-                    dist = abs(t.x - col_start)
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_col = col_idx
-            
+    for row_idx, row_items in enumerate(row_groups):
+        for i in row_items:
+            best_col = best_cols[i]
+
             if best_col != -1:
                 cells.append(TableCell(
                     row=row_idx,
                     col=best_col,
-                    text=t.text,
-                    x=t.x,
-                    y=t.y,
-                    width=len(t.text) * t.font_size * 0.6,
-                    height=t.font_size
+                    text=block[i].text,
+                    x=xs[i],
+                    y=ys[i],
+                    width=lens[i] * fss[i] * 0.6,
+                    height=fss[i]
                 ))
     
     # 4. 같은 셀의 텍스트 병합
-    cell_groups = defaultdict(list)
-    for c in cells:
-        cell_groups[(c.row, c.col)].append(c)
-    
+    # (row, col, x)로 한 번 정렬 후 연속 구간을 묶음 - 셀별 dict 해싱/그룹 정렬 제거
+    # 결과가 (row, col) 순으로 나와 to_list의 정렬 생략 경로도 타게 됨
+    cells.sort(key=lambda c: (c.row, c.col, c.x))
     final_cells = []
-    for (row, col), group in cell_groups.items():
-        # X 순서대로 정렬 후 병합
-        group.sort(key=lambda c: c.x)
-        merged_text = ' '.join(c.text for c in group)
+    idx = 0
+    n_cells = len(cells)
+    while idx < n_cells:
+        first = cells[idx]
+        row, col = first.row, first.col
+        j = idx + 1
+        while j < n_cells and cells[j].row == row and cells[j].col == col:
+            j += 1
+        if j == idx + 1:
+            merged_text = first.text
+        else:
+            merged_text = ' '.join(c.text for c in cells[idx:j])
         final_cells.append(TableCell(
             row=row,
             col=col,
             text=merged_text,
-            x=group[0].x,
-            y=group[0].y
+            x=first.x,
+            y=first.y
         ))
+        idx = j
     
-    # 바운딩 박스 계산
-    if block:
-        bx_min = min(t.x for t in block)
-        bx_max = max(t.x + len(t.text) * t.font_size for t in block)
-        by_min = min(t.y for t in block)
-        by_max = max(t.y for t in block)
-    else:
-        bx_min = bx_max = by_min = by_max = 0
+    # 바운딩 박스 계산 (사전 계산한 좌표 배열에 대한 일괄 min/max)
+    bx_min = min(xs)
+    bx_max = max([x + l * f for x, l, f in zip(xs, lens, fss)])
+    by_min = min(ys)
+    by_max = max(ys)
     
     return Table(
         cells=final_cells,
@@ -367,21 +465,26 @@ def _stitch_tables(tables: List[Table], debug: bool = False) -> List[Table]:
     
     # Y 오름차순 정렬 (작은 Y = 위쪽)
     tables.sort(key=lambda t: t.y)
-    
+
     merged = []
     current = tables[0]
-    
+    # 누적 바운딩 박스는 로컬에 캐시 - 테이블마다 속성 읽기/쓰기 반복 제거
+    cur_x, cur_y = current.x, current.y
+    cur_w, cur_h = current.width, current.height
+
     for next_t in tables[1:]:
+        nx, ny = next_t.x, next_t.y
+        nw, nh = next_t.width, next_t.height
+
         # 현재 테이블 하단과 다음 테이블 상단 간격
-        current_bottom = current.y + current.height
-        gap = next_t.y - current_bottom
-        
+        gap = ny - (cur_y + cur_h)
+
         # 수평 겹침 계산
-        x1 = max(current.x, next_t.x)
-        x2 = min(current.x + current.width, next_t.x + next_t.width)
+        x1 = max(cur_x, nx)
+        x2 = min(cur_x + cur_w, nx + nw)
         overlap = max(0, x2 - x1)
-        min_width = min(current.width, next_t.width) if min(current.width, next_t.width) > 0 else 1
-        
+        min_width = min(cur_w, nw) if min(cur_w, nw) > 0 else 1
+
         # 병합 조건:
         # 1. 수평 70% 이상 겹침
         # 2. 수직 간격 50pt 이내 (과도한 병합 방지)
@@ -390,64 +493,85 @@ def _stitch_tables(tables: List[Table], debug: bool = False) -> List[Table]:
         is_gap_ok = -30 < gap < 50
         is_same_cols = current.cols == next_t.cols
         is_gap_ok_relaxed = -30 < gap < 70
-        
+
         should_merge = is_overlap and (is_gap_ok or (is_same_cols and is_gap_ok_relaxed))
-        
+
         if should_merge:
             if debug:
                 print(f"[Stitch] 병합: {current.rows}x{current.cols} + {next_t.rows}x{next_t.cols}, gap={gap:.1f}")
-            
+
             # 행 번호 오프셋
             row_offset = current.rows
             for cell in next_t.cells:
                 cell.row += row_offset
-            
+
             current.cells.extend(next_t.cells)
             current.rows += next_t.rows
             current.cols = max(current.cols, next_t.cols)
-            
-            # 바운딩 박스 업데이트
-            new_top = min(current.y, next_t.y)
-            new_bottom = max(current.y + current.height, next_t.y + next_t.height)
-            new_left = min(current.x, next_t.x)
-            new_right = max(current.x + current.width, next_t.x + next_t.width)
-            
-            current.y = new_top
-            current.height = new_bottom - new_top
-            current.x = new_left
-            current.width = new_right - new_left
+
+            # 바운딩 박스 업데이트 (로컬 값만 갱신, 확정 시점에 한 번 기록)
+            new_top = min(cur_y, ny)
+            new_bottom = max(cur_y + cur_h, ny + nh)
+            new_left = min(cur_x, nx)
+            new_right = max(cur_x + cur_w, nx + nw)
+
+            cur_y = new_top
+            cur_h = new_bottom - new_top
+            cur_x = new_left
+            cur_w = new_right - new_left
         else:
+            current.x, current.y = cur_x, cur_y
+            current.width, current.height = cur_w, cur_h
             merged.append(current)
             current = next_t
-    
+            cur_x, cur_y, cur_w, cur_h = nx, ny, nw, nh
+
+    current.x, current.y = cur_x, cur_y
+    current.width, current.height = cur_w, cur_h
     merged.append(current)
     return merged
 
 
 def _is_valid_table(table: Table, min_rows: int, min_cols: int) -> bool:
-    """테이블 유효성 검증"""
+    """테이블 유효성 검증 (싼 검사부터 순서대로 - 대부분 앞에서 탈락)"""
     # 1. 최소 크기
     if table.rows < min_rows or table.cols < min_cols:
         return False
-    
-    # 2. 셀 채움률 (10% 이상)
-    non_empty = sum(1 for c in table.cells if c.text.strip())
-    total = table.rows * table.cols
-    if total > 6 and non_empty < total * 0.1:
+
+    # 2. 단일 열 필터링 (가짜 테이블)
+    if table.cols == 1:
         return False
-    
-    # 3. 과도한 텍스트 (셀당 500자 이하)
-    max_len = max((len(c.text) for c in table.cells), default=0)
+
+    # 3. 셀 채움률/최대 길이 - 셀 목록을 한 번만 순회
+    non_empty = 0
+    max_len = 0
+    for c in table.cells:
+        text = c.text
+        if len(text) > max_len:
+            max_len = len(text)
+        if text.strip():
+            non_empty += 1
+
+    # 과도한 텍스트 (셀당 500자 이하)
     if max_len > 500:
         return False
-    
-    # 4. 단일 열 필터링 (가짜 테이블)
-    if table.cols == 1:
+
+    # 셀 채움률 (10% 이상)
+    total = table.rows * table.cols
+    if total > 6 and non_empty < total * 0.1:
         return False
-    
+
+    # 4. 빈 셀 비율이 너무 높은 테이블 (70% 이상 빈 셀)
+    if total > 0:
+        empty_ratio = 1 - (non_empty / total)
+        if empty_ratio > 0.7 and table.rows > 3:
+            return False
+
+    # 그리드가 필요한 검사는 마지막에, to_list는 한 번만 호출
+    grid = table.to_list() if table.rows <= 4 else None
+
     # 5. 소규모 테이블(2-4행)에서 문장 분할 오탐 감지
-    if table.rows <= 4:
-        grid = table.to_list()
+    if grid is not None:
         sentence_rows = 0
         single_cell_rows = 0
         non_empty_rows = 0
@@ -472,18 +596,11 @@ def _is_valid_table(table: Table, min_rows: int, min_cols: int) -> bool:
             bad_rows = sentence_rows + single_cell_rows
             if bad_rows >= non_empty_rows * 0.6:
                 return False
-    
-    # 6. 빈 셀 비율이 너무 높은 테이블 (70% 이상 빈 셀)
-    if total > 0:
-        empty_ratio = 1 - (non_empty / total)
-        if empty_ratio > 0.7 and table.rows > 3:
-            return False
-    
-    # 7. 소규모 테이블(2-3행)에서 모든 셀이 긴 서술형 텍스트이면 표가 아님
+
+    # 6. 소규모 테이블(2-3행)에서 모든 셀이 긴 서술형 텍스트이면 표가 아님
     #    진짜 표: 헤더가 짧거나 숫자/코드/키워드 셀이 있음
     #    가짜 표: 모든 셀이 긴 한국어 문장 조각
     if table.rows <= 3 and table.cols == 2:
-        grid = table.to_list()
         all_prose = True
         for row in grid:
             for cell in row:
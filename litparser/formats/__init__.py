@@ -22,11 +22,27 @@ from .pptx_parser import parse_pptx, PptxDocument
 from .xlsx_parser import parse_xlsx, XlsxDocument
 from .hwpx_parser import parse_hwpx, HwpxDocument
 
-# Legacy parsers
-from .doc_parser import parse_doc, DocDocument
-from .ppt_parser import parse_ppt, PptDocument
-from .xls_parser import parse_xls, XlsDocument
-from .hwp_parser import parse_hwp, HwpDocument
+# Legacy parsers (OLE2 바이너리) - 실제 사용 시점까지 임포트 지연 (PEP 562)
+_LEGACY_EXPORTS = {
+    'parse_doc': 'doc_parser', 'DocDocument': 'doc_parser',
+    'parse_ppt': 'ppt_parser', 'PptDocument': 'ppt_parser',
+    'parse_xls': 'xls_parser', 'XlsDocument': 'xls_parser',
+    'parse_hwp': 'hwp_parser', 'HwpDocument': 'hwp_parser',
+}
+
+
+def __getattr__(name):
+    module_name = _LEGACY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module('.' + module_name, __name__), name)
+    globals()[name] = value  # 이후 접근은 일반 속성 조회로
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LEGACY_EXPORTS))
 
 __all__ = [
     # Text
@@ -13,6 +13,7 @@ WordDocument 스트림:
   - 텍스트는 clx 구조로 위치 지정
 """
 
+import re
 import struct
 from dataclasses import dataclass, field
 from typing import List, Optional, Union, Tuple
@@ -200,106 +201,118 @@ def _extract_text(word_doc: bytes, fib: dict, table_stream: bytes) -> str:
         # ccpText가 0이면 전체 스캔
         return _scan_text(word_doc)
     
-    # 텍스트 영역 읽기 시도
-    try:
-        # Unicode 시도
-        text_data = word_doc[fc_min:fc_min + ccp_text * 2]
-        text = text_data.decode('utf-16le', errors='ignore')
-        text = _clean_text(text)
-        if text:
-            return text
-    except Exception:
-        pass
-    
-    # ANSI 시도
-    try:
-        text_data = word_doc[fc_min:fc_min + ccp_text]
-        text = text_data.decode('cp1252', errors='ignore')
-        text = _clean_text(text)
-        if text:
-            return text
-    except Exception:
-        pass
-    
+    # 텍스트 영역 읽기 시도 - Unicode 먼저, 다음 ANSI
+    text = _try_decode(word_doc[fc_min:fc_min + ccp_text * 2],
+                       'utf-16le', min_len=0)
+    if text is None:
+        text = _try_decode(word_doc[fc_min:fc_min + ccp_text],
+                           'cp1252', min_len=0)
+    if text is not None:
+        return text
+
     # 폴백: 전체 스캔
     return _scan_text(word_doc)
 
 
-def _scan_text(data: bytes) -> str:
-    """전체 데이터에서 텍스트 스캔"""
-    # 여러 인코딩 시도
-    
-    # UTF-16LE 시도 (Word 97+)
-    try:
-        # 텍스트로 보이는 영역 찾기
-        text = data.decode('utf-16le', errors='ignore')
-        text = _clean_text(text)
-        if len(text) > 100:  # 충분한 텍스트
-            return text
-    except Exception:
-        pass
-    
-    # CP1252 시도 (ANSI)
-    try:
-        text = data.decode('cp1252', errors='ignore')
-        text = _clean_text(text)
-        if len(text) > 100:
-            return text
-    except Exception:
-        pass
-    
-    # CP949 시도 (한글)
+# 인코딩 추정용 프리픽스 크기
+_ENC_PROBE_SIZE = 4096
+
+
+def _detect_encoding(data: bytes) -> List[str]:
+    """프리픽스 바이트 분포로 유력한 인코딩 순서 추정
+
+    전체 스트림을 인코딩마다 디코딩+정리하면 수 MB 문서에서 같은 버퍼를
+    최대 3번 훑게 됨. 4KB만 보고 순서를 정하면 대부분 첫 후보에서 끝남:
+    - UTF-16LE 텍스트는 홀수 인덱스 바이트가 대부분 0 (ASCII/한글 모두)
+    - cp949 한글 본문은 고위(0x80+) 바이트 비중이 높음
+    """
+    probe = data[:_ENC_PROBE_SIZE]
+    if not probe:
+        return ['utf-16le', 'cp1252', 'cp949']
+
+    # UTF-16LE 판정은 공백 문자의 바이트 서명으로: UTF-16LE 공백은
+    # "20 00", 8비트 인코딩 공백은 "20" 뒤에 0이 아닌 바이트.
+    # cp949 2바이트 문자에는 0x00이 아예 등장하지 않으므로 혼동이 없음
+    sp16 = probe.count(b' \x00')
+    sp8 = probe.count(b' ') - sp16
+    if sp16 > sp8:
+        return ['utf-16le', 'cp1252', 'cp949']
+
+    # 공백 서명이 없으면 보조 지표 - ASCII 위주 UTF-16LE는 홀수
+    # 인덱스 바이트가 대부분 0
+    odd = probe[1::2]
+    if odd and odd.count(0) * 3 >= len(odd):
+        return ['utf-16le', 'cp1252', 'cp949']
+
+    # 고위 바이트 비중이 높으면 멀티바이트 한글(cp949) 가능성
+    high = sum(1 for b in probe if b >= 0x80)
+    if high * 4 >= len(probe):
+        return ['cp949', 'cp1252', 'utf-16le']
+
+    return ['cp1252', 'cp949', 'utf-16le']
+
+
+# 후보 인코딩 평가용 윈도우 - 100자 문턱 판정에는 앞부분이면 충분
+_SCAN_WINDOW = 65536
+
+
+def _try_decode(data: bytes, encoding: str,
+                min_len: int = 100) -> Optional[str]:
+    """디코딩+정리 후 텍스트가 min_len자를 넘으면 반환, 아니면 None"""
     try:
-        text = data.decode('cp949', errors='ignore')
-        text = _clean_text(text)
-        if len(text) > 100:
-            return text
+        text = _clean_text(data.decode(encoding, errors='ignore'))
     except Exception:
-        pass
-    
+        return None
+    return text if len(text) > min_len else None
+
+
+def _scan_text(data: bytes) -> str:
+    """전체 데이터에서 텍스트 스캔"""
+    # 작은 버퍼는 곧장 전체 디코딩
+    if len(data) <= _SCAN_WINDOW:
+        for enc in _detect_encoding(data):
+            text = _try_decode(data, enc)
+            if text is not None:
+                return text
+        return ""
+
+    # 큰 버퍼는 64KB 윈도우에서 후보를 판정하고, 전체 디코딩+정리는
+    # 승자 인코딩으로 한 번만 수행 (수 MB 스트림을 3번 훑지 않음)
+    window = data[:_SCAN_WINDOW]
+    for enc in _detect_encoding(data):
+        if _try_decode(window, enc) is not None:
+            text = _try_decode(data, enc)
+            if text is not None:
+                return text
+
     return ""
 
 
+# _clean_text용 변환 테이블. 32 이상은 전부 그대로 통과하므로
+# (한글/한자/확장 문자 분기는 모두 "유지"로 귀결) 제어 문자만 매핑하면 됨:
+# 7(셀 구분)/9 → 탭, 10/11(강제 줄바꿈)/12(페이지)/14(열 나누기) → 줄바꿈,
+# 13(문단 끝) → CR 유지, 나머지 제어 문자는 삭제
+# 리스트 테이블이면 범위 밖(>=32) 조회는 IndexError로 "그대로 유지" 처리가
+# 되어 딕셔너리 해싱 없이 인덱싱만 남음
+_CLEAN_TABLE = [None] * 32
+for _code, _repl in ((7, '\t'), (9, '\t'), (10, '\n'), (11, '\n'),
+                     (12, '\n'), (14, '\n'), (13, '\r')):
+    _CLEAN_TABLE[_code] = ord(_repl)
+del _code, _repl
+
+# 변환/삭제 대상 제어 문자 (탭·줄바꿈·CR은 자기 자신으로 매핑되므로 제외)
+_RE_CTRL = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
 def _clean_text(text: str) -> str:
     """텍스트 정리"""
-    result = []
-    
-    for char in text:
-        code = ord(char)
-        
-        # 제어 문자 처리
-        if code == 0:
-            continue
-        elif code == 7:  # 셀 구분
-            result.append('\t')
-        elif code == 9:  # 탭
-            result.append('\t')
-        elif code == 10:  # 줄바꿈
-            result.append('\n')
-        elif code == 11:  # 강제 줄바꿈
-            result.append('\n')
-        elif code == 12:  # 페이지 나누기
-            result.append('\n')
-        elif code == 13:  # 문단 끝
-            result.append('\r')
-        elif code == 14:  # 열 나누기
-            result.append('\n')
-        elif code < 32:  # 기타 제어 문자
-            continue
-        elif code >= 32 and code < 127:  # ASCII
-            result.append(char)
-        elif code >= 0xAC00 and code <= 0xD7A3:  # 한글
-            result.append(char)
-        elif code >= 0x4E00 and code <= 0x9FFF:  # 한자
-            result.append(char)
-        elif code >= 0x3000 and code <= 0x303F:  # CJK 구두점
-            result.append(char)
-        elif code >= 0xFF00 and code <= 0xFFEF:  # 전각 문자
-            result.append(char)
-        elif code >= 127:  # 확장 문자
-            result.append(char)
-    
-    return ''.join(result)
+    # 변환할 제어 문자가 하나도 없으면 (제대로 디코딩된 텍스트의 흔한
+    # 경우) 복사 없이 그대로 반환 - C 레벨 스캔 한 번이 전부
+    if _RE_CTRL.search(text) is None:
+        return text
+    # str.translate는 C 레벨에서 한 번에 처리 - 문자마다 Python 분기
+    # 사다리를 타는 것보다 수십 배 빠름
+    return text.translate(_CLEAN_TABLE)
 
 
 def _parse_summary(data: bytes) -> Tuple[str, str]:
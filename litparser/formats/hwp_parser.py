@@ -6,8 +6,11 @@ HWP Parser - 한글 5.0+ 바이너리 포맷 (.hwp)
 순수 Python 구현 - 외부 라이브러리 없음
 """
 
+import mmap
 import struct
+import sys
 import zlib
+from array import array
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Union
 
@@ -22,44 +25,55 @@ HWPTAG_CTRL_HEADER = HWPTAG_BEGIN + 55   # 71
 HWPTAG_LIST_HEADER = HWPTAG_BEGIN + 56   # 72
 HWPTAG_TABLE = HWPTAG_BEGIN + 61         # 77
 
-# HWP 제어 문자별 추가 데이터 길이 (바이트)
-CTRL_EXTRA_BYTES = {
-    0: 0,   # NULL
-    1: 0,   # reserved
-    2: 12,  # section/column define
-    3: 12,  # field start
-    4: 0,   # field end
-    5: 12,  # reserved
-    6: 12,  # reserved
-    7: 12,  # reserved
-    8: 12,  # title mark
-    9: 2,   # tab
-    10: 0,  # line break
-    11: 12, # drawing object
-    12: 12, # reserved
-    13: 0,  # paragraph end
-    14: 12, # reserved
-    15: 12, # hidden comment
-    16: 12, # header/footer
-    17: 12, # footnote/endnote
-    18: 12, # auto number
-    19: 12, # reserved
-    20: 12, # reserved
-    21: 12, # page control
-    22: 12, # bookmark
-    23: 12, # dutmal/glossary
-    24: 2,  # form object
-    25: 12, # hyphen
-    26: 12, # reserved
-    27: 12, # reserved
-    28: 12, # reserved
-    29: 12, # reserved
-    30: 0,  # non-break space
-    31: 12, # reserved
-}
+# HWP 제어 문자(0~31)별 추가 데이터 길이 (바이트)
+# 코드값으로 직접 인덱싱하는 tuple - dict 해시 조회보다 빠름
+_CTRL_EXTRA = (
+    0,   # 0: NULL
+    0,   # 1: reserved
+    12,  # 2: section/column define
+    12,  # 3: field start
+    0,   # 4: field end
+    12,  # 5: reserved
+    12,  # 6: reserved
+    12,  # 7: reserved
+    12,  # 8: title mark
+    2,   # 9: tab
+    0,   # 10: line break
+    12,  # 11: drawing object
+    12,  # 12: reserved
+    0,   # 13: paragraph end
+    12,  # 14: reserved
+    12,  # 15: hidden comment
+    12,  # 16: header/footer
+    12,  # 17: footnote/endnote
+    12,  # 18: auto number
+    12,  # 19: reserved
+    12,  # 20: reserved
+    12,  # 21: page control
+    12,  # 22: bookmark
+    12,  # 23: dutmal/glossary
+    2,   # 24: form object
+    12,  # 25: hyphen
+    12,  # 26: reserved
+    12,  # 27: reserved
+    12,  # 28: reserved
+    12,  # 29: reserved
+    0,   # 30: non-break space
+    12,  # 31: reserved
+)
 
 
-@dataclass
+# 헤딩 레벨별 마크다운 접두사 ('#' * n 반복 생성 방지)
+_HEADING_PREFIX = tuple('#' * i + ' ' if i else '' for i in range(10))
+
+# 3.10+에서는 __dict__ 없는 인스턴스로 레코드당 메모리 절감 (3.8 호환 유지)
+if sys.version_info >= (3, 10):
+    _record = dataclass(slots=True)
+else:
+    _record = dataclass
+
+
+@_record
 class HwpParagraph:
     """HWP 문단"""
     text: str = ""
@@ -67,7 +81,7 @@ class HwpParagraph:
     heading_level: int = 0
 
 
-@dataclass 
+@_record
 class HwpTable:
     """HWP 테이블"""
     rows: List[List[str]] = field(default_factory=list)
@@ -75,19 +89,20 @@ class HwpTable:
     def to_markdown(self) -> str:
         if not self.rows:
             return ""
-        
-        max_cols = max(len(r) for r in self.rows) if self.rows else 0
+
+        max_cols = max(len(r) for r in self.rows)
         if max_cols == 0:
             return ""
-        
-        lines = []
-        header = self.rows[0] + [''] * (max_cols - len(self.rows[0]))
-        lines.append("| " + " | ".join(str(c) for c in header) + " |")
-        lines.append("| " + " | ".join("---" for _ in range(max_cols)) + " |")
-        for row in self.rows[1:]:
-            row = row + [''] * (max_cols - len(row))
-            lines.append("| " + " | ".join(str(c) for c in row) + " |")
-        
+
+        # 셀은 이미 str - str() 변환과 행별 임시 리스트 생성을 피함
+        def fmt(row):
+            if len(row) < max_cols:
+                row = row + [''] * (max_cols - len(row))
+            return "| " + " | ".join(row) + " |"
+
+        sep = "| " + " | ".join(["---"] * max_cols) + " |"
+        lines = [fmt(self.rows[0]), sep]
+        lines += [fmt(r) for r in self.rows[1:]]
         return "\n".join(lines)
 
 
@@ -114,12 +129,14 @@ class HwpDocument:
         """전체 텍스트"""
         lines = []
         for p in self.paragraphs:
-            if p.text.strip():
-                if p.is_heading and p.heading_level:
-                    prefix = '#' * p.heading_level + ' '
-                    lines.append(prefix + p.text)
+            text = p.text
+            if text.strip():
+                level = p.heading_level
+                if p.is_heading and level:
+                    prefix = _HEADING_PREFIX[level] if level < 10 else '#' * level + ' '
+                    lines.append(prefix + text)
                 else:
-                    lines.append(p.text)
+                    lines.append(text)
         return '\n\n'.join(lines)
     
     def get_headings(self) -> List[Tuple[int, str]]:
@@ -128,57 +145,129 @@ class HwpDocument:
 
 
 # 태그 레코드
-@dataclass
+@_record
 class TagRecord:
     tag_id: int
     level: int
     data: bytes
 
 
+# 자주 쓰는 Struct는 모듈 로드 시 한 번만 컴파일
+_UINT32 = struct.Struct('<I')
+_UINT16_PAIR = struct.Struct('<HH')
+
+# 압축 해제 시 입력을 나눠 넣는 청크 크기
+_DECOMP_CHUNK = 256 * 1024
+
+
+def _decompress_stream(data: bytes) -> Optional[bytes]:
+    """
+    HWP 스트림 압축 해제 (raw deflate 우선, zlib 헤더 폴백)
+
+    decompressobj에 입력을 청크 단위로 넣고 max_length로 호출당 출력도
+    제한 - 한 번에 큰 버퍼를 반복 재할당하지 않아 피크 메모리가 줄어듦
+    """
+    for wbits in (-15, zlib.MAX_WBITS):
+        decomp = zlib.decompressobj(wbits)
+        chunks = []
+        try:
+            for start in range(0, len(data), _DECOMP_CHUNK):
+                piece = data[start:start + _DECOMP_CHUNK]
+                while piece:
+                    chunks.append(decomp.decompress(piece, _DECOMP_CHUNK))
+                    piece = decomp.unconsumed_tail
+            chunks.append(decomp.flush())
+        except zlib.error:
+            continue
+        return b''.join(chunks)
+    return None
+
+
 def _decode_text(data: bytes) -> str:
     """HWP PARA_TEXT 디코딩 - 제어 문자 처리"""
-    text_chars = []
+    n = len(data) & ~1
+    if n == 0:
+        return ''
+
+    # PARA_TEXT는 결국 전부 디코딩되므로 bytes로 한 번만 확정
+    if not isinstance(data, bytes):
+        data = bytes(data[:n])
+    elif len(data) != n:
+        data = data[:n]
+
+    # uint16 코드 뷰로 한 번에 변환 - 문자마다 struct.unpack 하지 않음
+    # (HWP는 리틀엔디언)
+    if sys.byteorder == 'little':
+        codes = memoryview(data).cast('H')
+    else:
+        codes = array('H', data)
+        codes.byteswap()
+
+    # 제어 문자가 전혀 없는 레코드(대부분)는 C 레벨에서 한 번에 디코딩
+    if min(codes) >= 32:
+        return data.decode('utf-16-le', 'ignore').strip()
+
+    # 제어 문자가 섞인 경우: UTF-16LE 바이트를 bytearray에 모아 마지막에
+    # 한 번만 디코딩 (run별 str 생성 + join 제거)
+    out = bytearray()
+    extra = _CTRL_EXTRA
     i = 0
-    
-    while i < len(data) - 1:
-        char_code = struct.unpack('<H', data[i:i+2])[0]
-        
-        if char_code == 0:  # NULL
-            i += 2
+    run_start = 0
+    count = len(codes)
+
+    while i < count:
+        char_code = codes[i]
+
+        if char_code >= 32:
+            i += 1
             continue
-        elif char_code < 32:  # 제어 문자
-            extra = CTRL_EXTRA_BYTES.get(char_code, 12)
-            i += 2 + extra
-            
-            if char_code in (10, 13):  # line break, paragraph end
-                text_chars.append('\n')
-            elif char_code == 9:  # tab
-                text_chars.append('\t')
-        else:
-            text_chars.append(chr(char_code))
-            i += 2
-    
-    return ''.join(text_chars).strip()
+
+        # 직전 일반 구간을 그대로 복사
+        if run_start < i:
+            out += data[run_start * 2:i * 2]
+
+        if char_code == 10 or char_code == 13:  # line break, paragraph end
+            out += b'\n\x00'
+        elif char_code == 9:  # tab
+            out += b'\t\x00'
+        # 제어 문자 + 추가 데이터는 uint16 단위로 건너뜀 (NULL은 extra 0)
+        i += 1 + (extra[char_code] >> 1)
+        run_start = i
+
+    if run_start < count:
+        out += data[run_start * 2:count * 2]
+
+    return out.decode('utf-16-le', 'ignore').strip()
 
 
 def _parse_tag_records(data: bytes) -> List[TagRecord]:
-    """바이너리 데이터에서 태그 레코드 목록 추출"""
+    """바이너리 데이터에서 태그 레코드 목록 추출
+
+    레코드 payload는 원본 버퍼의 memoryview 슬라이스 - 실제로 읽는
+    레코드(PARA_TEXT 등)만 나중에 bytes로 구체화됨
+    """
+    if isinstance(data, bytes):
+        data = memoryview(data)
+
     records = []
+    append = records.append
+    record = TagRecord
     pos = 0
     size = len(data)
-    
+    unpack_u32 = _UINT32.unpack_from  # 4바이트 슬라이스 복사 없이 제자리 해석
+
     while pos + 4 <= size:
-        header = struct.unpack('<I', data[pos:pos+4])[0]
+        header = unpack_u32(data, pos)[0]
         pos += 4
-        
+
         tag_id = header & 0x3FF
         level = (header >> 10) & 0x3FF
         rec_len = (header >> 20) & 0xFFF
-        
+
         if rec_len == 0xFFF:
             if pos + 4 > size:
                 break
-            rec_len = struct.unpack('<I', data[pos:pos+4])[0]
+            rec_len = unpack_u32(data, pos)[0]
             pos += 4
         
         if pos + rec_len > size:
@@ -186,111 +275,109 @@ def _parse_tag_records(data: bytes) -> List[TagRecord]:
         
         rec_data = data[pos:pos + rec_len]
         pos += rec_len
-        
-        records.append(TagRecord(tag_id=tag_id, level=level, data=rec_data))
-    
+
+        append(record(tag_id, level, rec_data))
+
     return records
 
 
+def _parse_table_at(records: List[TagRecord], ti: int) -> Tuple[int, Optional[HwpTable]]:
+    """
+    HWPTAG_TABLE 레코드(ti)에서 시작하는 테이블 하나를 파싱
+
+    Returns:
+        (테이블 범위 다음의 record index, HwpTable 또는 None)
+    """
+    rec = records[ti]
+    tbl_level = rec.level
+
+    if len(rec.data) < 8:
+        return ti + 1, None
+    n_rows, n_cols = _UINT16_PAIR.unpack_from(rec.data, 4)
+
+    if n_rows == 0 or n_cols == 0 or n_rows > 500 or n_cols > 100:
+        return ti + 1, None
+
+    # 테이블 끝 위치와 셀 텍스트 수집
+    cell_texts = []
+    current_cell = []
+    end_idx = ti
+
+    for j in range(ti + 1, len(records)):
+        r2 = records[j]
+
+        if r2.tag_id == HWPTAG_TABLE:
+            break
+        if r2.tag_id == HWPTAG_CTRL_HEADER and r2.level <= tbl_level - 1:
+            break
+        if r2.level < tbl_level:
+            break
+
+        end_idx = j
+
+        if r2.tag_id == HWPTAG_LIST_HEADER and r2.level == tbl_level:
+            if current_cell:
+                cell_texts.append('\n'.join(current_cell))
+            current_cell = []
+        elif r2.tag_id == HWPTAG_PARA_TEXT:
+            text = _decode_text(r2.data).strip()
+            if text:
+                current_cell.append(text)
+
+    if current_cell:
+        cell_texts.append('\n'.join(current_cell))
+
+    # 행/열 재구성 - 한 번 패딩 후 행 단위 슬라이스 (셀별 인덱스 검사 제거)
+    total = n_rows * n_cols
+    if len(cell_texts) < total:
+        cell_texts.extend([""] * (total - len(cell_texts)))
+
+    table = HwpTable()
+    table.rows = [cell_texts[r * n_cols:(r + 1) * n_cols] for r in range(n_rows)]
+
+    return end_idx + 1, table
+
+
 def _extract_paragraphs_and_tables(records: List[TagRecord]) -> Tuple[List[HwpParagraph], List[HwpTable]]:
     """
-    태그 레코드에서 문단과 테이블을 문서 순서대로 추출
-    
+    태그 레코드에서 문단과 테이블을 문서 순서대로 추출 (단일 패스)
+
     테이블 내부의 PARA_TEXT는 테이블로만 추출하고,
     테이블 외부의 PARA_TEXT는 일반 문단으로 추출
     """
     paragraphs = []
     tables = []
-    
-    # 먼저 테이블 범위 (시작~끝 record index) 파악
-    table_ranges = []  # (start_idx, end_idx, HwpTable)
-    table_indices = [i for i, r in enumerate(records) if r.tag_id == HWPTAG_TABLE]
-    
-    for ti in table_indices:
-        rec = records[ti]
-        tbl_level = rec.level
-        
-        if len(rec.data) < 8:
-            continue
-        n_rows = struct.unpack('<H', rec.data[4:6])[0]
-        n_cols = struct.unpack('<H', rec.data[6:8])[0]
-        
-        if n_rows == 0 or n_cols == 0 or n_rows > 500 or n_cols > 100:
-            continue
-        
-        # 테이블 끝 위치와 셀 텍스트 수집
-        cell_texts = []
-        current_cell = []
-        end_idx = ti
-        
-        for j in range(ti + 1, len(records)):
-            r2 = records[j]
-            
-            if r2.tag_id == HWPTAG_TABLE:
-                break
-            if r2.tag_id == HWPTAG_CTRL_HEADER and r2.level <= tbl_level - 1:
-                break
-            if r2.level < tbl_level:
-                break
-            
-            end_idx = j
-            
-            if r2.tag_id == HWPTAG_LIST_HEADER and r2.level == tbl_level:
-                if current_cell:
-                    cell_texts.append('\n'.join(current_cell))
-                current_cell = []
-            elif r2.tag_id == HWPTAG_PARA_TEXT:
-                text = _decode_text(r2.data)
-                if text.strip():
-                    current_cell.append(text.strip())
-        
-        if current_cell:
-            cell_texts.append('\n'.join(current_cell))
-        
-        # 행/열 재구성
-        table = HwpTable()
-        for r in range(n_rows):
-            row = []
-            for c in range(n_cols):
-                idx = r * n_cols + c
-                row.append(cell_texts[idx] if idx < len(cell_texts) else "")
-            table.rows.append(row)
-        
-        if table.rows:
-            table_ranges.append((ti, end_idx, table))
-    
-    # 테이블 범위에 속하는 record index 집합
-    in_table = set()
-    for start, end, _ in table_ranges:
-        for i in range(start, end + 1):
-            in_table.add(i)
-    
-    # 문서 순서대로 문단/테이블 출력
-    added_tables = set()
-    for i, rec in enumerate(records):
-        # 테이블 시작이면 테이블 추가
-        for start, end, table in table_ranges:
-            if i == start and start not in added_tables:
-                added_tables.add(start)
+    n = len(records)
+    i = 0
+    tag_table = HWPTAG_TABLE
+    tag_para = HWPTAG_PARA_TEXT
+
+    while i < n:
+        rec = records[i]
+
+        # 테이블 시작이면 테이블 전체를 소비
+        # (테이블이 없는 섹션은 이 분기를 전혀 타지 않음 - 별도 사전 스캔 불필요)
+        if rec.tag_id == tag_table:
+            next_i, table = _parse_table_at(records, i)
+            if table is not None:
                 tables.append(table)
                 # 테이블 내용을 문단으로도 추가 (텍스트 추출용)
                 for row in table.rows:
-                    texts = [c.replace('\n', ' ').strip() for c in row if c.strip()]
+                    texts = [s for s in (c.replace('\n', ' ').strip() for c in row) if s]
                     if texts:
-                        combined = ' '.join(texts)
-                        paragraphs.append(HwpParagraph(text=combined))
-                break
-        
-        # 테이블 범위 내 레코드는 스킵 (이미 테이블로 처리됨)
-        if i in in_table:
+                        paragraphs.append(HwpParagraph(text=' '.join(texts)))
+                i = next_i  # 테이블 범위 내 레코드는 스킵 (이미 테이블로 처리됨)
+                continue
+            i = next_i
             continue
-        
-        # 일반 PARA_TEXT
-        if rec.tag_id == HWPTAG_PARA_TEXT and rec.data:
+
+        # 일반 PARA_TEXT (_decode_text가 이미 strip된 결과를 반환)
+        if rec.tag_id == tag_para and rec.data:
             text = _decode_text(rec.data)
-            if text.strip():
+            if text:
                 paragraphs.append(HwpParagraph(text=text))
-    
+        i += 1
+
     return paragraphs, tables
 
 
@@ -298,28 +385,50 @@ class HwpParser:
     """HWP 파일 파서"""
     
     def __init__(self, filepath_or_bytes: Union[str, bytes]):
+        self._mmap: Optional[mmap.mmap] = None
         if isinstance(filepath_or_bytes, str):
+            # 파일 전체를 읽어들이지 않고 mmap으로 매핑 - 실제로 접근하는
+            # 페이지만 메모리에 올라옴 (대용량 HWP에서 RSS 절감)
             with open(filepath_or_bytes, 'rb') as f:
-                data = f.read()
+                try:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    data = self._mmap
+                except (ValueError, OSError):  # 빈 파일 등 mmap 불가
+                    f.seek(0)
+                    data = f.read()
         else:
             data = filepath_or_bytes
-        
+
         if not is_ole2_file(data):
+            self.close()
             raise ValueError("OLE2 형식이 아님 - HWP 파일이 아닐 수 있음")
-        
+
         self.ole = OLE2Reader(data)
         self.doc = HwpDocument()
         self.is_compressed = True
-    
+
+    def close(self):
+        """mmap 매핑 해제 (bytes 입력이면 no-op)"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
     def parse(self) -> HwpDocument:
-        """HWP 파일 파싱"""
-        if not self._validate_header():
-            raise ValueError("유효한 HWP 5.0 파일이 아님")
-        
-        self._parse_body_text()
-        self._extract_images()
-        self._parse_metadata()
-        
+        """HWP 파일 파싱
+
+        스트림 내용은 파싱 과정에서 모두 bytes로 복사되므로,
+        끝나면 mmap은 바로 닫아도 안전함
+        """
+        try:
+            if not self._validate_header():
+                raise ValueError("유효한 HWP 5.0 파일이 아님")
+
+            self._parse_body_text()
+            self._extract_images()
+            self._parse_metadata()
+        finally:
+            self.close()
+
         return self.doc
     
     def _validate_header(self) -> bool:
@@ -333,7 +442,7 @@ class HwpParser:
             return False
         
         if len(header) >= 40:
-            properties = struct.unpack('<I', header[36:40])[0]
+            properties = _UINT32.unpack_from(header, 36)[0]
             self.is_compressed = bool(properties & 0x01)
             is_encrypted = bool(properties & 0x02)
             
@@ -366,15 +475,11 @@ class HwpParser:
     def _parse_section(self, data: bytes):
         """섹션 파싱 - 문단 + 테이블"""
         if self.is_compressed:
-            try:
-                data = zlib.decompress(data, -15)
-            except zlib.error:
-                try:
-                    data = zlib.decompress(data)
-                except zlib.error:
-                    return
+            data = _decompress_stream(data)
+            if data is None:
+                return
         
-        # 태그 레코드 파싱
+        # 태그 레코드 파싱 (레코드 payload는 zero-copy 뷰)
         records = _parse_tag_records(data)
         
         # 문단 + 테이블 추출
@@ -12,12 +12,24 @@ HWPX = ZIP 파일 (OWPML 표준)
   Preview/PrvImage.png  <- 미리보기
 """
 
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional
 from io import BytesIO
-import re
+
+# lxml이 설치돼 있으면 C 구현으로 파싱 가속 (선택 사항 - 없어도 동작 동일)
+try:
+    from lxml import etree as _lxml_etree
+    _fromstring = _lxml_etree.fromstring
+    _XMLParseError = _lxml_etree.XMLSyntaxError
+except ImportError:
+    _lxml_etree = None
+    _fromstring = ET.fromstring
+    _XMLParseError = ET.ParseError
+
+_iterparse = _lxml_etree.iterparse if _lxml_etree is not None else ET.iterparse
 
 
 # HWPX 네임스페이스
@@ -31,7 +43,17 @@ NS = {
 }
 
 
-@dataclass
+# 헤딩 레벨별 마크다운 접두사 ('#' * n 반복 생성 방지)
+_HEADING_PREFIX = tuple('#' * i + ' ' if i else '' for i in range(10))
+
+# 3.10+에서는 __dict__ 없는 인스턴스로 레코드당 메모리 절감 (3.8 호환 유지)
+if sys.version_info >= (3, 10):
+    _record = dataclass(slots=True)
+else:
+    _record = dataclass
+
+
+@_record
 class HwpxParagraph:
     """문단"""
     text: str
@@ -40,39 +62,68 @@ class HwpxParagraph:
     heading_level: int = 0
 
 
-@dataclass
+@_record
 class HwpxTable:
     """테이블"""
     rows: List[List[str]] = field(default_factory=list)
+
+    # _parse_table이 셀을 추가하면서 채우는 판별용 카운터 (-1 = 미계산)
+    _non_empty: int = field(default=-1, repr=False)
+    _total: int = field(default=-1, repr=False)
+    _max_cols: int = field(default=-1, repr=False)
     
     def to_markdown(self) -> str:
         if not self.rows:
             return ""
-        lines = []
-        max_cols = max(len(row) for row in self.rows) if self.rows else 0
-        
+
+        max_cols = max(len(row) for row in self.rows)
         if max_cols == 0:
             return ""
-        
-        # 헤더
-        header = self.rows[0] + [''] * (max_cols - len(self.rows[0]))
-        lines.append('| ' + ' | '.join(header) + ' |')
-        lines.append('| ' + ' | '.join(['---'] * max_cols) + ' |')
-        
-        # 본문
-        for row in self.rows[1:]:
-            row = row + [''] * (max_cols - len(row))
-            lines.append('| ' + ' | '.join(row) + ' |')
-        
+
+        # 행별 임시 패딩 리스트 생성은 열 수가 모자랄 때만
+        def fmt(row):
+            if len(row) < max_cols:
+                row = row + [''] * (max_cols - len(row))
+            return '| ' + ' | '.join(row) + ' |'
+
+        sep = '| ' + ' | '.join(['---'] * max_cols) + ' |'
+        lines = [fmt(self.rows[0]), sep]
+        lines += [fmt(row) for row in self.rows[1:]]
         return '\n'.join(lines)
 
 
-@dataclass
 class HwpxImage:
-    """이미지"""
-    filename: str
-    data: bytes
-    content_type: str = ""
+    """이미지 - data는 첫 접근 시 ZIP 멤버를 읽어와 캐시 (지연 로딩)"""
+    __slots__ = ('filename', 'content_type', '_data', '_source', '_member')
+
+    def __init__(self, filename: str, data: Optional[bytes] = None,
+                 content_type: str = "", source=None, member: Optional[str] = None):
+        self.filename = filename
+        self.content_type = content_type
+        self._data = data
+        self._source = source  # ZIP 경로(str) 또는 원본 bytes
+        self._member = member
+
+    @property
+    def data(self) -> bytes:
+        """이미지 바이트 - 텍스트만 쓰는 호출자는 ZIP 읽기를 전혀 하지 않음"""
+        if self._data is None:
+            if self._source is None:
+                return b''
+            src = self._source
+            with zipfile.ZipFile(src if isinstance(src, str) else BytesIO(src), 'r') as z:
+                self._data = z.read(self._member)
+            self._source = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._source = None
+
+    def __repr__(self):
+        return (f"HwpxImage(filename={self.filename!r}, "
+                f"content_type={self.content_type!r})")
 
 
 @dataclass
@@ -101,12 +152,14 @@ class HwpxDocument:
         """전체 텍스트"""
         lines = []
         for p in self.paragraphs:
-            if p.text.strip():
+            text = p.text
+            if text.strip():
                 if p.is_heading:
-                    prefix = '#' * p.heading_level + ' '
-                    lines.append(prefix + p.text)
+                    level = p.heading_level
+                    prefix = _HEADING_PREFIX[level] if level < 10 else '#' * level + ' '
+                    lines.append(prefix + text)
                 else:
-                    lines.append(p.text)
+                    lines.append(text)
         return '\n\n'.join(lines)
     
     def get_headings(self) -> List[tuple]:
@@ -133,34 +186,88 @@ def parse_hwpx(filepath_or_bytes) -> HwpxDocument:
     doc = HwpxDocument()
     
     try:
-        # 섹션 파일 찾기
-        section_files = sorted([
-            f for f in zf.namelist()
-            if re.match(r'Contents/section\d+\.xml$', f)
-        ])
-        
-        # 각 섹션 파싱
+        names = zf.namelist()
+
+        # 섹션 파일 찾기 - 'Contents/section<n>.xml' 형태만 (정규식 불필요)
+        section_files = sorted(
+            f for f in names
+            if f.startswith('Contents/section') and f.endswith('.xml')
+            and f[16:-4].isdigit()
+        )
+
+        # 각 섹션 파싱 - zf.read 전체 버퍼링 대신 스트림을 파서에 직접 연결
         for section_file in section_files:
-            content = zf.read(section_file)
-            _parse_section_xml(content, doc)
-        
-        # 이미지 추출
-        _extract_images(zf, doc)
-        
+            with zf.open(section_file) as fp:
+                _parse_section_xml(fp, doc)
+
+        # 이미지 추출 (데이터는 지연 로딩 - 여기서는 멤버 목록만 만듦)
+        _extract_images(zf, doc, filepath_or_bytes)
+
         # 메타데이터
-        if 'Contents/content.hpf' in zf.namelist():
-            hpf_content = zf.read('Contents/content.hpf')
-            _parse_hpf(hpf_content, doc)
-    
+        if 'Contents/content.hpf' in names:
+            with zf.open('Contents/content.hpf') as fp:
+                _parse_hpf(fp, doc)
+
     finally:
         zf.close()
-    
+
     return doc
 
 
+# 문단 아웃라인 레벨의 정규화된 속성명
+_OUTLINE_LEVEL_QNAME = '{%s}outlineLevel' % NS['hp']
+
+# 핫 루프에서 쓰는 Clark 표기 태그 집합 - 노드마다 네임스페이스를
+# 떼어내는 대신 elem.tag를 그대로 set 멤버십으로 비교
+_HP_NS = '{%s}' % NS['hp']
+
+
+def _tag_set(*names):
+    """hp 네임스페이스 형태와 비네임스페이스 형태를 모두 포함한 frozenset
+
+    멤버를 intern해 두면 파서가 재사용하는 동일 태그 문자열과의
+    충돌 검사에서 == 비교가 포인터 비교로 끝나는 경우가 많음
+    """
+    return frozenset(sys.intern(n) for n in
+                     names + tuple(_HP_NS + n for n in names))
+
+
+_P_TAGS = _tag_set('p')
+_RUN_TAGS = _tag_set('run')
+_TBL_TAGS = _tag_set('tbl')
+_TEXT_TAGS = _tag_set('t', 'char')
+_LBR_TAGS = _tag_set('lineBreak', 'linebreak')
+_TR_TAGS = _tag_set('tr')
+_TC_TAGS = _tag_set('tc')
+
+
+def _parse_xml_root(source):
+    """bytes 또는 파일류 객체에서 XML 루트 파싱 (실패 시 None)"""
+    try:
+        if isinstance(source, (bytes, bytearray)):
+            return _fromstring(source)
+        if _lxml_etree is not None:
+            return _lxml_etree.parse(source).getroot()
+        return ET.parse(source).getroot()
+    except _XMLParseError:
+        return None
+
+
+# 문서 안의 태그 문자열 종류는 소수이므로 local name을 메모이즈 -
+# 노드마다 문자열 스캔/분할 대신 해시 조회 한 번
+_TAG_LOCAL_CACHE: Dict[str, str] = {}
+
+
 def _get_tag(elem) -> str:
     """네임스페이스를 제거한 태그명 반환"""
-    return elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+    tag = elem.tag
+    if not isinstance(tag, str):  # lxml의 주석/PI 노드
+        return ''
+    local = _TAG_LOCAL_CACHE.get(tag)
+    if local is None:
+        local = tag.split('}')[-1] if '}' in tag else tag
+        _TAG_LOCAL_CACHE[tag] = local
+    return local
 
 
 def _collect_all_texts(elem) -> str:
@@ -170,68 +277,73 @@ def _collect_all_texts(elem) -> str:
     """
     texts = []
     for node in elem.iter():
-        tag = _get_tag(node)
-        if tag in ('t', 'char') and node.text:
+        tag = node.tag
+        if tag in _TEXT_TAGS and node.text:
             texts.append(node.text)
         # lineBreak 등의 tail에 있는 텍스트 수집
-        if tag in ('lineBreak', 'linebreak') and node.tail:
+        if tag in _LBR_TAGS and node.tail:
             texts.append(node.tail)
     return ''.join(texts)
 
 
-def _parse_section_xml(content: bytes, doc: HwpxDocument):
+def _parse_section_xml(content, doc: HwpxDocument):
     """
-    섹션 XML 파싱 - 문서 순서 보존
-    
-    핵심: 최상위 <p> 요소들을 순서대로 처리하여
-    레이아웃 테이블 내 텍스트도 올바른 위치에 삽입
+    섹션 XML 파싱 - 문서 순서 보존 (bytes 또는 파일류 객체 입력)
+
+    iterparse 단일 패스: 최상위 <p>가 닫힐 때마다 바로 처리하고 clear -
+    전체 DOM을 들고 있지 않고, 테이블 내부 p는 최상위 p의 서브트리로만
+    처리되므로 별도의 id 집합도 필요 없음
     """
+    if isinstance(content, (bytes, bytearray)):
+        content = BytesIO(content)
+
+    # 파싱 오류 시 섹션 전체를 버리는 기존 동작 유지를 위해
+    # 임시 문서에 모았다가 성공했을 때만 병합
+    section = HwpxDocument()
+    depth = 0
     try:
-        root = ET.fromstring(content)
-    except ET.ParseError:
-        return
-    
-    # 먼저 모든 tbl 요소 내부의 p 요소 id를 수집 (중복 방지용)
-    table_inner_p_ids: Set[int] = set()
-    for elem in root.iter():
-        tag = _get_tag(elem)
-        if tag == 'tbl':
-            for inner in elem.iter():
-                if _get_tag(inner) == 'p':
-                    table_inner_p_ids.add(id(inner))
-    
-    # 최상위 p 요소들을 문서 순서대로 처리
-    for elem in root:
-        tag = _get_tag(elem)
-        
-        if tag != 'p':
-            continue
-        
-        # 이 p에 tbl이 포함되어 있는지 확인
-        has_tbl = any(_get_tag(sub) == 'tbl' for sub in elem.iter())
-        
-        if has_tbl:
-            # tbl 포함 p: 테이블과 비테이블 텍스트를 분리 처리
-            _process_p_with_table(elem, doc)
-        else:
-            # 일반 p: 테이블 내부 p는 건너뜀
-            if id(elem) in table_inner_p_ids:
+        for event, elem in _iterparse(content, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
                 continue
-            para = _parse_paragraph(elem)
-            if para and para.text.strip():
-                doc.add_paragraph(para)
+            depth -= 1
+            if depth != 1:
+                continue
+
+            if elem.tag in _P_TAGS:
+                # 최상위 tbl 탐색 한 번으로 분기 결정 - 별도 has_tbl
+                # 사전 스캔 없이 결과 리스트를 그대로 넘겨 재탐색도 방지
+                tbl_elements = []
+                _find_top_level_tables(elem, tbl_elements)
+
+                if tbl_elements:
+                    # tbl 포함 p: 테이블과 비테이블 텍스트를 분리 처리
+                    _process_p_with_table(elem, section, tbl_elements)
+                else:
+                    para = _parse_paragraph(elem)
+                    if para and para.text.strip():
+                        section.add_paragraph(para)
+
+            elem.clear()
+    except _XMLParseError:
+        return
 
+    for para in section.paragraphs:
+        doc.add_paragraph(para)
+    doc.tables.extend(section.tables)
 
-def _process_p_with_table(p_elem, doc: HwpxDocument):
+
+def _process_p_with_table(p_elem, doc: HwpxDocument, tbl_elements=None):
     """
     tbl을 포함한 p 요소 처리
     - 데이터 테이블 → doc.tables에 추가
     - 레이아웃 테이블 → 텍스트를 doc.paragraphs에 추가 (문서 순서 유지)
     - p 자체의 비테이블 텍스트도 수집
     """
-    # 이 p 내의 최상위 tbl만 찾기 (중첩 방지)
-    tbl_elements = []
-    _find_top_level_tables(p_elem, tbl_elements)
+    if tbl_elements is None:
+        # 이 p 내의 최상위 tbl만 찾기 (중첩 방지)
+        tbl_elements = []
+        _find_top_level_tables(p_elem, tbl_elements)
     
     for tbl_elem in tbl_elements:
         table = _parse_table(tbl_elem)
@@ -252,8 +364,7 @@ def _process_p_with_table(p_elem, doc: HwpxDocument):
 def _find_top_level_tables(elem, result: list):
     """최상위 tbl만 찾기 (중첩 tbl 제외)"""
     for child in elem:
-        tag = _get_tag(child)
-        if tag == 'tbl':
+        if child.tag in _TBL_TAGS:
             result.append(child)
             # tbl 내부는 더 이상 탐색하지 않음 (중첩 방지)
         else:
@@ -266,23 +377,30 @@ def _is_data_table(table: HwpxTable) -> bool:
     """
     if not table.rows:
         return False
-    
+
     num_rows = len(table.rows)
-    max_cols = max(len(row) for row in table.rows)
-    
+
+    # _parse_table이 이미 세어 둔 값이 있으면 재순회하지 않음
+    max_cols = table._max_cols
+    if max_cols < 0:
+        max_cols = max(len(row) for row in table.rows)
+
     # 1행짜리 테이블: 거의 항상 레이아웃 용도
     if num_rows == 1:
         return False
-    
+
     # 2행이상이지만, 실질적 데이터가 없는 경우
-    non_empty_cells = 0
-    total_cells = 0
-    for row in table.rows:
-        for cell in row:
-            total_cells += 1
-            if cell.strip():
-                non_empty_cells += 1
-    
+    non_empty_cells = table._non_empty
+    total_cells = table._total
+    if total_cells < 0:
+        non_empty_cells = 0
+        total_cells = 0
+        for row in table.rows:
+            for cell in row:
+                total_cells += 1
+                if cell.strip():
+                    non_empty_cells += 1
+
     # 비어있는 셀이 대부분이면 레이아웃
     if total_cells > 0 and non_empty_cells / total_cells < 0.3:
         return False
@@ -301,7 +419,7 @@ def _is_data_table(table: HwpxTable) -> bool:
 def _add_layout_table_as_text(table: HwpxTable, doc: HwpxDocument):
     """레이아웃 테이블의 텍스트를 일반 문단으로 추가"""
     for row in table.rows:
-        texts = [cell.strip() for cell in row if cell.strip()]
+        texts = [s for s in (cell.strip() for cell in row) if s]
         if texts:
             combined = ' '.join(texts)
             doc.add_paragraph(HwpxParagraph(text=combined))
@@ -309,36 +427,61 @@ def _add_layout_table_as_text(table: HwpxTable, doc: HwpxDocument):
 
 def _parse_paragraph(elem) -> Optional[HwpxParagraph]:
     """문단 파싱"""
-    texts = []
-    
-    # 모든 텍스트 노드 수집 (단, tbl 내부는 건너뜀)
-    _collect_texts_skip_tables(elem, texts)
-    
-    if not texts:
-        # 직접 텍스트도 체크
-        if elem.text:
-            texts.append(elem.text)
-        for child in elem:
-            if child.tail:
-                texts.append(child.tail)
-    
-    text = ''.join(texts)
-    
+    # 단순 문단 fast path - 대부분의 문단은 <p><run><t>…</t></run></p>
+    # (또는 <p><t>…</t></p>) 형태라 일반 순회 없이 바로 꺼낼 수 있음
+    text = None
+    if len(elem) == 1:
+        node = elem[0]
+        if node.tag in _RUN_TAGS and len(node) == 1:
+            node = node[0]
+        if node.tag in _TEXT_TAGS and not len(node) and node.text:
+            text = node.text
+
+    if text is None:
+        texts = []
+
+        # 모든 텍스트 노드 수집 (단, tbl 내부는 건너뜀)
+        _collect_texts_skip_tables(elem, texts)
+
+        if not texts:
+            # 직접 텍스트도 체크
+            if elem.text:
+                texts.append(elem.text)
+            for child in elem:
+                if child.tail:
+                    texts.append(child.tail)
+
+        text = ''.join(texts)
+
     # 스타일/아웃라인 레벨 체크
     is_heading = False
     heading_level = 0
-    
-    # 아웃라인 레벨 속성 체크
-    for attr in elem.attrib:
-        if 'outlineLevel' in attr or 'level' in attr.lower():
-            try:
-                level = int(elem.attrib[attr])
-                if 0 <= level <= 9:
-                    is_heading = True
-                    heading_level = level + 1
-            except ValueError:
-                pass
-    
+
+    # 아웃라인 레벨 속성 체크 - 일반 키는 dict 조회로, 변형 키만 스캔 폴백
+    attrib = elem.attrib
+    level_val = attrib.get('outlineLevel')
+    if level_val is None:
+        level_val = attrib.get(_OUTLINE_LEVEL_QNAME)
+
+    if level_val is not None:
+        try:
+            level = int(level_val)
+            if 0 <= level <= 9:
+                is_heading = True
+                heading_level = level + 1
+        except ValueError:
+            pass
+    elif attrib:
+        for attr in attrib:
+            if 'outlineLevel' in attr or 'level' in attr.lower():
+                try:
+                    level = int(attrib[attr])
+                    if 0 <= level <= 9:
+                        is_heading = True
+                        heading_level = level + 1
+                except ValueError:
+                    pass
+
     return HwpxParagraph(
         text=text,
         is_heading=is_heading,
@@ -350,95 +493,140 @@ def _collect_texts_skip_tables(elem, texts: list):
     """
     텍스트 노드를 수집하되 tbl 요소 내부는 건너뜀
     lineBreak의 tail 텍스트도 수집
+
+    명시적 스택 순회 - 노드당 재귀 호출 프레임을 만들지 않음
+    (자식을 역순으로 쌓아 문서 순서 그대로 방문)
     """
-    for node in elem:
-        tag = _get_tag(node)
-        
+    append = texts.append
+    stack = list(elem)
+    stack.reverse()
+
+    while stack:
+        node = stack.pop()
+        tag = node.tag
+
         # 테이블 내부는 건너뜀
-        if tag == 'tbl':
+        if tag in _TBL_TAGS:
             continue
-        
+
         # 텍스트 노드
-        if tag in ('t', 'char') and node.text:
-            texts.append(node.text)
-        
+        if tag in _TEXT_TAGS and node.text:
+            append(node.text)
+
         # lineBreak의 tail에 있는 텍스트 수집
-        if tag in ('lineBreak', 'linebreak') and node.tail:
-            texts.append(node.tail)
-        
-        # 재귀적으로 자식 탐색
-        _collect_texts_skip_tables(node, texts)
+        if tag in _LBR_TAGS and node.tail:
+            append(node.tail)
+
+        if len(node):
+            stack.extend(reversed(node))
 
 
 def _parse_table(elem) -> Optional[HwpxTable]:
-    """테이블 파싱 - lineBreak tail 텍스트도 수집"""
+    """테이블 파싱 - lineBreak tail 텍스트도 수집
+
+    _is_data_table이 쓰는 셀 카운터도 같은 패스에서 채움 (재순회 방지)
+    """
     table = HwpxTable()
-    
+    non_empty = 0
+    total = 0
+    max_cols = 0
+
     # 행 찾기
     for row_elem in elem.iter():
-        row_tag = _get_tag(row_elem)
-        
-        if row_tag == 'tr':
+        if row_elem.tag in _TR_TAGS:
             row = []
-            
+
             # 셀 찾기
             for cell_elem in row_elem.iter():
-                cell_tag = _get_tag(cell_elem)
-                
-                if cell_tag == 'tc':
+                if cell_elem.tag in _TC_TAGS:
                     # 셀 내 모든 텍스트 수집 (lineBreak tail 포함)
                     cell_text = _collect_all_texts(cell_elem)
                     row.append(cell_text)
-            
+                    if cell_text.strip():
+                        non_empty += 1
+
             if row:
                 table.rows.append(row)
-    
-    return table if table.rows else None
+                n = len(row)
+                total += n
+                if n > max_cols:
+                    max_cols = n
+
+    if not table.rows:
+        return None
+
+    table._non_empty = non_empty
+    table._total = total
+    table._max_cols = max_cols
+    return table
+
+
+# 이미지 확장자/콘텐츠 타입 테이블 (핫 루프 밖에서 한 번만 생성)
+_IMG_EXTS = frozenset(('png', 'jpg', 'jpeg', 'gif', 'bmp', 'emf', 'wmf'))
+_IMG_CONTENT_TYPES = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'bmp': 'image/bmp',
+}
 
 
-def _extract_images(zf: zipfile.ZipFile, doc: HwpxDocument):
-    """이미지 추출"""
+def _extract_images(zf: zipfile.ZipFile, doc: HwpxDocument, source):
+    """이미지 목록 구성 - 바이트는 실제 접근 시점에 읽음"""
     for name in zf.namelist():
         # BinData 또는 Media 폴더 (루트 또는 하위 경로 모두)
         name_lower = name.lower()
-        if 'bindata/' in name_lower or '/media/' in name_lower:
-            ext = name.split('.')[-1].lower()
-            if ext in ['png', 'jpg', 'jpeg', 'gif', 'bmp', 'emf', 'wmf']:
-                data = zf.read(name)
-                filename = name.split('/')[-1]
-                
-                content_types = {
-                    'png': 'image/png',
-                    'jpg': 'image/jpeg',
-                    'jpeg': 'image/jpeg',
-                    'gif': 'image/gif',
-                    'bmp': 'image/bmp',
-                }
-                
-                doc.images.append(HwpxImage(
-                    filename=filename,
-                    data=data,
-                    content_type=content_types.get(ext, 'application/octet-stream')
-                ))
-
-
-def _parse_hpf(content: bytes, doc: HwpxDocument):
-    """content.hpf 메타데이터 파싱"""
-    try:
-        root = ET.fromstring(content)
-    except ET.ParseError:
+        if 'bindata/' not in name_lower and '/media/' not in name_lower:
+            continue
+
+        dot, _, ext = name_lower.rpartition('.')
+        if not dot or ext not in _IMG_EXTS:
+            continue
+
+        filename = name.rsplit('/', 1)[-1]
+
+        doc.images.append(HwpxImage(
+            filename=filename,
+            content_type=_IMG_CONTENT_TYPES.get(ext, 'application/octet-stream'),
+            source=source,
+            member=name,
+        ))
+
+
+def _parse_hpf(content, doc: HwpxDocument):
+    """content.hpf 메타데이터 파싱 (bytes 또는 파일류 객체 입력)"""
+    root = _parse_xml_root(content)
+    if root is None:
         return
     
     # 다양한 네임스페이스에서 메타데이터 찾기
+    # 각 필드는 한 번씩만 등장하므로 셋 다 찾으면 순회를 중단
+    title = author = created = None
     for elem in root.iter():
         tag = _get_tag(elem)
-        
-        if tag == 'title' and elem.text:
-            doc.title = elem.text
-        elif tag == 'creator' and elem.text:
-            doc.author = elem.text
-        elif tag == 'date' and elem.text:
-            doc.created = elem.text
+
+        if tag == 'title':
+            if title is None and elem.text:
+                title = elem.text
+        elif tag == 'creator':
+            if author is None and elem.text:
+                author = elem.text
+        elif tag == 'date':
+            if created is None and elem.text:
+                created = elem.text
+        else:
+            continue
+
+        if title is not None and author is not None and created is not None:
+            break
+
+    if title:
+        doc.title = title
+    if author:
+        doc.author = author
+    if created:
+        doc.created = created
 
 
 def extract_text(doc: HwpxDocument) -> str:
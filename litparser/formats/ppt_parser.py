@@ -34,6 +34,9 @@ RT_TEXT_BYTES = 0x0FA8         # 4008
 RT_SLIDE_PERSIST_ATOM = 0x03F3 # 1011
 RT_CSTRING = 0x0FBA            # 4026
 
+# 레코드 헤더(ver/instance, type, len)는 모듈 로드 시 한 번만 컴파일
+_REC_HEADER = struct.Struct('<HHI')
+
 
 @dataclass
 class PptSlide:
@@ -58,15 +61,12 @@ class PptTable:
     def to_markdown(self) -> str:
         if not self.rows:
             return ""
-        
-        lines = []
+
+        # 셀은 파서가 str로 채움 - str() 재변환 없이 바로 join
         header = self.rows[0]
-        lines.append("| " + " | ".join(str(c) for c in header) + " |")
-        lines.append("| " + " | ".join("---" for _ in header) + " |")
-        
-        for row in self.rows[1:]:
-            lines.append("| " + " | ".join(str(c) for c in row) + " |")
-        
+        sep = "| " + " | ".join(["---"] * len(header)) + " |"
+        lines = ["| " + " | ".join(header) + " |", sep]
+        lines += ["| " + " | ".join(row) + " |" for row in self.rows[1:]]
         return "\n".join(lines)
 
 
@@ -94,11 +94,21 @@ class PptDocument:
         return len(self.slides)
     
     def get_text(self) -> str:
-        """전체 텍스트"""
+        """전체 텍스트
+
+        슬라이드별 get_text()로 중간 문자열을 만들지 않고
+        평탄한 리스트 하나에 모아 join 한 번으로 조립
+        """
         parts = []
         for slide in self.slides:
             parts.append(f"=== 슬라이드 {slide.number} ===")
-            parts.append(slide.get_text())
+            if slide.title:
+                parts.append(slide.title)
+                parts.extend(slide.texts)
+            elif slide.texts:
+                parts.extend(slide.texts)
+            else:
+                parts.append("")
             parts.append("")
         return '\n'.join(parts)
     
@@ -142,10 +152,10 @@ def parse_ppt(filepath_or_bytes: Union[str, bytes]) -> PptDocument:
     slide_num = 0
     
     for text in texts:
-        text = text.strip()
+        # _extract_all_texts가 _clean_text로 이미 strip/필터링한 결과
         if not text:
             continue
-        
+
         # 새 슬라이드 감지 (휴리스틱)
         if current_slide is None or len(current_slide.texts) > 10:
             slide_num += 1
@@ -170,93 +180,85 @@ def parse_ppt(filepath_or_bytes: Union[str, bytes]) -> PptDocument:
     return doc
 
 
-def _extract_all_texts(data: bytes) -> List[str]:
-    """모든 텍스트 레코드 추출"""
+def _extract_all_texts(data) -> List[str]:
+    """모든 텍스트 레코드 추출
+
+    스트림은 memoryview로 다룸 - 컨테이너 재귀는 zero-copy 슬라이스로
+    내려가고, 실제 텍스트 레코드만 디코딩 직전에 bytes로 구체화
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = memoryview(data)
+
     texts = []
     pos = 0
     size = len(data)
-    
+
+    unpack_header = _REC_HEADER.unpack_from
+
     while pos + 8 <= size:
-        # 레코드 헤더 (8 bytes)
-        rec_ver = struct.unpack('<H', data[pos:pos+2])[0]
-        rec_type = struct.unpack('<H', data[pos+2:pos+4])[0]
-        rec_len = struct.unpack('<I', data[pos+4:pos+8])[0]
+        # 레코드 헤더 (8 bytes) - 슬라이스 없이 제자리에서 한 번에 언팩
+        rec_ver, rec_type, rec_len = unpack_header(data, pos)
         pos += 8
-        
+
         # 레코드 데이터
         if pos + rec_len > size:
             break
-        
-        rec_data = data[pos:pos+rec_len]
-        
+
         # 텍스트 레코드 처리
         if rec_type == RT_TEXT_CHARS:
             # UTF-16LE 텍스트
             try:
-                text = rec_data.decode('utf-16le', errors='ignore')
+                text = bytes(data[pos:pos+rec_len]).decode('utf-16le', errors='ignore')
                 text = _clean_text(text)
                 if text:
                     texts.append(text)
             except (UnicodeDecodeError, struct.error, IndexError):
                 pass
-        
+
         elif rec_type == RT_TEXT_BYTES:
             # ANSI 텍스트
             try:
-                text = rec_data.decode('cp1252', errors='ignore')
+                text = bytes(data[pos:pos+rec_len]).decode('cp1252', errors='ignore')
                 text = _clean_text(text)
                 if text:
                     texts.append(text)
             except (UnicodeDecodeError, struct.error, IndexError):
                 pass
-        
+
         elif rec_type == RT_CSTRING:
             # C 문자열 (UTF-16LE)
             try:
-                text = rec_data.decode('utf-16le', errors='ignore').rstrip('\x00')
+                text = bytes(data[pos:pos+rec_len]).decode('utf-16le', errors='ignore').rstrip('\x00')
                 text = _clean_text(text)
                 if text:
                     texts.append(text)
             except (UnicodeDecodeError, struct.error, IndexError):
                 pass
-        
+
         # 컨테이너 레코드는 내부 파싱
         ver_instance = rec_ver & 0x000F
         if ver_instance == 0x000F:
-            # 컨테이너: 재귀 파싱
-            inner_texts = _extract_all_texts(rec_data)
+            # 컨테이너: 재귀 파싱 (복사 없는 memoryview 슬라이스)
+            inner_texts = _extract_all_texts(data[pos:pos+rec_len])
             texts.extend(inner_texts)
             pos += rec_len
             continue
-        
+
         pos += rec_len
-    
+
     return texts
 
 
+# 제어 문자 정리 테이블: 탭→공백, LF/VT→줄바꿈, 그 외 제어 문자는 제거
+_CLEAN_TABLE = {i: None for i in range(32)}
+_CLEAN_TABLE[9] = ' '
+_CLEAN_TABLE[10] = '\n'
+_CLEAN_TABLE[11] = '\n'
+
+
 def _clean_text(text: str) -> str:
-    """텍스트 정리"""
-    result = []
-    
-    for char in text:
-        code = ord(char)
-        
-        if code == 0:
-            continue
-        elif code == 9:  # 탭
-            result.append(' ')
-        elif code == 10:  # 줄바꿈
-            result.append('\n')
-        elif code == 11:  # 수직 탭
-            result.append('\n')
-        elif code == 13:  # 캐리지 리턴
-            continue
-        elif code < 32:  # 기타 제어 문자
-            continue
-        else:
-            result.append(char)
-    
-    return ''.join(result).strip()
+    """텍스트 정리 - 문자별 Python 루프 대신 C 레벨 translate 한 번"""
+    return text.translate(_CLEAN_TABLE).strip()
 
 
 def _extract_pictures(data: bytes) -> List[PptImage]:
@@ -266,22 +268,21 @@ def _extract_pictures(data: bytes) -> List[PptImage]:
     size = len(data)
     img_num = 0
     
+    unpack_header = _REC_HEADER.unpack_from
+
     while pos + 8 <= size:
-        # 레코드 헤더
-        rec_ver = struct.unpack('<H', data[pos:pos+2])[0]
-        rec_type = struct.unpack('<H', data[pos+2:pos+4])[0]
-        rec_len = struct.unpack('<I', data[pos+4:pos+8])[0]
+        # 레코드 헤더 - 슬라이스 없이 제자리에서 한 번에 언팩
+        rec_ver, rec_type, rec_len = unpack_header(data, pos)
         pos += 8
         
         if pos + rec_len > size:
             break
-        
-        rec_data = data[pos:pos+rec_len]
-        
+
         # 이미지 타입 (0x046A=PNG, 0x046B=JPEG 등)
+        # 슬라이스는 이미지 레코드로 판명된 경우에만 (나머지는 건너뜀)
         if rec_type in (0x046A, 0xF01A):  # PNG
             # 헤더 스킵 (17 bytes 정도)
-            img_data = _find_image_start(rec_data, b'\x89PNG')
+            img_data = _find_image_start(data[pos:pos+rec_len], b'\x89PNG')
             if img_data:
                 img_num += 1
                 images.append(PptImage(
@@ -291,7 +292,7 @@ def _extract_pictures(data: bytes) -> List[PptImage]:
                 ))
         
         elif rec_type in (0x046B, 0xF01D, 0xF01E, 0xF01F, 0xF020):  # JPEG
-            img_data = _find_image_start(rec_data, b'\xff\xd8')
+            img_data = _find_image_start(data[pos:pos+rec_len], b'\xff\xd8')
             if img_data:
                 img_num += 1
                 images.append(PptImage(
@@ -10,12 +10,25 @@ PPTX = ZIP 파일
   ppt/media/            <- 이미지
 """
 
+import os
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from io import BytesIO
-import re
+
+# lxml이 있으면 C 구현 파서 사용, 없으면 stdlib ElementTree 그대로
+# (순수 Python 패키지 - lxml은 어디까지나 선택 사항)
+try:
+    from lxml import etree as _lxml_etree
+    _fromstring = _lxml_etree.fromstring
+except ImportError:
+    _lxml_etree = None
+    _fromstring = ET.fromstring
+
+_iterparse = _lxml_etree.iterparse if _lxml_etree is not None else ET.iterparse
 
 
 # OOXML 네임스페이스
@@ -25,6 +38,17 @@ NS = {
     'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
 }
 
+# iterparse 경로에서 태그 비교에 쓰는 Clark 표기 상수
+# (intern해 두면 파서가 캐시한 동일 문자열과의 == 비교가 포인터 비교로 끝남)
+_SP_TAG = sys.intern('{%s}sp' % NS['p'])
+_TBL_TAG = sys.intern('{%s}tbl' % NS['a'])
+
+# placeholder 판별용 (nvSpPr > nvPr > ph 직접 탐색)
+_NVSPPR_TAG = sys.intern('{%s}nvSpPr' % NS['p'])
+_NVPR_TAG = sys.intern('{%s}nvPr' % NS['p'])
+_PH_TAG = sys.intern('{%s}ph' % NS['p'])
+_TITLE_PH_TYPES = frozenset((sys.intern('title'), sys.intern('ctrTitle')))
+
 
 @dataclass
 class PptxTextBox:
@@ -45,28 +69,55 @@ class PptxTable:
     def to_markdown(self) -> str:
         if not self.rows:
             return ""
-        lines = []
+
         max_cols = max(len(row) for row in self.rows)
-        
-        # 헤더
-        header = self.rows[0] + [''] * (max_cols - len(self.rows[0]))
-        lines.append('| ' + ' | '.join(header) + ' |')
-        lines.append('| ' + ' | '.join(['---'] * max_cols) + ' |')
-        
-        # 본문
-        for row in self.rows[1:]:
-            row = row + [''] * (max_cols - len(row))
-            lines.append('| ' + ' | '.join(row) + ' |')
-        
+        if max_cols == 0:
+            return ""
+
+        # 행별 임시 패딩 리스트 생성은 열 수가 모자랄 때만
+        def fmt(row):
+            if len(row) < max_cols:
+                row = row + [''] * (max_cols - len(row))
+            return '| ' + ' | '.join(row) + ' |'
+
+        sep = '| ' + ' | '.join(['---'] * max_cols) + ' |'
+        lines = [fmt(self.rows[0]), sep]
+        lines += [fmt(row) for row in self.rows[1:]]
         return '\n'.join(lines)
 
 
-@dataclass
 class PptxImage:
-    """이미지"""
-    filename: str
-    data: bytes
-    content_type: str = ""
+    """이미지 - data는 첫 접근 시 ZIP 멤버를 읽어와 캐시 (지연 로딩)"""
+    __slots__ = ('filename', 'content_type', '_data', '_source', '_member')
+
+    def __init__(self, filename: str, data: Optional[bytes] = None,
+                 content_type: str = "", source=None, member: Optional[str] = None):
+        self.filename = filename
+        self.content_type = content_type
+        self._data = data
+        self._source = source  # ZIP 경로(str) 또는 원본 bytes
+        self._member = member
+
+    @property
+    def data(self) -> bytes:
+        """이미지 바이트 - 텍스트만 쓰는 호출자는 ZIP 읽기를 전혀 하지 않음"""
+        if self._data is None:
+            if self._source is None:
+                return b''
+            src = self._source
+            with zipfile.ZipFile(src if isinstance(src, str) else BytesIO(src), 'r') as z:
+                self._data = z.read(self._member)
+            self._source = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._source = None
+
+    def __repr__(self):
+        return (f"PptxImage(filename={self.filename!r}, "
+                f"content_type={self.content_type!r})")
 
 
 @dataclass
@@ -132,65 +183,79 @@ def parse_pptx(filepath_or_bytes) -> PptxDocument:
     doc = PptxDocument()
     
     try:
-        # 슬라이드 파일 목록
+        names = set(zf.namelist())
+
+        # 슬라이드 파일 목록 - 'ppt/slides/slide<n>.xml' 형태만 (정규식 불필요)
         slide_files = sorted([
-            f for f in zf.namelist() 
-            if re.match(r'ppt/slides/slide\d+\.xml$', f)
-        ], key=lambda x: int(re.search(r'slide(\d+)', x).group(1)))
-        
+            f for f in names
+            if f.startswith('ppt/slides/slide') and f.endswith('.xml')
+            and f[16:-4].isdigit()
+        ], key=lambda x: int(x[16:-4]))
+
         doc.slide_count = len(slide_files)
-        
-        # 각 슬라이드 파싱
-        for i, slide_file in enumerate(slide_files, 1):
-            content = zf.read(slide_file)
-            slide = _parse_slide_xml(content, i)
-            
+
+        def _load_slide(pair):
+            idx, slide_file = pair
+            slide = _parse_slide_xml(zf.read(slide_file), idx)
+
             # 노트 파싱
-            notes_file = f'ppt/notesSlides/notesSlide{i}.xml'
-            if notes_file in zf.namelist():
-                notes_content = zf.read(notes_file)
-                slide.notes = _parse_notes_xml(notes_content)
-            
-            doc.slides.append(slide)
-        
-        # 이미지 추출
-        _extract_images(zf, doc)
-        
+            notes_file = f'ppt/notesSlides/notesSlide{idx}.xml'
+            if notes_file in names:
+                slide.notes = _parse_notes_xml(zf.read(notes_file))
+            return slide
+
+        # 슬라이드별 zf.read(inflate) + XML 파싱은 서로 독립 -
+        # zlib이 GIL을 풀어주므로 스레드 풀로 겹쳐서 처리 (순서는 map이 보존)
+        if len(slide_files) > 1:
+            workers = min(len(slide_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                doc.slides = list(pool.map(_load_slide, enumerate(slide_files, 1)))
+        else:
+            doc.slides = [_load_slide(pair) for pair in enumerate(slide_files, 1)]
+
+        # 이미지 추출 (데이터는 지연 로딩 - 여기서는 멤버 목록만 만듦)
+        _extract_images(zf, doc, filepath_or_bytes)
+
         # 메타데이터
-        if 'docProps/core.xml' in zf.namelist():
+        if 'docProps/core.xml' in names:
             core_content = zf.read('docProps/core.xml')
             _parse_core_xml(core_content, doc)
-    
+
     finally:
         zf.close()
-    
+
     return doc
 
 
 def _parse_slide_xml(content: bytes, slide_num: int) -> PptxSlide:
-    """슬라이드 XML 파싱"""
+    """슬라이드 XML 파싱
+
+    iterparse 단일 패스 - 전체 DOM을 유지하지 않고 sp/tbl 서브트리가
+    닫힐 때마다 처리 후 clear하여 메모리를 바로 반환
+    """
     slide = PptxSlide(number=slide_num)
-    root = ET.fromstring(content)
-    
-    # 모든 텍스트 프레임 찾기
-    for sp in root.findall('.//p:sp', NS):
-        textbox = _parse_shape(sp)
-        if textbox:
-            slide.texts.append(textbox)
-            # 첫 번째 제목으로 설정
-            if textbox.is_title and not slide.title:
-                slide.title = textbox.text
-    
-    # 테이블 찾기
-    for tbl in root.findall('.//a:tbl', NS):
-        table = _parse_table(tbl)
-        if table:
-            slide.tables.append(table)
-    
+
+    for _event, elem in _iterparse(BytesIO(content), events=('end',)):
+        tag = elem.tag
+
+        if tag == _SP_TAG:
+            textbox = _parse_shape(elem)
+            if textbox:
+                slide.texts.append(textbox)
+                # 첫 번째 제목으로 설정
+                if textbox.is_title and not slide.title:
+                    slide.title = textbox.text
+            elem.clear()
+        elif tag == _TBL_TAG:
+            table = _parse_table(elem)
+            if table:
+                slide.tables.append(table)
+            elem.clear()
+
     # 제목이 없으면 첫 번째 텍스트를 제목으로
     if not slide.title and slide.texts:
         slide.title = slide.texts[0].text.split('\n')[0][:50]
-    
+
     return slide
 
 
@@ -207,18 +272,23 @@ def _parse_shape(sp) -> Optional[PptxTextBox]:
     
     text = ''.join(texts)
     
-    # 제목 여부 체크 (placeholder type)
+    # 제목 여부 체크 (placeholder type) - nvSpPr/nvPr/ph는 각 단계의
+    # 직접 자식이므로 find의 XPath 해석 없이 자식만 훑음
     is_title = False
-    nvSpPr = sp.find('.//p:nvSpPr', NS)
-    if nvSpPr is not None:
-        nvPr = nvSpPr.find('p:nvPr', NS)
-        if nvPr is not None:
-            ph = nvPr.find('p:ph', NS)
-            if ph is not None:
-                ph_type = ph.get('type', '')
-                if ph_type in ['title', 'ctrTitle']:
-                    is_title = True
-    
+    for c in sp:
+        if c.tag != _NVSPPR_TAG:
+            continue
+        for cc in c:
+            if cc.tag != _NVPR_TAG:
+                continue
+            for ccc in cc:
+                if ccc.tag == _PH_TAG:
+                    if ccc.get('type', '') in _TITLE_PH_TYPES:
+                        is_title = True
+                    break
+            break
+        break
+
     return PptxTextBox(text=text, is_title=is_title)
 
 
@@ -243,7 +313,7 @@ def _parse_table(tbl) -> Optional[PptxTable]:
 
 def _parse_notes_xml(content: bytes) -> str:
     """노트 XML 파싱"""
-    root = ET.fromstring(content)
+    root = _fromstring(content)
     texts = []
     
     for t in root.findall('.//a:t', NS):
@@ -253,28 +323,30 @@ def _parse_notes_xml(content: bytes) -> str:
     return ''.join(texts)
 
 
-def _extract_images(zf: zipfile.ZipFile, doc: PptxDocument):
-    """이미지 추출"""
+# 이미지 확장자별 콘텐츠 타입 (핫 루프 밖에서 한 번만 생성)
+_IMG_CONTENT_TYPES = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'bmp': 'image/bmp',
+    'emf': 'image/x-emf',
+    'wmf': 'image/x-wmf',
+}
+
+
+def _extract_images(zf: zipfile.ZipFile, doc: PptxDocument, source):
+    """이미지 목록 구성 - 바이트는 실제 접근 시점에 읽음"""
     for name in zf.namelist():
         if name.startswith('ppt/media/'):
-            data = zf.read(name)
             filename = name.split('/')[-1]
-            
             ext = filename.split('.')[-1].lower()
-            content_types = {
-                'png': 'image/png',
-                'jpg': 'image/jpeg',
-                'jpeg': 'image/jpeg',
-                'gif': 'image/gif',
-                'bmp': 'image/bmp',
-                'emf': 'image/x-emf',
-                'wmf': 'image/x-wmf',
-            }
-            
+
             doc.images.append(PptxImage(
                 filename=filename,
-                data=data,
-                content_type=content_types.get(ext, 'application/octet-stream')
+                content_type=_IMG_CONTENT_TYPES.get(ext, 'application/octet-stream'),
+                source=source,
+                member=name,
             ))
 
 
@@ -282,7 +354,7 @@ def _parse_core_xml(content: bytes, doc: PptxDocument):
     """메타데이터 파싱"""
     dc_ns = 'http://purl.org/dc/elements/1.1/'
     
-    root = ET.fromstring(content)
+    root = _fromstring(content)
     
     title = root.find(f'{{{dc_ns}}}title')
     if title is not None and title.text:
@@ -4,25 +4,85 @@ Text/Markdown Parser
 txt, md 파일 파싱
 """
 
+import codecs
+import sys
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional
 import re
 
 
+# Python 3.11+는 소유 한정자(++, *+)를 지원 - 문자 클래스 뒤의 무의미한
+# 역추적을 원천 차단해 악의적 입력(닫히지 않은 펜스/괄호)에서도 선형 시간.
+# 여기 쓰인 클래스들은 뒤따르는 구분자와 겹치지 않아 의미는 동일함
+if sys.version_info >= (3, 11):
+    _P, _S = '++', '*+'   # possessive
+else:
+    _P, _S = '+', '*'
+
+
+# BOM 시그니처 테이블 (시그니처, 인코딩, 스킵 바이트)
+_BOMS = (
+    (b'\xef\xbb\xbf', 'utf-8', 3),
+    (b'\xff\xfe', 'utf-16-le', 2),
+    (b'\xfe\xff', 'utf-16-be', 2),
+)
+
+# 후보 인코딩 판별용 프리픽스 크기 - 전체 디코딩 전에 앞부분만 찔러봄
+_PROBE_SIZE = 4096
+
+
+# 마크다운 패턴은 모듈 로드 시 한 번만 컴파일
+# (re 모듈 캐시 조회/재컴파일을 호출마다 반복하지 않음)
+_RE_HEADING = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+_RE_FENCE = re.compile(r'```(\w%s)\n(.*?)```' % _S, re.DOTALL)
+_RE_LINK = re.compile(r'(?<!!)\[([^\]]%s)\]\(([^)]%s)\)' % (_P, _P))
+_RE_IMAGE = re.compile(r'!\[([^\]]%s)\]\(([^)]%s)\)' % (_S, _P))
+
+# extract_text용 융합 패턴 - 10개의 개별 sub 패스 대신 버퍼를 한 번만
+# 훑는 단일 교대(alternation). 교대 순서는 기존 패스 순서와 동일
+_MD_STRIP = re.compile(
+    (r'```.*?```'                            # 코드 블록 제거
+     r'|`[^`]%(p)s`'                         # 인라인 코드 제거
+     r'|!\[[^\]]%(s)s\]\([^)]%(p)s\)'        # 이미지 제거
+     r'|\[(?P<link>[^\]]%(p)s)\]\([^)]%(p)s\)'  # 링크는 텍스트만
+     r'|^#{1,6}\s+'                          # 헤딩 마커 제거
+     r'|\*\*(?P<b1>[^*]%(p)s)\*\*'           # 강조 제거
+     r'|\*(?P<i1>[^*]%(p)s)\*'
+     r'|__(?P<b2>[^_]%(p)s)__'
+     r'|_(?P<i2>[^_]%(p)s)_'
+     r'|^[-*_]{3,}$') % {'p': _P, 's': _S},  # 수평선 제거
+    re.MULTILINE | re.DOTALL)
+_RE_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def _md_strip_repl(m: "re.Match") -> str:
+    """융합 패턴 콜백 - 링크/강조는 내부 텍스트를 재귀 처리, 나머지는 제거"""
+    inner = m.group('link') or m.group('b1') or m.group('i1') \
+        or m.group('b2') or m.group('i2')
+    if inner is None:
+        return ''
+    return _MD_STRIP.sub(_md_strip_repl, inner)
+
+
 @dataclass
 class TextDocument:
     """파싱된 텍스트 문서"""
     content: str
-    lines: List[str]
     filename: str = ""
     encoding: str = "utf-8"
-    
+
     # Markdown 전용
     headings: List[tuple] = None  # [(level, text), ...]
     code_blocks: List[dict] = None  # [{'lang': 'python', 'code': '...'}, ...]
     links: List[tuple] = None  # [(text, url), ...]
     images: List[tuple] = None  # [(alt, url), ...]
 
+    @cached_property
+    def lines(self) -> List[str]:
+        """줄 목록 - content만 쓰는 호출자는 비용 0, 첫 접근 시 계산 후 캐시"""
+        return self.content.splitlines()
+
 
 def parse_text(filepath_or_bytes, encoding: str = None) -> TextDocument:
     """
@@ -43,11 +103,8 @@ def parse_text(filepath_or_bytes, encoding: str = None) -> TextDocument:
         data = _decode_bytes(filepath_or_bytes, encoding)
         filename = ""
     
-    lines = data.splitlines()
-    
     return TextDocument(
         content=data,
-        lines=lines,
         filename=filename,
         encoding=encoding or "utf-8"
     )
@@ -90,25 +147,29 @@ def _read_file(filepath: str, encoding: str = None) -> str:
 def _decode_bytes(data: bytes, encoding: str = None) -> str:
     """바이트를 문자열로 디코딩 (인코딩 자동 감지)"""
     # BOM 체크
-    if data.startswith(b'\xef\xbb\xbf'):
-        return data[3:].decode('utf-8')
-    if data.startswith(b'\xff\xfe'):
-        return data[2:].decode('utf-16-le')
-    if data.startswith(b'\xfe\xff'):
-        return data[2:].decode('utf-16-be')
-    
-    # 인코딩 시도
+    for bom, enc, skip in _BOMS:
+        if data.startswith(bom):
+            return data[skip:].decode(enc)
+
+    # 인코딩 시도 - 후보마다 전체를 디코딩하다 실패하면 큰 파일에서
+    # O(후보 수 × N)이 됨. 먼저 4KB 프리픽스만 증분 디코더로 찔러보고
+    # 통과한 후보만 전체 디코딩을 시도
     encodings = [encoding] if encoding else []
     encodings.extend(['utf-8', 'cp949', 'euc-kr', 'latin-1'])
-    
+
+    probe = data[:_PROBE_SIZE] if len(data) > _PROBE_SIZE else None
+
     for enc in encodings:
         if not enc:
             continue
         try:
+            if probe is not None:
+                # final=False - 경계에서 잘린 멀티바이트 문자는 버퍼링됨
+                codecs.getincrementaldecoder(enc)('strict').decode(probe, False)
             return data.decode(enc)
         except (UnicodeDecodeError, LookupError):
             continue
-    
+
     # 최후의 수단
     return data.decode('utf-8', errors='replace')
 
@@ -118,7 +179,7 @@ def _extract_headings(content: str) -> List[tuple]:
     headings = []
     
     # ATX 스타일: # Heading
-    for match in re.finditer(r'^(#{1,6})\s+(.+)$', content, re.MULTILINE):
+    for match in _RE_HEADING.finditer(content):
         level = len(match.group(1))
         text = match.group(2).strip()
         headings.append((level, text))
@@ -131,8 +192,7 @@ def _extract_code_blocks(content: str) -> List[dict]:
     blocks = []
     
     # Fenced 코드 블록: ```lang ... ```
-    pattern = r'```(\w*)\n(.*?)```'
-    for match in re.finditer(pattern, content, re.DOTALL):
+    for match in _RE_FENCE.finditer(content):
         blocks.append({
             'lang': match.group(1) or 'text',
             'code': match.group(2)
@@ -146,8 +206,7 @@ def _extract_links(content: str) -> List[tuple]:
     links = []
     
     # 이미지가 아닌 링크만
-    pattern = r'(?<!!)\[([^\]]+)\]\(([^)]+)\)'
-    for match in re.finditer(pattern, content):
+    for match in _RE_LINK.finditer(content):
         links.append((match.group(1), match.group(2)))
     
     return links
@@ -156,9 +215,8 @@ def _extract_links(content: str) -> List[tuple]:
 def _extract_images(content: str) -> List[tuple]:
     """이미지 추출 ![alt](url)"""
     images = []
-    
-    pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-    for match in re.finditer(pattern, content):
+
+    for match in _RE_IMAGE.finditer(content):
         images.append((match.group(1), match.group(2)))
     
     return images
@@ -168,31 +226,16 @@ def extract_text(doc: TextDocument) -> str:
     """순수 텍스트 추출 (마크다운 문법 제거)"""
     text = doc.content
     
-    # 코드 블록 제거
-    text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
-    
-    # 인라인 코드 제거
-    text = re.sub(r'`[^`]+`', '', text)
-    
-    # 이미지 제거
-    text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', text)
-    
-    # 링크를 텍스트만 남기기
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-    
-    # 헤딩 마커 제거
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-    
-    # 강조 제거
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)
-    text = re.sub(r'__([^_]+)__', r'\1', text)
-    text = re.sub(r'_([^_]+)_', r'\1', text)
-    
-    # 수평선 제거
-    text = re.sub(r'^[-*_]{3,}$', '', text, flags=re.MULTILINE)
-    
+    # 마크다운 문법 제거 - 단일 패스 융합 패턴. 치환으로 새 문법이
+    # 드러날 수 있어(굵게+기울임 중첩 등) 변화가 없을 때까지 반복
+    # (정상 문서는 2회 안에 수렴)
+    while True:
+        stripped = _MD_STRIP.sub(_md_strip_repl, text)
+        if stripped == text:
+            break
+        text = stripped
+
     # 연속 빈 줄 정리
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _RE_BLANK_LINES.sub('\n\n', text)
     
     return text.strip()
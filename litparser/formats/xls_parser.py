@@ -17,7 +17,9 @@ BIFF8 (Binary Interchange File Format) 레코드:
 """
 
 import struct
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Union, Tuple, Any
 from pathlib import Path
 
@@ -39,8 +41,38 @@ BIFF_BOOLERR = 0x0205     # 불리언/에러
 BIFF_FORMULA = 0x0006     # 수식
 BIFF_CONTINUE = 0x003C    # 연속 레코드
 
+# 핫 루프용 Struct 캐시 - 포맷 문자열 재해석 없이 unpack_from으로
+# 버퍼 제자리에서 바로 언팩 (레코드당 슬라이스/임시 bytes 생성 제거)
+_ST_HEADER = struct.Struct('<HH')     # rec_type, rec_len
+_ST_LABELSST = struct.Struct('<HHHI')  # row, col, xf, sst_idx
+_ST_NUMBER = struct.Struct('<HHHd')    # row, col, xf, value
+_ST_RK = struct.Struct('<HHHI')        # row, col, xf, rk
+_ST_LABEL = struct.Struct('<HHHH')     # row, col, xf, str_len
+_ST_MULRK_GROUP = struct.Struct('<HI')  # xf, rk (MULRK 6바이트 그룹)
+_ST_H = struct.Struct('<H')
+_ST_I = struct.Struct('<I')
+_ST_D = struct.Struct('<d')
 
-@dataclass
+# Python 3.10+에서는 slots로 인스턴스 dict를 없앰 (셀 수백만 개 기준
+# 객체당 메모리 ~3배 절감) - 3.8/3.9에서는 일반 dataclass로 동작
+_record = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+def _biff_records(wb: memoryview, pos: int, end: int):
+    """BIFF 레코드 워크 - (타입, 본문 오프셋, 길이)를 순서대로 내보냄
+
+    본문 슬라이스를 만들지 않으므로 무시되는 레코드(대부분)는 헤더
+    언팩 비용만 치름. 잘린 레코드에서 중단하는 것은 기존 루프와 동일
+    """
+    while pos + 4 <= end:
+        rec_type, rec_len = _ST_HEADER.unpack_from(wb, pos)
+        if pos + 4 + rec_len > end:
+            return
+        yield rec_type, pos + 4, rec_len
+        pos += 4 + rec_len
+
+
+@_record
 class XlsCell:
     """셀"""
     row: int
@@ -52,41 +84,50 @@ class XlsCell:
         return f"{_col_to_letter(self.col)}{self.row + 1}"
 
 
-@dataclass
+@_record
 class XlsSheet:
     """시트"""
     name: str
     index: int
     cells: dict = field(default_factory=dict)  # (row, col) -> XlsCell
-    
+
+    # 최대 행/열 캐시 (-1 = 미계산) - 접근 때마다 전체 셀을 훑지 않음
+    _max_row: int = field(default=-1, repr=False)
+    _max_col: int = field(default=-1, repr=False)
+
     @property
     def rows(self) -> int:
         if not self.cells:
             return 0
-        return max(c.row for c in self.cells.values()) + 1
-    
+        if self._max_row < 0:
+            self._max_row = max(r for r, _c in self.cells)
+        return self._max_row + 1
+
     @property
     def cols(self) -> int:
         if not self.cells:
             return 0
-        return max(c.col for c in self.cells.values()) + 1
+        if self._max_col < 0:
+            self._max_col = max(c for _r, c in self.cells)
+        return self._max_col + 1
     
     def get_value(self, row: int, col: int) -> Any:
         cell = self.cells.get((row, col))
         return cell.value if cell else ""
     
     def to_list(self) -> List[List[Any]]:
-        """2D 리스트로 변환"""
+        """2D 리스트로 변환
+
+        좌표 전수 조회 대신 빈 격자를 만들어 놓고 실제 셀만 채움 -
+        희소 시트에서 O(rows×cols) dict 미스가 O(셀 수)로 줄어듦
+        """
         if not self.cells:
             return []
-        
-        result = []
-        for r in range(self.rows):
-            row_data = []
-            for c in range(self.cols):
-                row_data.append(self.get_value(r, c))
-            result.append(row_data)
-        
+
+        result = [[""] * self.cols for _ in range(self.rows)]
+        for (r, c), cell in self.cells.items():
+            result[r][c] = cell.value
+
         return result
     
     def to_markdown(self) -> str:
@@ -94,27 +135,19 @@ class XlsSheet:
         data = self.to_list()
         if not data:
             return ""
-        
-        lines = []
+
         header = data[0]
-        lines.append("| " + " | ".join(str(c) for c in header) + " |")
-        lines.append("| " + " | ".join("---" for _ in header) + " |")
-        
-        for row in data[1:]:
-            lines.append("| " + " | ".join(str(c) for c in row) + " |")
-        
+        sep = "| " + " | ".join(["---"] * len(header)) + " |"
+        lines = ["| " + " | ".join(map(str, header)) + " |", sep]
+        lines += ["| " + " | ".join(map(str, row)) + " |" for row in data[1:]]
         return "\n".join(lines)
-    
+
     def get_text(self) -> str:
         """탭 구분 텍스트"""
-        data = self.to_list()
-        lines = []
-        for row in data:
-            lines.append("\t".join(str(c) for c in row))
-        return "\n".join(lines)
+        return "\n".join("\t".join(map(str, row)) for row in self.to_list())
 
 
-@dataclass
+@_record
 class XlsDocument:
     """XLS 문서"""
     sheets: List[XlsSheet] = field(default_factory=list)
@@ -177,239 +210,243 @@ def parse_xls(filepath_or_bytes: Union[str, bytes]) -> XlsDocument:
     if not workbook:
         raise ValueError("Workbook 스트림을 찾을 수 없습니다")
     
-    # BIFF 레코드 파싱
+    # BIFF 레코드 파싱 - 스트림 전체를 memoryview로 다루고, 레코드 워크는
+    # 제너레이터가 (타입, 오프셋, 길이)만 내보냄. 대부분의 레코드 타입은
+    # 무시되므로 슬라이스는 실제로 다루는 분기에서만 만듦
+    wb = memoryview(workbook)
+
     sst = []  # Shared String Table
     sheet_info = []  # (name, offset)
-    
-    pos = 0
-    size = len(workbook)
-    
-    while pos + 4 <= size:
-        rec_type = struct.unpack('<H', workbook[pos:pos+2])[0]
-        rec_len = struct.unpack('<H', workbook[pos+2:pos+4])[0]
-        pos += 4
-        
-        if pos + rec_len > size:
-            break
-        
-        rec_data = workbook[pos:pos+rec_len]
-        
+
+    for rec_type, off, rec_len in _biff_records(wb, 0, len(wb)):
         # 시트 정보
         if rec_type == BIFF_BOUNDSHEET:
-            offset = struct.unpack('<I', rec_data[0:4])[0]
-            flags = rec_data[4]
-            name_len = rec_data[6]
-            
-            # 이름 인코딩
-            if rec_data[7] == 0:
-                name = rec_data[8:8+name_len].decode('latin-1', errors='ignore')
+            offset = _ST_I.unpack_from(wb, off)[0]
+            flags = wb[off + 4]
+            name_len = wb[off + 6]
+
+            # 이름 인코딩 (레코드 경계로 클램프)
+            end = off + rec_len
+            if wb[off + 7] == 0:
+                name = bytes(wb[off+8:min(off+8+name_len, end)]).decode('latin-1', errors='ignore')
             else:
-                name = rec_data[8:8+name_len*2].decode('utf-16le', errors='ignore')
-            
+                name = bytes(wb[off+8:min(off+8+name_len*2, end)]).decode('utf-16le', errors='ignore')
+
             sheet_info.append((name, offset))
-        
+
         # 공유 문자열 테이블
         elif rec_type == BIFF_SST:
-            sst = _parse_sst(rec_data, workbook, pos + rec_len)
-        
-        pos += rec_len
-    
+            sst = _parse_sst(wb[off:off+rec_len], wb, off + rec_len)
+
     # 각 시트 파싱
     for idx, (name, offset) in enumerate(sheet_info):
         sheet = XlsSheet(name=name, index=idx)
-        _parse_sheet(workbook, offset, sst, sheet)
+        _parse_sheet(wb, offset, sst, sheet)
         doc.sheets.append(sheet)
-    
+
     return doc
 
 
-def _parse_sst(data: bytes, workbook: bytes, continue_pos: int) -> List[str]:
+def _parse_sst(data: memoryview, workbook: memoryview, continue_pos: int) -> List[str]:
     """Shared String Table 파싱"""
     strings = []
     
     if len(data) < 8:
         return strings
     
-    total_strings = struct.unpack('<I', data[0:4])[0]
-    unique_strings = struct.unpack('<I', data[4:8])[0]
-    
+    total_strings = _ST_I.unpack_from(data, 0)[0]
+    unique_strings = _ST_I.unpack_from(data, 4)[0]
+
     pos = 8
-    full_data = data
-    
+    # bytes에 += 하면 CONTINUE마다 전체를 재복사(O(N²)) - bytearray로
+    # 제자리 extend하여 선형으로 쌓음
+    full_data = bytearray(data)
+
     # CONTINUE 레코드 처리
     curr_pos = continue_pos
     while curr_pos + 4 <= len(workbook):
-        rec_type = struct.unpack('<H', workbook[curr_pos:curr_pos+2])[0]
-        rec_len = struct.unpack('<H', workbook[curr_pos+2:curr_pos+4])[0]
-        
+        rec_type, rec_len = _ST_HEADER.unpack_from(workbook, curr_pos)
+
         if rec_type != BIFF_CONTINUE:
             break
-        
-        full_data += workbook[curr_pos+4:curr_pos+4+rec_len]
+
+        full_data.extend(workbook[curr_pos+4:curr_pos+4+rec_len])
         curr_pos += 4 + rec_len
     
-    # 문자열 파싱
-    while len(strings) < unique_strings and pos < len(full_data):
+    # 1차 패스: 디코딩 없이 각 문자열의 본문 위치만 수집
+    entries = []
+    while len(entries) < unique_strings and pos < len(full_data):
         try:
-            s, pos = _read_unicode_string(full_data, pos)
-            strings.append(s)
-        except (struct.error, IndexError, UnicodeDecodeError):
+            entry, pos = _scan_unicode_string(full_data, pos)
+            entries.append(entry)
+        except (struct.error, IndexError):
             break
-    
+
+    # 2차 패스: utf-16 구간을 전부 이어 붙여 한 번에 디코딩하고
+    # 문자 오프셋으로 잘라 씀 - 짧은 문자열 수백만 개에 대해
+    # 코덱 호출 기동 비용을 한 번으로 줄임
+    uni_parts = []
+    uni_lens = []
+    for is_uni, start, byte_len in entries:
+        if is_uni:
+            seg = full_data[start:start+byte_len]
+            uni_parts.append(seg)
+            uni_lens.append(len(seg) // 2)
+            strings.append(None)
+        else:
+            strings.append(full_data[start:start+byte_len].decode('latin-1', errors='ignore'))
+
+    if uni_parts:
+        text = b''.join(uni_parts).decode('utf-16le', errors='ignore')
+        if len(text) == sum(uni_lens):
+            off = 0
+            idx = 0
+            for i, s in enumerate(strings):
+                if s is None:
+                    n = uni_lens[idx]
+                    idx += 1
+                    strings[i] = text[off:off+n]
+                    off += n
+        else:
+            # 잘못된 시퀀스/서로게이트 쌍으로 문자 수가 어긋나면
+            # 오프셋을 믿을 수 없으므로 문자열별 개별 디코딩으로 폴백
+            idx = 0
+            for i, s in enumerate(strings):
+                if s is None:
+                    strings[i] = uni_parts[idx].decode('utf-16le', errors='ignore')
+                    idx += 1
+
     return strings
 
 
-def _read_unicode_string(data: bytes, pos: int) -> Tuple[str, int]:
-    """유니코드 문자열 읽기"""
+def _scan_unicode_string(data, pos: int) -> Tuple[Tuple[bool, int, int], int]:
+    """유니코드 문자열 헤더 스캔 - (is_unicode, 본문 시작, 길이)와 다음 위치
+
+    디코딩은 _parse_sst가 일괄 수행
+    """
     if pos + 3 > len(data):
-        return "", pos + 1
-    
-    str_len = struct.unpack('<H', data[pos:pos+2])[0]
+        return (False, pos, 0), pos + 1
+
+    str_len = _ST_H.unpack_from(data, pos)[0]
     flags = data[pos + 2]
     pos += 3
-    
+
     is_unicode = flags & 0x01
     has_ext = flags & 0x04
     has_rich = flags & 0x08
-    
+
     # 확장 정보 스킵
     if has_rich:
-        rich_count = struct.unpack('<H', data[pos:pos+2])[0]
+        rich_count = _ST_H.unpack_from(data, pos)[0]
         pos += 2
-    
+
     if has_ext:
-        ext_size = struct.unpack('<I', data[pos:pos+4])[0]
+        ext_size = _ST_I.unpack_from(data, pos)[0]
         pos += 4
-    
-    # 문자열 읽기
-    if is_unicode:
-        byte_len = str_len * 2
-        text = data[pos:pos+byte_len].decode('utf-16le', errors='ignore')
-        pos += byte_len
-    else:
-        text = data[pos:pos+str_len].decode('latin-1', errors='ignore')
-        pos += str_len
-    
+
+    byte_len = str_len * 2 if is_unicode else str_len
+    start = pos
+    pos += byte_len
+
     # 확장 데이터 스킵
     if has_rich:
         pos += rich_count * 4
     if has_ext:
         pos += ext_size
-    
-    return text, pos
+
+    return (bool(is_unicode), start, byte_len), pos
 
 
-def _parse_sheet(workbook: bytes, offset: int, sst: List[str], sheet: XlsSheet):
+def _parse_sheet(workbook: memoryview, offset: int, sst: List[str], sheet: XlsSheet):
     """시트 데이터 파싱"""
-    pos = offset
-    size = len(workbook)
-    
-    while pos + 4 <= size:
-        rec_type = struct.unpack('<H', workbook[pos:pos+2])[0]
-        rec_len = struct.unpack('<H', workbook[pos+2:pos+4])[0]
-        pos += 4
-        
-        if pos + rec_len > size:
-            break
-        
-        rec_data = workbook[pos:pos+rec_len]
-        
+    for rec_type, off, rec_len in _biff_records(workbook, offset, len(workbook)):
         if rec_type == BIFF_EOF:
             break
-        
+
         # 문자열 셀 (SST 참조)
         elif rec_type == BIFF_LABELSST:
-            if len(rec_data) >= 10:
-                row = struct.unpack('<H', rec_data[0:2])[0]
-                col = struct.unpack('<H', rec_data[2:4])[0]
-                sst_idx = struct.unpack('<I', rec_data[6:10])[0]
-                
+            if rec_len >= 10:
+                row, col, _xf, sst_idx = _ST_LABELSST.unpack_from(workbook, off)
+
                 if sst_idx < len(sst):
                     cell = XlsCell(row=row, col=col, value=sst[sst_idx])
                     sheet.cells[(row, col)] = cell
-        
+
         # 숫자 셀
         elif rec_type == BIFF_NUMBER:
-            if len(rec_data) >= 14:
-                row = struct.unpack('<H', rec_data[0:2])[0]
-                col = struct.unpack('<H', rec_data[2:4])[0]
-                value = struct.unpack('<d', rec_data[6:14])[0]
-                
+            if rec_len >= 14:
+                row, col, _xf, value = _ST_NUMBER.unpack_from(workbook, off)
+
                 cell = XlsCell(row=row, col=col, value=value)
                 sheet.cells[(row, col)] = cell
-        
+
         # RK 셀 (압축 숫자)
         elif rec_type == BIFF_RK:
-            if len(rec_data) >= 10:
-                row = struct.unpack('<H', rec_data[0:2])[0]
-                col = struct.unpack('<H', rec_data[2:4])[0]
-                rk = struct.unpack('<I', rec_data[6:10])[0]
+            if rec_len >= 10:
+                row, col, _xf, rk = _ST_RK.unpack_from(workbook, off)
                 value = _decode_rk(rk)
-                
+
                 cell = XlsCell(row=row, col=col, value=value)
                 sheet.cells[(row, col)] = cell
-        
+
         # 다중 RK
         elif rec_type == BIFF_MULRK:
-            if len(rec_data) >= 6:
-                row = struct.unpack('<H', rec_data[0:2])[0]
-                first_col = struct.unpack('<H', rec_data[2:4])[0]
-                
-                # 각 RK 값 (6 bytes씩: xf(2) + rk(4))
-                rk_pos = 4
+            if rec_len >= 6:
+                row, first_col = _ST_HEADER.unpack_from(workbook, off)
+
+                # 각 RK 값 (6 bytes씩: xf(2) + rk(4)) - 개별 unpack 대신
+                # 연속 구간 전체를 iter_unpack으로 일괄 디코딩
+                # (마지막 2바이트는 last_col 필드라 제외)
+                n_groups = (rec_len - 6) // 6
+                body = workbook[off+4:off+4 + n_groups * 6]
                 col = first_col
-                while rk_pos + 6 <= len(rec_data) - 2:
-                    rk = struct.unpack('<I', rec_data[rk_pos+2:rk_pos+6])[0]
+                for _xf, rk in _ST_MULRK_GROUP.iter_unpack(body):
                     value = _decode_rk(rk)
-                    
+
                     cell = XlsCell(row=row, col=col, value=value)
                     sheet.cells[(row, col)] = cell
-                    
+
                     col += 1
-                    rk_pos += 6
-        
+
         # 문자열 셀 (직접)
         elif rec_type == BIFF_LABEL:
-            if len(rec_data) >= 8:
-                row = struct.unpack('<H', rec_data[0:2])[0]
-                col = struct.unpack('<H', rec_data[2:4])[0]
-                str_len = struct.unpack('<H', rec_data[6:8])[0]
-                
-                if len(rec_data) >= 9:
-                    flags = rec_data[8]
+            if rec_len >= 8:
+                row, col, _xf, str_len = _ST_LABEL.unpack_from(workbook, off)
+
+                if rec_len >= 9:
+                    flags = workbook[off + 8]
+                    end = off + rec_len  # 문자열 길이를 레코드 경계로 클램프
                     if flags & 0x01:
-                        text = rec_data[9:9+str_len*2].decode('utf-16le', errors='ignore')
+                        text = bytes(workbook[off+9:min(off+9+str_len*2, end)]).decode('utf-16le', errors='ignore')
                     else:
-                        text = rec_data[9:9+str_len].decode('latin-1', errors='ignore')
-                    
+                        text = bytes(workbook[off+9:min(off+9+str_len, end)]).decode('latin-1', errors='ignore')
+
                     cell = XlsCell(row=row, col=col, value=text)
                     sheet.cells[(row, col)] = cell
-        
-        pos += rec_len
 
 
 def _decode_rk(rk: int) -> float:
     """RK 값 디코딩"""
-    is_int = rk & 0x02
-    div_100 = rk & 0x01
-    
-    if is_int:
-        value = (rk >> 2)
-        if rk & 0x80000000:  # 음수
-            value = value - 0x40000000
+    if rk & 0x02:
+        # 30비트 정수 (부호 확장 포함)
+        value = (rk >> 2) - (0x40000000 if rk & 0x80000000 else 0)
     else:
-        # IEEE 754
-        rk_bytes = struct.pack('<I', rk & 0xFFFFFFFC) + b'\x00\x00\x00\x00'
-        value = struct.unpack('<d', rk_bytes)[0]
-    
-    if div_100:
+        # IEEE 754 - RK의 30비트는 double의 상위 4바이트
+        # (pack+연결+unpack 3회 할당 대신 to_bytes 한 번으로 재해석)
+        value = _ST_D.unpack(((rk & 0xFFFFFFFC) << 32).to_bytes(8, 'little'))[0]
+
+    if rk & 0x01:
         value /= 100
-    
+
     return value
 
 
+@lru_cache(maxsize=2048)
 def _col_to_letter(col: int) -> str:
-    """열 번호를 문자로 (0 -> A)"""
+    """열 번호를 문자로 (0 -> A)
+
+    같은 열이 행마다 반복 조회되므로 캐시 적중이 대부분
+    """
     result = ""
     col += 1
     while col > 0:
@@ -18,13 +18,29 @@ ZIP + XML 기반 OOXML 파싱
         └── core.xml            # 메타데이터
 """
 
+import os
+import re
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any, Union
+from functools import lru_cache
+from typing import List, Dict, Optional, Sequence, Tuple, Any, Union
 from pathlib import Path
 from io import BytesIO
 
+# lxml이 있으면 C 구현 파서 사용, 없으면 stdlib ElementTree 그대로
+# (순수 Python 패키지 - lxml은 어디까지나 선택 사항)
+try:
+    from lxml import etree as _lxml_etree
+    _fromstring = _lxml_etree.fromstring
+except ImportError:
+    _lxml_etree = None
+    _fromstring = ET.fromstring
+
+_iterparse = _lxml_etree.iterparse if _lxml_etree is not None else ET.iterparse
+
 
 # 네임스페이스
 NS = {
@@ -35,8 +51,27 @@ NS = {
     'dcterms': 'http://purl.org/dc/terms/',
 }
 
+# 셀 단위 핫 루프에서 쓰는 Clark 표기 태그 상수 - 'main:c' 접두사 문자열을
+# 매번 네임스페이스 dict로 풀지 않고 확장형을 바로 넘김
+# (intern해 두면 파서가 캐시한 동일 문자열과의 == 비교가 포인터 비교로 끝남)
+_MAIN = '{%s}' % NS['main']
+_TAG_ROW = sys.intern(_MAIN + 'row')
+_TAG_C = sys.intern(_MAIN + 'c')
+_TAG_V = sys.intern(_MAIN + 'v')
+_TAG_F = sys.intern(_MAIN + 'f')
+_TAG_IS = sys.intern(_MAIN + 'is')
+_TAG_T = sys.intern(_MAIN + 't')
+_TAG_SI = sys.intern(_MAIN + 'si')
+_TAG_R = sys.intern(_MAIN + 'r')
+_TAG_SHEETS = sys.intern(_MAIN + 'sheets')
+_TAG_SHEET = sys.intern(_MAIN + 'sheet')
+
+# Python 3.10+에서는 slots로 인스턴스 dict를 없앰 (셀 수백만 개 기준
+# 객체당 메모리 ~3배 절감) - 3.8/3.9에서는 일반 dataclass로 동작
+_record = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
 
-@dataclass
+
+@_record
 class Cell:
     """셀 데이터"""
     row: int
@@ -51,24 +86,32 @@ class Cell:
         return f"{_col_to_letter(self.col)}{self.row}"
 
 
-@dataclass
+@_record
 class Sheet:
     """워크시트"""
     name: str
     index: int
     cells: Dict[Tuple[int, int], Cell] = field(default_factory=dict)
-    
+
+    # 최대 행/열 캐시 (-1 = 미계산) - 접근 때마다 전체 셀을 훑지 않음
+    _max_row: int = field(default=-1, repr=False)
+    _max_col: int = field(default=-1, repr=False)
+
     @property
     def rows(self) -> int:
         if not self.cells:
             return 0
-        return max(c.row for c in self.cells.values())
-    
+        if self._max_row < 0:
+            self._max_row = max(r for r, _c in self.cells)
+        return self._max_row
+
     @property
     def cols(self) -> int:
         if not self.cells:
             return 0
-        return max(c.col for c in self.cells.values())
+        if self._max_col < 0:
+            self._max_col = max(c for _r, c in self.cells)
+        return self._max_col
     
     def get_cell(self, row: int, col: int) -> Optional[Cell]:
         return self.cells.get((row, col))
@@ -78,21 +121,23 @@ class Sheet:
         return cell.value if cell else None
     
     def to_list(self) -> List[List[Any]]:
-        """2D 리스트로 변환"""
+        """2D 리스트로 변환
+
+        좌표 전수 조회 대신 빈 격자를 만들어 놓고 실제 셀만 채움 -
+        희소 시트에서 O(rows×cols) dict 미스가 O(셀 수)로 줄어듦
+        """
         if not self.cells:
             return []
-        
+
         max_row = self.rows
         max_col = self.cols
-        
-        result = []
-        for r in range(1, max_row + 1):
-            row_data = []
-            for c in range(1, max_col + 1):
-                cell = self.get_cell(r, c)
-                row_data.append(cell.value if cell else "")
-            result.append(row_data)
-        
+
+        result = [[""] * max_col for _ in range(max_row)]
+        for (r, c), cell in self.cells.items():
+            # 참조가 깨진 셀(행/열 0)은 기존 1-기반 순회에서도 제외됐음
+            if r > 0 and c > 0:
+                result[r - 1][c - 1] = cell.value
+
         return result
     
     def to_markdown(self) -> str:
@@ -100,30 +145,19 @@ class Sheet:
         data = self.to_list()
         if not data:
             return ""
-        
-        lines = []
-        
-        # 헤더
+
         header = data[0]
-        lines.append("| " + " | ".join(str(c) for c in header) + " |")
-        lines.append("| " + " | ".join("---" for _ in header) + " |")
-        
-        # 데이터
-        for row in data[1:]:
-            lines.append("| " + " | ".join(str(c) for c in row) + " |")
-        
+        sep = "| " + " | ".join(["---"] * len(header)) + " |"
+        lines = ["| " + " | ".join(map(str, header)) + " |", sep]
+        lines += ["| " + " | ".join(map(str, row)) + " |" for row in data[1:]]
         return "\n".join(lines)
-    
+
     def get_text(self) -> str:
         """텍스트로 변환 (탭 구분)"""
-        data = self.to_list()
-        lines = []
-        for row in data:
-            lines.append("\t".join(str(c) for c in row))
-        return "\n".join(lines)
+        return "\n".join("\t".join(map(str, row)) for row in self.to_list())
 
 
-@dataclass
+@_record
 class XlsxDocument:
     """XLSX 문서"""
     sheets: List[Sheet] = field(default_factory=list)
@@ -183,21 +217,33 @@ def parse_xlsx(filepath_or_bytes: Union[str, bytes]) -> XlsxDocument:
     if 'docProps/core.xml' in zf.namelist():
         doc.title, doc.author, doc.created = _parse_core_xml(zf)
     
-    # 공유 문자열
-    shared_strings = []
+    # 공유 문자열 - tuple이 list보다 인덱싱이 빠르고 덜 먹음
+    shared_strings = ()
     if 'xl/sharedStrings.xml' in zf.namelist():
-        shared_strings = _parse_shared_strings(zf)
+        shared_strings = tuple(_parse_shared_strings(zf))
     
     # 워크북 - 시트 이름
     sheet_names = _parse_workbook(zf)
-    
-    # 각 시트 파싱
-    for idx, name in enumerate(sheet_names):
-        sheet_path = f'xl/worksheets/sheet{idx + 1}.xml'
-        if sheet_path in zf.namelist():
-            sheet = _parse_sheet(zf, sheet_path, name, idx, shared_strings)
-            doc.sheets.append(sheet)
-    
+
+    # 각 시트 파싱 - 시트별 inflate + XML 파싱은 서로 독립이고
+    # zlib/expat이 GIL을 풀어주므로 스레드 풀로 겹쳐서 처리
+    # (순서는 map이 보존)
+    names = set(zf.namelist())
+    jobs = [(f'xl/worksheets/sheet{idx + 1}.xml', name, idx)
+            for idx, name in enumerate(sheet_names)
+            if f'xl/worksheets/sheet{idx + 1}.xml' in names]
+
+    def _load_sheet(job):
+        path, name, idx = job
+        return _parse_sheet(zf, path, name, idx, shared_strings)
+
+    if len(jobs) > 1:
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            doc.sheets = list(pool.map(_load_sheet, jobs))
+    else:
+        doc.sheets = [_load_sheet(job) for job in jobs]
+
     zf.close()
     return doc
 
@@ -207,8 +253,8 @@ def _parse_core_xml(zf: zipfile.ZipFile) -> Tuple[str, str, str]:
     title, author, created = "", "", ""
     
     try:
-        content = zf.read('docProps/core.xml').decode('utf-8')
-        root = ET.fromstring(content)
+        # bytes를 바로 넘김 - 인코딩 선언은 파서가 처리 (별도 decode 패스 불필요)
+        root = _fromstring(zf.read('docProps/core.xml'))
         
         # 제목
         el = root.find('dc:title', NS)
@@ -231,31 +277,39 @@ def _parse_core_xml(zf: zipfile.ZipFile) -> Tuple[str, str, str]:
 
 
 def _parse_shared_strings(zf: zipfile.ZipFile) -> List[str]:
-    """공유 문자열 파싱"""
+    """공유 문자열 파싱
+
+    iterparse로 si 단위 스트리밍 - SST 전체 DOM을 만들지 않음.
+    헤더/상태값처럼 짧은 문자열은 시트 전반에 반복되므로 intern해서
+    사본 힙을 아끼고 이후 == 비교를 포인터 비교로 만듦
+    """
     strings = []
-    
+
     try:
-        content = zf.read('xl/sharedStrings.xml').decode('utf-8')
-        root = ET.fromstring(content)
-        
-        for si in root.findall('main:si', NS):
-            text_parts = []
-            
-            # 단순 텍스트
-            t = si.find('main:t', NS)
-            if t is not None and t.text:
-                text_parts.append(t.text)
-            
-            # 리치 텍스트
-            for r in si.findall('main:r', NS):
-                t = r.find('main:t', NS)
+        with zf.open('xl/sharedStrings.xml') as f:
+            for _event, si in _iterparse(f):
+                if si.tag != _TAG_SI:
+                    continue
+                text_parts = []
+
+                # 단순 텍스트
+                t = si.find(_TAG_T)
                 if t is not None and t.text:
                     text_parts.append(t.text)
-            
-            strings.append("".join(text_parts))
+
+                # 리치 텍스트
+                for r in si.findall(_TAG_R):
+                    t = r.find(_TAG_T)
+                    if t is not None and t.text:
+                        text_parts.append(t.text)
+
+                text = "".join(text_parts)
+                strings.append(sys.intern(text) if len(text) < 64 else text)
+                si.clear()
     except Exception:
-        pass
-    
+        # 손상된 SST는 기존처럼 통째로 무시 (부분 결과 반환 안 함)
+        return []
+
     return strings
 
 
@@ -264,12 +318,11 @@ def _parse_workbook(zf: zipfile.ZipFile) -> List[str]:
     names = []
     
     try:
-        content = zf.read('xl/workbook.xml').decode('utf-8')
-        root = ET.fromstring(content)
+        root = _fromstring(zf.read('xl/workbook.xml'))
         
-        sheets = root.find('main:sheets', NS)
+        sheets = root.find(_TAG_SHEETS)
         if sheets is not None:
-            for sheet in sheets.findall('main:sheet', NS):
+            for sheet in sheets.findall(_TAG_SHEET):
                 name = sheet.get('name', f'Sheet{len(names) + 1}')
                 names.append(name)
     except Exception:
@@ -289,35 +342,38 @@ def _parse_workbook(zf: zipfile.ZipFile) -> List[str]:
     return names
 
 
-def _parse_sheet(zf: zipfile.ZipFile, path: str, name: str, 
-                 index: int, shared_strings: List[str]) -> Sheet:
-    """워크시트 파싱"""
+def _parse_sheet(zf: zipfile.ZipFile, path: str, name: str,
+                 index: int, shared_strings: Sequence[str]) -> Sheet:
+    """워크시트 파싱
+
+    iterparse 스트리밍 - 전체 DOM을 만들지 않고 row가 닫힐 때마다
+    셀을 뽑고 clear하므로 시트 크기와 무관하게 메모리가 일정함
+    """
     sheet = Sheet(name=name, index=index)
-    
+
+    # 파싱 도중 오류가 나면 기존처럼 빈 시트를 돌려주도록 스크래치에 모음
+    cells: Dict[Tuple[int, int], Cell] = {}
     try:
-        content = zf.read(path).decode('utf-8')
-        root = ET.fromstring(content)
-        
-        # sheetData
-        sheet_data = root.find('main:sheetData', NS)
-        if sheet_data is None:
-            return sheet
-        
-        for row_el in sheet_data.findall('main:row', NS):
-            row_num = int(row_el.get('r', 0))
-            
-            for cell_el in row_el.findall('main:c', NS):
-                cell = _parse_cell(cell_el, row_num, shared_strings)
-                if cell:
-                    sheet.cells[(cell.row, cell.col)] = cell
+        with zf.open(path) as f:
+            for _event, el in _iterparse(f):
+                if el.tag != _TAG_ROW:
+                    continue
+                row_num = int(el.get('r', 0))
+
+                for cell_el in el.findall(_TAG_C):
+                    cell = _parse_cell(cell_el, row_num, shared_strings)
+                    if cell:
+                        cells[(cell.row, cell.col)] = cell
+                el.clear()
     except Exception:
-        pass
-    
+        return sheet
+
+    sheet.cells = cells
     return sheet
 
 
 def _parse_cell(cell_el: ET.Element, row_num: int, 
-                shared_strings: List[str]) -> Optional[Cell]:
+                shared_strings: Sequence[str]) -> Optional[Cell]:
     """셀 파싱"""
     ref = cell_el.get('r', '')
     if not ref:
@@ -334,23 +390,21 @@ def _parse_cell(cell_el: ET.Element, row_num: int,
     formula = ""
     
     # 수식
-    f_el = cell_el.find('main:f', NS)
+    f_el = cell_el.find(_TAG_F)
     if f_el is not None and f_el.text:
         formula = f_el.text
-    
+
     # 값
-    v_el = cell_el.find('main:v', NS)
+    v_el = cell_el.find(_TAG_V)
     if v_el is not None and v_el.text:
         raw_value = v_el.text
         
         if cell_type == 's':
-            # 공유 문자열 참조
+            # 공유 문자열 참조 - 정상 파일에선 인덱스가 항상 유효하므로
+            # 매 셀 len() 상한 검사 대신 IndexError로 예외 처리
             try:
                 idx = int(raw_value)
-                if 0 <= idx < len(shared_strings):
-                    value = shared_strings[idx]
-                else:
-                    value = raw_value
+                value = shared_strings[idx] if idx >= 0 else raw_value
             except (ValueError, IndexError):
                 value = raw_value
         elif cell_type == 'b':
@@ -369,9 +423,9 @@ def _parse_cell(cell_el: ET.Element, row_num: int,
             value = raw_value
     
     # 인라인 문자열
-    is_el = cell_el.find('main:is', NS)
+    is_el = cell_el.find(_TAG_IS)
     if is_el is not None:
-        t_el = is_el.find('main:t', NS)
+        t_el = is_el.find(_TAG_T)
         if t_el is not None and t_el.text:
             value = t_el.text
     
@@ -387,33 +441,50 @@ def _parse_cell(cell_el: ET.Element, row_num: int,
     )
 
 
+# 일반적인 'A1' 꼴 참조는 문자 단위 루프 대신 컴파일된 패턴 한 번으로
+_REF_RE = re.compile(r'([A-Za-z]+)([0-9]+)')
+
+
 def _parse_cell_ref(ref: str) -> Tuple[int, int]:
     """A1 형식 셀 참조 파싱"""
+    m = _REF_RE.fullmatch(ref)
+    if m:
+        return int(m.group(2)), _letter_to_col(m.group(1).upper())
+
+    # 드문 형태($A$1, 열/행만 있는 참조 등)는 기존 문자 루프로
     col_str = ""
     row_str = ""
-    
+
     for c in ref:
         if c.isalpha():
             col_str += c.upper()
         elif c.isdigit():
             row_str += c
-    
+
     col = _letter_to_col(col_str) if col_str else 0
     row = int(row_str) if row_str else 0
-    
+
     return row, col
 
 
+@lru_cache(maxsize=16384)
 def _letter_to_col(letters: str) -> int:
-    """A -> 1, B -> 2, ..., Z -> 26, AA -> 27"""
+    """A -> 1, B -> 2, ..., Z -> 26, AA -> 27
+
+    열 문자는 행마다 반복되므로 캐시 적중이 대부분
+    """
     result = 0
     for c in letters:
         result = result * 26 + (ord(c) - ord('A') + 1)
     return result
 
 
+@lru_cache(maxsize=2048)
 def _col_to_letter(col: int) -> str:
-    """1 -> A, 2 -> B, ..., 27 -> AA"""
+    """1 -> A, 2 -> B, ..., 27 -> AA
+
+    같은 열이 행마다 반복 조회되므로 캐시 적중이 대부분
+    """
     result = ""
     while col > 0:
         col, remainder = divmod(col - 1, 26)